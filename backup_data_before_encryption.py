@@ -1,7 +1,11 @@
 #!/usr/bin/env python
 """
 Backup script for existing data before encryption migration.
-This script exports all sensitive data to a JSON file for verification.
+This script exports all sensitive data to a JSON Lines file for verification.
+
+Each line of the backup is one record tagged with its "kind"
+(user_profile, restaurant or pending_restaurant). Counts and the
+timestamp are written to a small sidecar .meta.json file.
 """
 
 import os
@@ -18,74 +22,136 @@ django.setup()
 from customer.models import UserProfile
 from restaurant.models import Restaurant, PendingRestaurant
 
-def create_backup():
-    """Create a comprehensive backup of existing data."""
-    print('=== CREATING PRE-MIGRATION DATA BACKUP ===')
-    
-    backup_data = {
-        'timestamp': datetime.now().isoformat(),
-        'user_profiles': [],
-        'restaurants': [],
-        'pending_restaurants': []
-    }
-    
-    # Export user profiles
-    print('Exporting user profiles...')
-    for profile in UserProfile.objects.all():
-        backup_data['user_profiles'].append({
+# Write buffer for the backup file; large enough that a multi-MB backup is
+# flushed in a handful of write calls instead of one per 8 KiB
+BACKUP_BUFFER_SIZE = 1 << 20
+
+
+def _encrypted_preview(value):
+    """Return the first 50 characters of an encrypted value for verification."""
+    return value[:50] + '...' if value else None
+
+
+def _user_profile_records():
+    """Yield backup records for every user profile."""
+    # Join the user in the same query and load only the columns exported below;
+    # full_name/phone_number/address are descriptors over the encrypted columns
+    profiles = UserProfile.objects.select_related('user').only(
+        'id',
+        '_full_name_encrypted',
+        '_phone_number_encrypted',
+        '_address_encrypted',
+        'user__username',
+    )
+    for profile in profiles.iterator(chunk_size=500):
+        yield {
             'id': profile.id,
             'username': profile.user.username,
             'full_name': profile.full_name,
             'phone_number': profile.phone_number,
             'address': profile.address,
             'encrypted_fields': {
-                'full_name_encrypted': profile._full_name_encrypted[:50] + '...' if profile._full_name_encrypted else None,
-                'phone_encrypted': profile._phone_number_encrypted[:50] + '...' if profile._phone_number_encrypted else None,
-                'address_encrypted': profile._address_encrypted[:50] + '...' if profile._address_encrypted else None,
+                'full_name_encrypted': _encrypted_preview(profile._full_name_encrypted),
+                'phone_encrypted': _encrypted_preview(profile._phone_number_encrypted),
+                'address_encrypted': _encrypted_preview(profile._address_encrypted),
             }
-        })
-    
-    # Export restaurants
-    print('Exporting restaurants...')
-    for restaurant in Restaurant.objects.all():
-        backup_data['restaurants'].append({
+        }
+
+
+def _restaurant_records():
+    """Yield backup records for every restaurant."""
+    # Only the exported columns; description, image and the rest are skipped
+    restaurants = Restaurant.objects.only(
+        'id', 'name', '_address_encrypted', '_phone_encrypted', '_email_encrypted',
+    )
+    for restaurant in restaurants.iterator(chunk_size=500):
+        yield {
             'id': restaurant.id,
             'name': restaurant.name,
             'address': restaurant.address,
             'phone': restaurant.phone,
             'email': restaurant.email,
             'encrypted_fields': {
-                'address_encrypted': restaurant._address_encrypted[:50] + '...' if restaurant._address_encrypted else None,
-                'phone_encrypted': restaurant._phone_encrypted[:50] + '...' if restaurant._phone_encrypted else None,
-                'email_encrypted': restaurant._email_encrypted[:50] + '...' if restaurant._email_encrypted else None,
+                'address_encrypted': _encrypted_preview(restaurant._address_encrypted),
+                'phone_encrypted': _encrypted_preview(restaurant._phone_encrypted),
+                'email_encrypted': _encrypted_preview(restaurant._email_encrypted),
             }
-        })
-    
-    # Export pending restaurants
-    print('Exporting pending restaurants...')
-    for pending in PendingRestaurant.objects.all():
-        backup_data['pending_restaurants'].append({
+        }
+
+
+def _pending_restaurant_records():
+    """Yield backup records for every pending restaurant application."""
+    pending_restaurants = PendingRestaurant.objects.only(
+        'id', 'restaurant_name', '_address_encrypted', '_phone_encrypted', '_email_encrypted',
+    )
+    for pending in pending_restaurants.iterator(chunk_size=500):
+        yield {
             'id': pending.id,
             'restaurant_name': pending.restaurant_name,
             'address': pending.address,
             'phone': pending.phone,
             'email': pending.email,
             'encrypted_fields': {
-                'address_encrypted': pending._address_encrypted[:50] + '...' if pending._address_encrypted else None,
-                'phone_encrypted': pending._phone_encrypted[:50] + '...' if pending._phone_encrypted else None,
-                'email_encrypted': pending._email_encrypted[:50] + '...' if pending._email_encrypted else None,
+                'address_encrypted': _encrypted_preview(pending._address_encrypted),
+                'phone_encrypted': _encrypted_preview(pending._phone_encrypted),
+                'email_encrypted': _encrypted_preview(pending._email_encrypted),
             }
-        })
+        }
+
+
+def _write_records(f, kind, records):
+    """
+    Write records to an open binary file as JSON Lines tagged with their kind.
+
+    Records are encoded one at a time so memory stays bounded by a single
+    record rather than the whole table.
+
+    Returns:
+        int: Number of records written
+    """
+    count = 0
+    for record in records:
+        line = json.dumps({'kind': kind, **record}, ensure_ascii=False)
+        f.write(line.encode('utf-8'))
+        f.write(b'\n')
+        count += 1
+    return count
+
+
+def create_backup():
+    """Create a comprehensive backup of existing data."""
+    print('=== CREATING PRE-MIGRATION DATA BACKUP ===')
+    
+    sections = [
+        ('user_profile', 'user profiles', _user_profile_records),
+        ('restaurant', 'restaurants', _restaurant_records),
+        ('pending_restaurant', 'pending restaurants', _pending_restaurant_records),
+    ]
+    counts = {}
     
-    # Save backup to file
-    backup_file = f'pre_encryption_backup_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
-    with open(backup_file, 'w', encoding='utf-8') as f:
-        json.dump(backup_data, f, indent=2, ensure_ascii=False)
+    # Stream each section straight into the backup file, one record per line
+    backup_name = f'pre_encryption_backup_{datetime.now().strftime("%Y%m%d_%H%M%S")}'
+    backup_file = f'{backup_name}.jsonl'
+    with open(backup_file, 'wb', buffering=BACKUP_BUFFER_SIZE) as f:
+        for kind, label, records in sections:
+            print(f'Exporting {label}...')
+            counts[kind] = _write_records(f, kind, records())
+    
+    # Sidecar with the totals so the backup can be checked without reading it
+    meta_file = f'{backup_name}.meta.json'
+    meta = {
+        'timestamp': datetime.now().isoformat(),
+        'backup_file': backup_file,
+        'counts': counts,
+    }
+    with open(meta_file, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(meta, indent=2))
     
     print(f'✅ Backup saved to: {backup_file}')
-    print(f'  User profiles: {len(backup_data["user_profiles"])}')
-    print(f'  Restaurants: {len(backup_data["restaurants"])}')
-    print(f'  Pending restaurants: {len(backup_data["pending_restaurants"])}')
+    print(f'  Metadata: {meta_file}')
+    print(f'  User profiles: {counts["user_profile"]}')
+    print(f'  Restaurants: {counts["restaurant"]}')
+    print(f'  Pending restaurants: {counts["pending_restaurant"]}')
     
     return backup_file
 
@@ -8,13 +8,46 @@ import re
 from docx import Document
 from docx.shared import Inches, Pt
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+
+# Line prefixes recognised by the converter, compiled once at import time
+_HEADER = re.compile(r'^(#{1,5}) (.*)')
+_NUM_LIST = re.compile(r'^[1-9]\. ')
+_BOLD = re.compile(r'\*\*(.*?)\*\*')
+_ITALIC = re.compile(r'\*(.*?)\*')
+
+
+def _plain_paragraph(text=None):
+    """Build a bare <w:p> element, with a single run when text is given"""
+    p = OxmlElement('w:p')
+    if text:
+        r = OxmlElement('w:r')
+        t = OxmlElement('w:t')
+        t.text = text
+        if text != text.strip():
+            t.set(qn('xml:space'), 'preserve')
+        r.append(t)
+        p.append(r)
+    return p
+
+
+def _flush_paragraphs(body, pending):
+    """Insert pending paragraph elements ahead of the section properties in one go"""
+    if not pending:
+        return
+    sect_pr = body.sectPr
+    index = body.index(sect_pr) if sect_pr is not None else len(body)
+    body[index:index] = pending
+    pending.clear()
+
 
 def markdown_to_docx(input_file, output_file):
     """Convert Markdown file to DOCX format"""
     
-    # Read the markdown file
-    with open(input_file, 'r', encoding='utf-8') as f:
-        content = f.read()
+    # Read the markdown file as bytes and split it in a single pass
+    with open(input_file, 'rb') as f:
+        lines = f.read().decode('utf-8').splitlines()
     
     # Create a new document
     doc = Document()
@@ -25,36 +58,34 @@ def markdown_to_docx(input_file, output_file):
     font.name = 'Calibri'
     font.size = Pt(11)
     
-    # Split content by lines
-    lines = content.split('\n')
+    # Plain paragraphs are built as raw OOXML and appended in batches; styled
+    # elements still go through the python-docx API after a flush
+    body = doc.element.body
+    pending = []
+    consecutive_blanks = 0
     
     for line in lines:
         line = line.rstrip()
         
         if not line:
-            # Add empty paragraph
-            doc.add_paragraph()
+            # Add a single empty paragraph for each run of blank lines
+            if not consecutive_blanks:
+                pending.append(_plain_paragraph())
+            consecutive_blanks += 1
             continue
+        
+        consecutive_blanks = 0
             
         # Handle headers
-        if line.startswith('# '):
-            p = doc.add_heading(line[2:], level=1)
-            p.alignment = WD_PARAGRAPH_ALIGNMENT.LEFT
-        elif line.startswith('## '):
-            p = doc.add_heading(line[3:], level=2)
-            p.alignment = WD_PARAGRAPH_ALIGNMENT.LEFT
-        elif line.startswith('### '):
-            p = doc.add_heading(line[4:], level=3)
-            p.alignment = WD_PARAGRAPH_ALIGNMENT.LEFT
-        elif line.startswith('#### '):
-            p = doc.add_heading(line[5:], level=4)
-            p.alignment = WD_PARAGRAPH_ALIGNMENT.LEFT
-        elif line.startswith('##### '):
-            p = doc.add_heading(line[6:], level=5)
+        header = _HEADER.match(line)
+        if header:
+            _flush_paragraphs(body, pending)
+            p = doc.add_heading(header.group(2), level=len(header.group(1)))
             p.alignment = WD_PARAGRAPH_ALIGNMENT.LEFT
         
         # Handle horizontal rules
         elif line.strip() == '---':
+            _flush_paragraphs(body, pending)
             p = doc.add_paragraph()
             p.add_run('_' * 50)
             p.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
@@ -66,35 +97,25 @@ def markdown_to_docx(input_file, output_file):
             
         # Handle list items
         elif line.startswith('- '):
+            _flush_paragraphs(body, pending)
             p = doc.add_paragraph(line[2:], style='List Bullet')
-        elif line.startswith('1. '):
-            p = doc.add_paragraph(line[3:], style='List Number')
-        elif line.startswith('2. '):
-            p = doc.add_paragraph(line[3:], style='List Number')
-        elif line.startswith('3. '):
-            p = doc.add_paragraph(line[3:], style='List Number')
-        elif line.startswith('4. '):
-            p = doc.add_paragraph(line[3:], style='List Number')
-        elif line.startswith('5. '):
-            p = doc.add_paragraph(line[3:], style='List Number')
-        elif line.startswith('6. '):
-            p = doc.add_paragraph(line[3:], style='List Number')
-        elif line.startswith('7. '):
-            p = doc.add_paragraph(line[3:], style='List Number')
-        elif line.startswith('8. '):
-            p = doc.add_paragraph(line[3:], style='List Number')
-        elif line.startswith('9. '):
+        elif _NUM_LIST.match(line):
+            _flush_paragraphs(body, pending)
             p = doc.add_paragraph(line[3:], style='List Number')
         
         # Handle regular paragraphs
         else:
-            # Handle bold text
-            line = re.sub(r'\*\*(.*?)\*\*', r'\1', line)
-            # Handle italic text
-            line = re.sub(r'\*(.*?)\*', r'\1', line)
+            # Only run the emphasis patterns when the line can contain them
+            if '*' in line:
+                # Handle bold text
+                line = _BOLD.sub(r'\1', line)
+                # Handle italic text
+                line = _ITALIC.sub(r'\1', line)
             
             if line.strip():
-                doc.add_paragraph(line)
+                pending.append(_plain_paragraph(line))
+    
+    _flush_paragraphs(body, pending)
     
     # Save the document
     doc.save(output_file)
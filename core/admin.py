@@ -5,13 +5,51 @@ This module provides custom admin filters and displays to make it easy
 for administrators to identify and manage restaurant owners.
 """
 
+from functools import lru_cache
+
+from django.apps import apps
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib.auth.models import User, Group
+from django.db.models import Count, Exists, OuterRef
 from django.utils.html import format_html
+from django.utils.safestring import mark_safe
 from django.urls import reverse
 
 
+# Badge colors for the user role column
+ROLE_BADGE_COLORS = {
+    'Superuser': '#dc3545',  # Red
+    'Staff': '#fd7e14',      # Orange
+    'Restaurant Owner': '#28a745',  # Green
+    'Pending Restaurant Owner': '#ffc107',  # Yellow
+    'Customer': '#6c757d',   # Gray
+    'Anonymous': '#6c757d',  # Gray
+}
+
+# Constant HTML fragments for admin list cells, built once at import time
+_ROLE_BADGE = (
+    '<span style="background-color: {}; color: white; padding: 3px 8px; '
+    'border-radius: 12px; font-size: 11px; font-weight: bold;">{}</span>'
+)
+_RESTAURANT_LINK = '<a href="{}" style="color: #28a745; font-weight: bold;">{} restaurant(s)</a>'
+_NO_RESTAURANTS = mark_safe('<span style="color: #6c757d;">0</span>')
+
+
+@lru_cache(maxsize=4)
+def _changelist_url(url_name):
+    """
+    Resolve an admin changelist URL once and reuse it for every list row.
+    
+    Args:
+        url_name (str): Admin URL name, e.g. 'admin:auth_user_changelist'
+        
+    Returns:
+        str: Resolved URL path
+    """
+    return reverse(url_name)
+
+
 class UserRoleFilter(admin.SimpleListFilter):
     """
     Custom filter to display users by their role.
@@ -53,19 +91,35 @@ class UserRoleFilter(admin.SimpleListFilter):
         """
         value = self.value()
         
+        # EXISTS subqueries avoid joining groups/restaurants into the user
+        # query, so no DISTINCT is needed to undo duplicated rows
+        in_owner_group = Exists(
+            User.groups.through.objects.filter(
+                user=OuterRef('pk'),
+                group__name='Restaurant Owner'
+            )
+        )
+        
         if value == 'restaurant_owner':
-            return queryset.filter(groups__name='Restaurant Owner')
+            return queryset.filter(in_owner_group)
         elif value == 'active_restaurant_owner':
+            # Lazy import to avoid AppRegistryNotReady error
+            Restaurant = apps.get_model('restaurant', 'Restaurant')
             return queryset.filter(
-                groups__name='Restaurant Owner',
-                restaurants__approval_status='approved',
-                restaurants__is_active=True
-            ).distinct()
+                in_owner_group,
+                Exists(
+                    Restaurant.objects.filter(
+                        owner=OuterRef('pk'),
+                        approval_status='approved',
+                        is_active=True
+                    )
+                )
+            )
         elif value == 'staff':
             return queryset.filter(is_staff=True)
         elif value == 'customer':
             return queryset.filter(
-                groups__name__in=['Restaurant Owner'],
+                in_owner_group,
                 is_staff=False,
                 is_superuser=False
             )
@@ -127,24 +181,9 @@ class UserAdmin(BaseUserAdmin):
         from .utils.user_roles import get_user_role
         
         role = get_user_role(obj)
+        color = ROLE_BADGE_COLORS.get(role, '#6c757d')
         
-        # Define badge colors for different roles
-        badge_colors = {
-            'Superuser': '#dc3545',  # Red
-            'Staff': '#fd7e14',      # Orange
-            'Restaurant Owner': '#28a745',  # Green
-            'Pending Restaurant Owner': '#ffc107',  # Yellow
-            'Customer': '#6c757d',   # Gray
-            'Anonymous': '#6c757d',  # Gray
-        }
-        
-        color = badge_colors.get(role, '#6c757d')
-        
-        return format_html(
-            '<span style="background-color: {}; color: white; padding: 3px 8px; '
-            'border-radius: 12px; font-size: 11px; font-weight: bold;">{}</span>',
-            color, role
-        )
+        return format_html(_ROLE_BADGE, color, role)
     
     user_role_display.short_description = 'Role'
     
@@ -158,22 +197,17 @@ class UserAdmin(BaseUserAdmin):
         Returns:
             str: HTML with restaurant count and links
         """
-        # Import user role function to avoid circular import issues
-        from .utils.user_roles import get_user_restaurants
-        
-        restaurants = get_user_restaurants(obj)
-        count = restaurants.count()
+        # Count from the restaurants prefetched in get_queryset() so no
+        # extra COUNT query is issued per row
+        count = len(obj.restaurants.all())
         
         if count > 0:
             # Create link to restaurants filtered by owner
-            restaurant_url = reverse('admin:restaurant_restaurant_changelist') + f'?owner__id__exact={obj.id}'
+            restaurant_url = _changelist_url('admin:restaurant_restaurant_changelist') + f'?owner__id__exact={obj.id}'
             
-            return format_html(
-                '<a href="{}" style="color: #28a745; font-weight: bold;">{} restaurant(s)</a>',
-                restaurant_url, count
-            )
+            return format_html(_RESTAURANT_LINK, restaurant_url, count)
         
-        return format_html('<span style="color: #6c757d;">0</span>')
+        return _NO_RESTAURANTS
     
     restaurant_count.short_description = 'Restaurants'
     
@@ -187,8 +221,13 @@ class UserAdmin(BaseUserAdmin):
         Returns:
             QuerySet: Optimized queryset with related data
         """
+        # Import user role function to avoid circular import issues
+        from .utils.user_roles import annotate_user_roles
+        
         queryset = super().get_queryset(request)
-        return queryset.select_related('profile').prefetch_related('groups', 'restaurants')
+        queryset = queryset.prefetch_related('groups', 'restaurants')
+        # Role annotations let user_role_display resolve roles without per-row queries
+        return annotate_user_roles(queryset)
 
 
 class GroupAdmin(admin.ModelAdmin):
@@ -210,10 +249,10 @@ class GroupAdmin(admin.ModelAdmin):
         Returns:
             str: Member count with link to filtered users
         """
-        count = obj.user_set.count()
+        count = obj._member_count
         
         if count > 0:
-            user_url = reverse('admin:auth_user_changelist') + f'?groups__id__exact={obj.id}'
+            user_url = _changelist_url('admin:auth_user_changelist') + f'?groups__id__exact={obj.id}'
             return format_html(
                 '<a href="{}" style="font-weight: bold;">{} member(s)</a>',
                 user_url, count
@@ -233,21 +272,38 @@ class GroupAdmin(admin.ModelAdmin):
         Returns:
             str: Summary of important permissions
         """
+        # Work on the prefetched permissions instead of querying per row
         permissions = obj.permissions.all()
         
         if obj.name == 'Restaurant Owner':
-            restaurant_perms = permissions.filter(
-                content_type__model='restaurant'
-            ).count()
+            restaurant_perms = sum(
+                1 for permission in permissions
+                if permission.content_type.model == 'restaurant'
+            )
             
             return format_html(
                 '<span style="color: #28a745;">{} restaurant permissions</span>',
                 restaurant_perms
             )
         
-        return f'{permissions.count()} permissions'
+        return f'{len(permissions)} permissions'
     
     permissions_display.short_description = 'Permissions'
+    
+    def get_queryset(self, request):
+        """
+        Annotate member counts and prefetch permissions for the list columns.
+        
+        Args:
+            request: HTTP request object
+            
+        Returns:
+            QuerySet: Group queryset with member counts and permissions loaded
+        """
+        queryset = super().get_queryset(request)
+        return queryset.annotate(
+            _member_count=Count('user', distinct=True)
+        ).prefetch_related('permissions__content_type')
 
 
 # Register enhanced admin classes
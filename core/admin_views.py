@@ -7,15 +7,20 @@ Enhanced with real-time charts and comprehensive system-wide reporting.
 from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import render
-from django.db.models import Count, Sum, Avg, Q, F, Case, When, Value, CharField
-from django.db.models.functions import TruncDate, TruncMonth, TruncWeek, TruncHour
+from django.db.models import Count, Sum, Avg, Q, F, DateField, FloatField
+from django.db.models.functions import Cast, Coalesce, TruncDate, TruncMonth, TruncWeek, TruncHour
 from django.utils import timezone
 from datetime import datetime, timedelta
-from django.http import JsonResponse, HttpResponse
+from decimal import Decimal
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, HttpResponse, StreamingHttpResponse
 from django.views.decorators.cache import cache_page
+from django.views.decorators.gzip import gzip_page
 from django.views.decorators.http import require_GET
 import json
 import csv
+import time
 
 # Import models for monitoring
 from django.contrib.auth.models import User
@@ -25,7 +30,11 @@ from orders.models import Order, OrderItem
 from customer.models import RestaurantReview, MenuItemReview, Wishlist
 
 # Import our analytics engine
-from .system_analytics import SystemAnalytics
+from .system_analytics import (
+    get_popular_wishlist_restaurants,
+    get_system_analytics,
+    get_user_role_distribution,
+)
 
 # Try to import Axes for security analytics
 try:
@@ -34,6 +43,35 @@ try:
 except ImportError:
     AXES_AVAILABLE = False
 
+# Cache keys for aggregated monitoring data (bump the version when the shape changes)
+MONITORING_KPIS_CACHE_KEY = 'admin:monitoring:kpis:v1'
+CATALOG_BREAKDOWNS_CACHE_KEY = 'admin:monitoring:catalog_breakdowns:v1'
+ORDER_KPIS_CACHE_KEY = 'admin:monitoring:order_kpis:v1'
+API_STATS_CACHE_KEY = 'admin:monitoring:api_stats:v1:{bucket}'
+API_OVERVIEW_CACHE_KEY = 'admin:monitoring:api_overview:v1:{bucket}'
+
+# Maximum flagged reviews of each kind listed on the content monitoring page
+FLAGGED_REVIEWS_LIMIT = 50
+
+
+def _combined_review_counts(**metrics):
+    """
+    Count reviews across RestaurantReview and MenuItemReview.
+    
+    Each keyword maps a metric name to a Q filter (or None for all rows).
+    One conditional aggregate is issued per review model and the results
+    are summed, instead of a COUNT query per metric and model.
+    """
+    totals = dict.fromkeys(metrics, 0)
+    for model in (RestaurantReview, MenuItemReview):
+        counts = model.objects.aggregate(**{
+            name: Count('id', filter=condition)
+            for name, condition in metrics.items()
+        })
+        for name, count in counts.items():
+            totals[name] += count
+    return totals
+
 
 @staff_member_required
 def monitoring_dashboard(request):
@@ -41,13 +79,13 @@ def monitoring_dashboard(request):
     Enhanced main monitoring dashboard with comprehensive analytics.
     Displays real-time charts and KPIs for system-wide monitoring.
     """
-    analytics = SystemAnalytics()
+    analytics = get_system_analytics()
     dashboard_data = analytics.get_comprehensive_dashboard()
     
     context = {
         'title': '📊 System Analytics Dashboard',
         'dashboard_data': dashboard_data,
-        'last_updated': timezone.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'last_updated': analytics.now.strftime('%Y-%m-%d %H:%M:%S'),
     }
     
     return render(request, 'admin/analytics_dashboard.html', context)
@@ -60,7 +98,7 @@ def authentication_analytics(request):
     Detailed authentication and security analytics dashboard.
     Focuses on user activity, login trends, and security metrics.
     """
-    analytics = SystemAnalytics()
+    analytics = get_system_analytics()
     auth_data = analytics.get_authentication_analytics()
     
     # Additional authentication-specific metrics
@@ -73,7 +111,7 @@ def authentication_analytics(request):
     context = {
         'title': '🔐 Authentication & Security Analytics',
         'auth_data': auth_data,
-        'last_updated': timezone.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'last_updated': analytics.now.strftime('%Y-%m-%d %H:%M:%S'),
     }
     
     return render(request, 'admin/authentication_analytics.html', context)
@@ -85,19 +123,21 @@ def business_analytics(request):
     Comprehensive business and revenue analytics dashboard.
     Shows order trends, revenue metrics, and performance indicators.
     """
-    analytics = SystemAnalytics()
+    analytics = get_system_analytics()
     business_data = analytics.get_business_analytics()
     
-    # Calculate growth rates
-    if business_data['revenue_today'] > 0:
-        business_data['daily_growth'] = round(((business_data['revenue_today'] - (business_data['revenue_month'] / 30)) / (business_data['revenue_month'] / 30)) * 100, 1)
+    # Calculate growth rate of today's revenue against the 30-day daily average
+    revenue_month = business_data['revenue_month']
+    if revenue_month > 0:
+        avg_daily_revenue = revenue_month / 30
+        business_data['daily_growth'] = round(float((business_data['revenue_today'] - avg_daily_revenue) / avg_daily_revenue) * 100, 1)
     else:
         business_data['daily_growth'] = 0
     
     context = {
         'title': '💰 Business & Revenue Analytics',
         'business_data': business_data,
-        'last_updated': timezone.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'last_updated': analytics.now.strftime('%Y-%m-%d %H:%M:%S'),
     }
     
     return render(request, 'admin/business_analytics.html', context)
@@ -110,71 +150,40 @@ def restaurant_analytics(request):
     Monitors restaurant metrics, menu performance, and cuisine trends.
     Enhanced with sales trend charts from restaurant dashboard.
     """
-    analytics = SystemAnalytics()
+    analytics = get_system_analytics()
     restaurant_data = analytics.get_restaurant_analytics()
     
-    # Calculate restaurant health metrics
-    if restaurant_data['total_restaurants'] > 0:
-        restaurant_data['activation_rate'] = round((restaurant_data['active_restaurants'] / restaurant_data['total_restaurants']) * 100, 1)
-    else:
-        restaurant_data['activation_rate'] = 0
-    
-    # Calculate inventory percentages for CSS (avoid template filters in styles)
-    if restaurant_data['total_menu_items'] > 0:
-        restaurant_data['available_percentage'] = round((restaurant_data['available_items'] / restaurant_data['total_menu_items']) * 100, 1)
-        restaurant_data['out_of_stock_percentage'] = round((restaurant_data['out_of_stock'] / restaurant_data['total_menu_items']) * 100, 1)
-    else:
-        restaurant_data['available_percentage'] = 0
-        restaurant_data['out_of_stock_percentage'] = 0
-    
     # Generate sales trend data for charts (like restaurant dashboard)
-    from orders.models import Order
-    from django.db.models.functions import TruncDate
-    import json
-    
     # Daily sales for last 30 days
     daily_sales = Order.objects.filter(
-        created_at__gte=timezone.now() - timedelta(days=30)
+        created_at__gte=analytics.now - timedelta(days=30)
     ).annotate(
         date=TruncDate('created_at')
     ).values('date').annotate(
-        revenue=Sum('total_amount'),
+        revenue=Cast(Sum('total_amount'), FloatField()),
         orders=Count('id')
     ).order_by('date')
     
     # Monthly sales for last 12 months
     monthly_sales = Order.objects.filter(
-        created_at__gte=timezone.now() - timedelta(days=365)
+        created_at__gte=analytics.now - timedelta(days=365)
     ).annotate(
-        month=TruncMonth('created_at')
+        month=TruncMonth('created_at', output_field=DateField())
     ).values('month').annotate(
-        revenue=Sum('total_amount'),
+        revenue=Cast(Sum('total_amount'), FloatField()),
         orders=Count('id')
     ).order_by('month')
     
-    # Convert to JSON for Chart.js
-    daily_sales_json = json.dumps([
-        {
-            'date': item['date'].strftime('%Y-%m-%d'),
-            'revenue': float(item['revenue']),
-            'orders': item['orders']
-        } for item in daily_sales
-    ])
-    
-    monthly_sales_json = json.dumps([
-        {
-            'month': item['month'].strftime('%Y-%m'),
-            'revenue': float(item['revenue']),
-            'orders': item['orders']
-        } for item in monthly_sales
-    ])
+    # Rows already have the chart shape; dates serialize as YYYY-MM-DD
+    daily_sales_json = json.dumps(list(daily_sales), default=str)
+    monthly_sales_json = json.dumps(list(monthly_sales), default=str)
     
     context = {
         'title': '🍽️ Restaurant Performance Analytics',
         'restaurant_data': restaurant_data,
         'daily_sales_json': daily_sales_json,
         'monthly_sales_json': monthly_sales_json,
-        'last_updated': timezone.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'last_updated': analytics.now.strftime('%Y-%m-%d %H:%M:%S'),
     }
     
     return render(request, 'admin/restaurant_analytics.html', context)
@@ -186,7 +195,7 @@ def customer_analytics(request):
     Customer behavior and engagement analytics dashboard.
     Tracks reviews, ratings, wishlist activity, and customer satisfaction.
     """
-    analytics = SystemAnalytics()
+    analytics = get_system_analytics()
     customer_data = analytics.get_customer_analytics()
     
     # Calculate engagement metrics
@@ -199,7 +208,7 @@ def customer_analytics(request):
     context = {
         'title': '👥 Customer Engagement Analytics',
         'customer_data': customer_data,
-        'last_updated': timezone.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'last_updated': analytics.now.strftime('%Y-%m-%d %H:%M:%S'),
     }
     
     return render(request, 'admin/customer_analytics.html', context)
@@ -211,13 +220,13 @@ def system_health_analytics(request):
     System health and performance monitoring dashboard.
     Tracks database metrics, system performance, and operational health.
     """
-    analytics = SystemAnalytics()
+    analytics = get_system_analytics()
     health_data = analytics.get_system_health_analytics()
     
     context = {
         'title': '⚙️ System Health & Performance',
         'health_data': health_data,
-        'last_updated': timezone.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'last_updated': analytics.now.strftime('%Y-%m-%d %H:%M:%S'),
     }
     
     return render(request, 'admin/system_health_analytics.html', context)
@@ -230,7 +239,7 @@ def api_real_time_stats(request):
     API endpoint for real-time statistics updates.
     Returns JSON data for AJAX dashboard updates.
     """
-    analytics = SystemAnalytics()
+    analytics = get_system_analytics()
     
     # Get specific data type from request
     data_type = request.GET.get('type', 'overview')
@@ -246,107 +255,176 @@ def api_real_time_stats(request):
     elif data_type == 'health':
         data = analytics.get_system_health_analytics()
     else:
-        data = analytics.get_comprehensive_dashboard()
+        # Overview is polled by every open dashboard: cache the encoded body
+        cache_key = API_OVERVIEW_CACHE_KEY.format(bucket=int(time.time() // 10))
+        payload = cache.get(cache_key)
+        if payload is None:
+            payload = json.dumps({
+                'success': True,
+                'data': analytics.get_comprehensive_dashboard(),
+                'timestamp': analytics.now.isoformat()
+            }, cls=DjangoJSONEncoder)
+            cache.set(cache_key, payload, 15)
+        return HttpResponse(payload, content_type='application/json')
     
     return JsonResponse({
         'success': True,
         'data': data,
-        'timestamp': timezone.now().isoformat()
+        'timestamp': analytics.now.isoformat()
     })
 
 
-@staff_member_required
-def export_analytics_csv(request):
+class _Echo:
     """
-    Export analytics data to CSV format.
-    Supports different data types for targeted exports.
+    Pseudo-buffer for csv.writer that hands each formatted row straight back
+    instead of storing it, so rows can be streamed as they are produced.
     """
-    analytics = SystemAnalytics()
-    data_type = request.GET.get('type', 'overview')
     
-    response = HttpResponse(content_type='text/csv')
-    filename = f'analytics_export_{data_type}_{timezone.now().strftime("%Y%m%d_%H%M%S")}.csv'
-    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    def write(self, value):
+        """Return the formatted CSV line unchanged."""
+        return value
+
+
+def _analytics_csv_rows(analytics, data_type):
+    """
+    Yield the rows of an analytics CSV export one at a time.
     
-    writer = csv.writer(response)
+    Args:
+        analytics: SystemAnalytics instance providing the metrics
+        data_type: Export type ('authentication', 'business' or 'overview')
     
+    Yields:
+        list: One CSV row
+    """
     if data_type == 'authentication':
         data = analytics.get_authentication_analytics()
-        writer.writerow(['Metric', 'Value'])
-        writer.writerow(['Total Users', data['total_users']])
-        writer.writerow(['Active Users Today', data['active_users_today']])
-        writer.writerow(['Active Users This Week', data['active_users_week']])
-        writer.writerow(['Active Users This Month', data['active_users_month']])
-        writer.writerow(['New Users Today', data['new_users_today']])
-        writer.writerow(['New Users This Week', data['new_users_week']])
-        writer.writerow(['New Users This Month', data['new_users_month']])
+        yield ['Metric', 'Value']
+        yield ['Total Users', data['total_users']]
+        yield ['Active Users Today', data['active_users_today']]
+        yield ['Active Users This Week', data['active_users_week']]
+        yield ['Active Users This Month', data['active_users_month']]
+        yield ['New Users Today', data['new_users_today']]
+        yield ['New Users This Week', data['new_users_week']]
+        yield ['New Users This Month', data['new_users_month']]
         
         # User roles
-        writer.writerow([])
-        writer.writerow(['User Role Distribution'])
-        writer.writerow(['Role', 'Count'])
+        yield []
+        yield ['User Role Distribution']
+        yield ['Role', 'Count']
         for role in data['user_roles']:
-            writer.writerow([role['role_name'], role['count']])
+            yield [role['role_name'], role['count']]
     
     elif data_type == 'business':
         data = analytics.get_business_analytics()
-        writer.writerow(['Business Metric', 'Value'])
-        writer.writerow(['Total Orders', data['total_orders']])
-        writer.writerow(['Orders Today', data['orders_today']])
-        writer.writerow(['Orders This Week', data['orders_week']])
-        writer.writerow(['Orders This Month', data['orders_month']])
-        writer.writerow(['Total Revenue', f"${data['total_revenue']:.2f}"])
-        writer.writerow(['Revenue Today', f"${data['revenue_today']:.2f}"])
-        writer.writerow(['Revenue This Week', f"${data['revenue_week']:.2f}"])
-        writer.writerow(['Revenue This Month', f"${data['revenue_month']:.2f}"])
-        writer.writerow(['Average Order Value', f"${data['avg_order_value']:.2f}"])
+        yield ['Business Metric', 'Value']
+        yield ['Total Orders', data['total_orders']]
+        yield ['Orders Today', data['orders_today']]
+        yield ['Orders This Week', data['orders_week']]
+        yield ['Orders This Month', data['orders_month']]
+        yield ['Total Revenue', f"${data['total_revenue']:.2f}"]
+        yield ['Revenue Today', f"${data['revenue_today']:.2f}"]
+        yield ['Revenue This Week', f"${data['revenue_week']:.2f}"]
+        yield ['Revenue This Month', f"${data['revenue_month']:.2f}"]
+        yield ['Average Order Value', f"${data['avg_order_value']:.2f}"]
         
-        # Top restaurants
-        writer.writerow([])
-        writer.writerow(['Top Performing Restaurants'])
-        writer.writerow(['Restaurant', 'Orders', 'Revenue'])
-        for restaurant in data['top_restaurants']:
-            writer.writerow([restaurant['restaurant__name'], restaurant['orders'], f"${restaurant['revenue']:.2f}"])
+        # Top restaurants, ranked by revenue and streamed as plain value rows
+        # rather than reusing the dashboard's top-10 summary
+        restaurant_revenue = OrderItem.objects.values_list(
+            'menu_item__restaurant__name'
+        ).annotate(
+            orders=Count('order_id', distinct=True),
+            revenue=Sum(F('quantity') * F('price'))
+        ).order_by('-revenue')
+        yield []
+        yield ['Top Performing Restaurants']
+        yield ['Restaurant', 'Orders', 'Revenue']
+        yield from (
+            (name, orders, f"${revenue:.2f}")
+            for name, orders, revenue in restaurant_revenue.iterator(chunk_size=1000)
+        )
     
     else:
         # Overview export
         data = analytics.get_comprehensive_dashboard()
-        writer.writerow(['System Analytics Overview'])
-        writer.writerow(['Generated:', data['generated_at']])
-        writer.writerow([])
+        yield ['System Analytics Overview']
+        yield ['Generated:', data['generated_at']]
+        yield []
         
         # Authentication overview
         auth = data['authentication']
-        writer.writerow(['Authentication Metrics'])
-        writer.writerow(['Total Users', auth['total_users']])
-        writer.writerow(['Active Users Today', auth['active_users_today']])
-        writer.writerow(['New Users This Month', auth['new_users_month']])
+        yield ['Authentication Metrics']
+        yield ['Total Users', auth['total_users']]
+        yield ['Active Users Today', auth['active_users_today']]
+        yield ['New Users This Month', auth['new_users_month']]
         
         # Business overview
         business = data['business']
-        writer.writerow([])
-        writer.writerow(['Business Metrics'])
-        writer.writerow(['Total Orders', business['total_orders']])
-        writer.writerow(['Total Revenue', f"${business['total_revenue']:.2f}"])
-        writer.writerow(['Orders This Month', business['orders_month']])
+        yield []
+        yield ['Business Metrics']
+        yield ['Total Orders', business['total_orders']]
+        yield ['Total Revenue', f"${business['total_revenue']:.2f}"]
+        yield ['Orders This Month', business['orders_month']]
         
         # Restaurant overview
         restaurant = data['restaurant']
-        writer.writerow([])
-        writer.writerow(['Restaurant Metrics'])
-        writer.writerow(['Total Restaurants', restaurant['total_restaurants']])
-        writer.writerow(['Active Restaurants', restaurant['active_restaurants']])
-        writer.writerow(['Total Menu Items', restaurant['total_menu_items']])
+        yield []
+        yield ['Restaurant Metrics']
+        yield ['Total Restaurants', restaurant['total_restaurants']]
+        yield ['Active Restaurants', restaurant['active_restaurants']]
+        yield ['Total Menu Items', restaurant['total_menu_items']]
+
+
+@staff_member_required
+@gzip_page
+def export_analytics_csv(request):
+    """
+    Export analytics data to CSV format.
+    Supports different data types for targeted exports.
+    
+    Rows are streamed to the client as they are generated (gzip-compressed
+    when the client accepts it) rather than buffered in one response body.
+    """
+    analytics = get_system_analytics()
+    data_type = request.GET.get('type', 'overview')
+    
+    writer = csv.writer(_Echo())
+    response = StreamingHttpResponse(
+        (writer.writerow(row) for row in _analytics_csv_rows(analytics, data_type)),
+        content_type='text/csv'
+    )
+    filename = f'analytics_export_{data_type}_{analytics.now.strftime("%Y%m%d_%H%M%S")}.csv'
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
     
     return response
 
 
-@staff_member_required
-@cache_page(300)  # Cache for 5 minutes
-def monitoring_dashboard(request):
+def _catalog_breakdowns():
     """
-    Main monitoring dashboard with comprehensive website statistics.
-    Displays aggregated data only - no sensitive user information exposed.
+    Group restaurants by cuisine and menu items by category.
+    
+    These full-table GROUP BYs only move when the catalogue changes, so the
+    result is cached separately from the KPI block with a longer timeout.
+    """
+    return {
+        'restaurants_by_cuisine': list(
+            Restaurant.objects.values('cuisine_type').annotate(
+                count=Count('id')
+            ).order_by('-count')
+        ),
+        'menu_items_by_category': list(
+            MenuItem.objects.values('category__name').annotate(
+                count=Count('id')
+            ).order_by('-count')
+        ),
+    }
+
+
+def _dashboard_kpis():
+    """
+    Gather the aggregated KPI block shown on the monitoring dashboard.
+    
+    Returns only plain values and lists so the result can be cached and
+    shared between requests.
     """
     # Get date ranges for comparisons
     today = timezone.now().date()
@@ -354,99 +432,89 @@ def monitoring_dashboard(request):
     last_month = today - timedelta(days=30)
     last_year = today - timedelta(days=365)
     
-    # User Statistics (Aggregated Only)
-    total_users = User.objects.count()
-    active_users_last_week = User.objects.filter(
-        last_login__gte=last_week
-    ).count()
-    new_users_this_month = User.objects.filter(
-        date_joined__gte=last_month
-    ).count()
+    # User Statistics (Aggregated Only) - one conditional aggregate
+    user_stats = User.objects.aggregate(
+        total=Count('id'),
+        active_week=Count('id', filter=Q(last_login__gte=last_week)),
+        new_month=Count('id', filter=Q(date_joined__gte=last_month)),
+    )
+    total_users = user_stats['total']
+    active_users_last_week = user_stats['active_week']
+    new_users_this_month = user_stats['new_month']
     
     # User role distribution (privacy-safe)
-    user_roles = User.objects.annotate(
-        role_name=Case(
-            When(is_superuser=True, then=Value('Super Admin')),
-            When(is_staff=True, then=Value('Staff')),
-            When(groups__name='Restaurant Owner', then=Value('Restaurant Owner')),
-            default=Value('Customer'),
-            output_field=CharField(),
-        )
-    ).values('role_name').annotate(count=Count('id'))
+    user_roles = get_user_role_distribution()
     
     # Restaurant Statistics
-    total_restaurants = Restaurant.objects.count()
-    active_restaurants = Restaurant.objects.filter(is_active=True).count()
-    pending_restaurants = Restaurant.objects.filter(is_approved=False, is_active=False).count()
-    restaurants_by_cuisine = Restaurant.objects.values('cuisine_type').annotate(
-        count=Count('id')
-    ).order_by('-count')
+    restaurant_stats = Restaurant.objects.aggregate(
+        total=Count('id'),
+        active=Count('id', filter=Q(is_active=True)),
+        pending=Count('id', filter=Q(is_approved=False, is_active=False)),
+    )
+    total_restaurants = restaurant_stats['total']
+    active_restaurants = restaurant_stats['active']
+    pending_restaurants = restaurant_stats['pending']
     
     # Menu Statistics
-    total_menu_items = MenuItem.objects.count()
-    available_menu_items = MenuItem.objects.filter(is_available=True).count()
-    menu_items_by_category = MenuItem.objects.values('category__name').annotate(
-        count=Count('id')
-    ).order_by('-count')
-    
-    # Order Statistics (Business Metrics)
-    total_orders = Order.objects.count()
-    orders_this_week = Order.objects.filter(created_at__gte=last_week).count()
-    orders_this_month = Order.objects.filter(created_at__gte=last_month).count()
-    
-    # Revenue Statistics (Aggregated Only)
-    total_revenue = Order.objects.aggregate(
-        total=Sum('total_amount')
-    )['total'] or 0
-    revenue_this_month = Order.objects.filter(
-        created_at__gte=last_month
-    ).aggregate(total=Sum('total_amount'))['total'] or 0
+    menu_stats = MenuItem.objects.aggregate(
+        total=Count('id'),
+        available=Count('id', filter=Q(is_available=True)),
+    )
+    total_menu_items = menu_stats['total']
+    available_menu_items = menu_stats['available']
+    
+    # Cuisine and category breakdowns change rarely; refreshed hourly
+    catalog = cache.get_or_set(CATALOG_BREAKDOWNS_CACHE_KEY, _catalog_breakdowns, 3600)
+    
+    # Order and Revenue Statistics (Business Metrics, Aggregated Only)
+    order_stats = cache.get_or_set(ORDER_KPIS_CACHE_KEY, _order_kpis, 60)
+    total_orders = order_stats['total']
+    orders_this_week = order_stats['week']
+    orders_this_month = order_stats['month']
+    total_revenue = order_stats['revenue']
+    revenue_this_month = order_stats['revenue_month']
     
     # Average order value
-    avg_order_value = Order.objects.aggregate(
-        avg=Avg('total_amount')
-    )['avg'] or 0
-    
-    # Review Statistics
-    total_restaurant_reviews = RestaurantReview.objects.count()
-    total_menu_item_reviews = MenuItemReview.objects.count()
-    pending_reviews = RestaurantReview.objects.filter(
-        is_flagged=True
-    ).count() + MenuItemReview.objects.filter(is_flagged=True).count()
-    
-    # Average ratings (aggregated)
-    avg_restaurant_rating = RestaurantReview.objects.aggregate(
-        avg=Avg('rating')
-    )['avg'] or 0
-    avg_menu_item_rating = MenuItemReview.objects.aggregate(
-        avg=Avg('rating')
-    )['avg'] or 0
+    avg_order_value = order_stats['avg']
+    
+    # Review Statistics and average ratings (aggregated)
+    restaurant_review_stats = RestaurantReview.objects.aggregate(
+        total=Count('id'),
+        flagged=Count('id', filter=Q(is_flagged=True)),
+        avg=Coalesce(Avg('rating'), 0.0),
+    )
+    menu_review_stats = MenuItemReview.objects.aggregate(
+        total=Count('id'),
+        flagged=Count('id', filter=Q(is_flagged=True)),
+        avg=Coalesce(Avg('rating'), 0.0),
+    )
+    total_restaurant_reviews = restaurant_review_stats['total']
+    total_menu_item_reviews = menu_review_stats['total']
+    pending_reviews = restaurant_review_stats['flagged'] + menu_review_stats['flagged']
+    avg_restaurant_rating = restaurant_review_stats['avg']
+    avg_menu_item_rating = menu_review_stats['avg']
     
     # Wishlist Statistics
     total_wishlists = Wishlist.objects.count()
-    popular_restaurants = Wishlist.objects.values('restaurant__name').annotate(
-        count=Count('id')
-    ).order_by('-count')[:10]
+    popular_restaurants = get_popular_wishlist_restaurants()
     
-    context = {
-        'title': 'Website Monitoring Dashboard',
-        
+    return {
         # User Metrics
         'total_users': total_users,
         'active_users_last_week': active_users_last_week,
         'new_users_this_month': new_users_this_month,
-        'user_roles': list(user_roles),
+        'user_roles': user_roles,
         
         # Restaurant Metrics
         'total_restaurants': total_restaurants,
         'active_restaurants': active_restaurants,
         'pending_restaurants': pending_restaurants,
-        'restaurants_by_cuisine': list(restaurants_by_cuisine),
+        'restaurants_by_cuisine': catalog['restaurants_by_cuisine'],
         
         # Menu Metrics
         'total_menu_items': total_menu_items,
         'available_menu_items': available_menu_items,
-        'menu_items_by_category': list(menu_items_by_category),
+        'menu_items_by_category': catalog['menu_items_by_category'],
         
         # Order Metrics
         'total_orders': total_orders,
@@ -467,7 +535,22 @@ def monitoring_dashboard(request):
         
         # Wishlist Metrics
         'total_wishlists': total_wishlists,
-        'popular_restaurants': list(popular_restaurants),
+        'popular_restaurants': popular_restaurants,
+    }
+
+
+@staff_member_required
+def monitoring_dashboard(request):
+    """
+    Main monitoring dashboard with comprehensive website statistics.
+    Displays aggregated data only - no sensitive user information exposed.
+    The KPI block is cached for 5 minutes; server time is always current.
+    """
+    kpis = cache.get_or_set(MONITORING_KPIS_CACHE_KEY, _dashboard_kpis, 300)
+    
+    context = {
+        'title': 'Website Monitoring Dashboard',
+        **kpis,
         
         # System Health
         'server_time': timezone.now(),
@@ -505,7 +588,7 @@ def analytics_trends(request):
         date=TruncDate('created_at')
     ).values('date').annotate(
         count=Count('id'),
-        revenue=Sum('total_amount')
+        revenue=Cast(Sum('total_amount'), FloatField())
     ).order_by('date')
     
     # Review trends
@@ -535,35 +618,35 @@ def content_monitoring(request):
     Content monitoring dashboard for reviews and user-generated content.
     Focuses on moderation needs and content quality metrics.
     """
-    # Flagged content requiring attention
+    # Flagged content requiring attention (newest 50 of each, only the columns shown)
     flagged_restaurant_reviews = RestaurantReview.objects.filter(
         is_flagged=True
-    ).select_related('restaurant', 'user').order_by('-created_at')
+    ).select_related('restaurant', 'user').only(
+        'id', 'rating', 'comment', 'created_at', 'restaurant__name', 'user__id'
+    ).order_by('-created_at')[:FLAGGED_REVIEWS_LIMIT]
     
     flagged_menu_reviews = MenuItemReview.objects.filter(
         is_flagged=True
-    ).select_related('menu_item', 'user').order_by('-created_at')
-    
-    # Recent reviews (last 24 hours)
-    recent_reviews = RestaurantReview.objects.filter(
-        created_at__gte=timezone.now() - timedelta(days=1)
-    ).count() + MenuItemReview.objects.filter(
-        created_at__gte=timezone.now() - timedelta(days=1)
-    ).count()
-    
-    # Content quality metrics
-    low_rated_reviews = RestaurantReview.objects.filter(
-        rating__lte=2
-    ).count() + MenuItemReview.objects.filter(rating__lte=2).count()
-    
-    high_rated_reviews = RestaurantReview.objects.filter(
-        rating__gte=4
-    ).count() + MenuItemReview.objects.filter(rating__gte=4).count()
+    ).select_related('menu_item', 'user').only(
+        'id', 'rating', 'comment', 'created_at', 'menu_item__name', 'user__id'
+    ).order_by('-created_at')[:FLAGGED_REVIEWS_LIMIT]
+    
+    # Recent reviews (last 24 hours) and content quality metrics
+    review_counts = _combined_review_counts(
+        recent=Q(created_at__gte=timezone.now() - timedelta(days=1)),
+        low_rated=Q(rating__lte=2),
+        high_rated=Q(rating__gte=4),
+    )
+    recent_reviews = review_counts['recent']
+    low_rated_reviews = review_counts['low_rated']
+    high_rated_reviews = review_counts['high_rated']
     
     context = {
         'title': 'Content Monitoring',
         'flagged_restaurant_reviews': flagged_restaurant_reviews,
         'flagged_menu_reviews': flagged_menu_reviews,
+        'flagged_restaurant_count': RestaurantReview.objects.filter(is_flagged=True).count(),
+        'flagged_menu_count': MenuItemReview.objects.filter(is_flagged=True).count(),
         'recent_reviews': recent_reviews,
         'low_rated_reviews': low_rated_reviews,
         'high_rated_reviews': high_rated_reviews,
@@ -579,57 +662,93 @@ def system_health(request):
     System health monitoring dashboard.
     Shows database stats, server performance, and system metrics.
     """
+    now = timezone.now()
+    one_hour_ago = now - timedelta(hours=1)
+    review_counts = _combined_review_counts(
+        total=None,
+        recent=Q(created_at__gte=one_hour_ago),
+    )
+    
     # Database statistics
     db_stats = {
         'users': User.objects.count(),
         'restaurants': Restaurant.objects.count(),
         'menu_items': MenuItem.objects.count(),
         'orders': Order.objects.count(),
-        'reviews': RestaurantReview.objects.count() + MenuItemReview.objects.count(),
+        'reviews': review_counts['total'],
     }
     
     # Recent activity (last hour)
-    one_hour_ago = timezone.now() - timedelta(hours=1)
     recent_activity = {
         'new_users': User.objects.filter(date_joined__gte=one_hour_ago).count(),
         'new_orders': Order.objects.filter(created_at__gte=one_hour_ago).count(),
-        'new_reviews': RestaurantReview.objects.filter(
-            created_at__gte=one_hour_ago
-        ).count() + MenuItemReview.objects.filter(
-            created_at__gte=one_hour_ago
-        ).count(),
+        'new_reviews': review_counts['recent'],
     }
     
     context = {
         'title': 'System Health',
         'db_stats': db_stats,
         'recent_activity': recent_activity,
-        'server_time': timezone.now(),
+        'server_time': now,
         'uptime': 'N/A',  # Could be enhanced with actual uptime tracking
     }
     
     return render(request, 'admin/system_health.html', context)
 
 
-@staff_member_required
-@cache_page(60)  # Cache for 1 minute
-def api_stats(request):
+def _order_kpis():
     """
-    API endpoint for real-time statistics (AJAX updates).
-    Returns JSON data for dashboard widgets.
+    Compute the order counters and revenue figures in one aggregate query.
+    
+    Shared by the monitoring dashboard and the api_stats endpoint so both
+    read the same cached numbers instead of counting orders separately.
+    
+    Returns:
+        dict: total, active, week and month order counts plus revenue,
+            revenue_month and avg amounts
+    """
+    today = timezone.now().date()
+    last_week = today - timedelta(days=7)
+    last_month = today - timedelta(days=30)
+    
+    return Order.objects.aggregate(
+        total=Count('id'),
+        active=Count('id', filter=Q(status__in=['pending', 'processing'])),
+        week=Count('id', filter=Q(created_at__gte=last_week)),
+        month=Count('id', filter=Q(created_at__gte=last_month)),
+        revenue=Coalesce(Sum('total_amount'), Decimal('0')),
+        revenue_month=Coalesce(Sum('total_amount', filter=Q(created_at__gte=last_month)), Decimal('0')),
+        avg=Coalesce(Avg('total_amount'), Decimal('0')),
+    )
+
+
+def _api_stats():
+    """
+    Gather the counters returned by the api_stats endpoint.
     """
     one_hour_ago = timezone.now() - timedelta(hours=1)
     
-    stats = {
+    return {
         'current_users': User.objects.filter(
             last_login__gte=one_hour_ago
         ).count(),
-        'active_orders': Order.objects.filter(
-            status__in=['pending', 'processing']
-        ).count(),
+        'active_orders': cache.get_or_set(ORDER_KPIS_CACHE_KEY, _order_kpis, 60)['active'],
         'pending_reviews': RestaurantReview.objects.filter(
             is_flagged=True
         ).count() + MenuItemReview.objects.filter(is_flagged=True).count(),
+    }
+
+
+@staff_member_required
+def api_stats(request):
+    """
+    API endpoint for real-time statistics (AJAX updates).
+    Returns JSON data for dashboard widgets.
+    Counters are cached per one-minute bucket.
+    """
+    cache_key = API_STATS_CACHE_KEY.format(bucket=int(time.time() // 60))
+    stats = {
+        **cache.get_or_set(cache_key, _api_stats, 60),
         'server_time': timezone.now().isoformat(),
     }
     
@@ -7,7 +7,8 @@ This AppConfig handles initialization tasks including:
 - Initializing system components
 """
 from django.apps import AppConfig
-from django.db.models.signals import post_migrate
+from django.conf import settings
+from django.db.models.signals import post_delete, post_migrate, post_save
 
 
 class CoreConfig(AppConfig):
@@ -27,6 +28,18 @@ class CoreConfig(AppConfig):
         """
         # Connect post_migrate signal to create default groups
         post_migrate.connect(create_default_groups, sender=self)
+        
+        # Keep the authentication backend's user cache in step with the database
+        from .authentication import invalidate_cached_profile_user, invalidate_cached_user
+        post_save.connect(invalidate_cached_user, sender=settings.AUTH_USER_MODEL)
+        post_delete.connect(invalidate_cached_user, sender=settings.AUTH_USER_MODEL)
+        post_save.connect(invalidate_cached_profile_user, sender='customer.UserProfile')
+        post_delete.connect(invalidate_cached_profile_user, sender='customer.UserProfile')
+        
+        # Derive the field-encryption key (100k PBKDF2 rounds) at startup so the
+        # first request in each worker does not pay for it
+        from .encryption import EncryptionManager
+        EncryptionManager._get_encryption_key()
     
     def extend_user_model(self):
         """
@@ -80,15 +93,24 @@ def create_default_groups(sender, **kwargs):
         # Add permissions for restaurant management
         restaurant_content_type = ContentType.objects.get_for_model(Restaurant)
         
-        # Get all permissions for Restaurant model
-        restaurant_permissions = Permission.objects.filter(
-            content_type=restaurant_content_type
+        # Get all permission IDs for Restaurant model
+        permission_ids = list(
+            Permission.objects.filter(
+                content_type=restaurant_content_type
+            ).values_list('id', flat=True)
         )
         
-        # Add permissions to the group
-        restaurant_owner_group.permissions.add(*restaurant_permissions)
+        # Add permissions to the group with a single INSERT
+        GroupPermission = Group.permissions.through
+        GroupPermission.objects.bulk_create(
+            [
+                GroupPermission(group_id=restaurant_owner_group.id, permission_id=permission_id)
+                for permission_id in permission_ids
+            ],
+            ignore_conflicts=True
+        )
         
-        print(f"✅ Added {restaurant_permissions.count()} permissions to Restaurant Owner group")
+        print(f"✅ Added {len(permission_ids)} permissions to Restaurant Owner group")
     else:
         print("ℹ️  'Restaurant Owner' group already exists")
     
@@ -112,17 +134,25 @@ def sync_restaurant_owners_to_group():
     
     restaurant_owner_group = Group.objects.get(name='Restaurant Owner')
     
-    # Get all users who own restaurants
-    users_with_restaurants = User.objects.filter(
-        restaurants__isnull=False
-    ).distinct()
+    # Owners missing from the group: one query for owners, one for members
+    owner_ids = set(
+        User.objects.filter(
+            restaurants__isnull=False
+        ).values_list('id', flat=True).distinct()
+    )
+    member_ids = set(restaurant_owner_group.user_set.values_list('id', flat=True))
+    missing_ids = owner_ids - member_ids
     
-    # Add them to the Restaurant Owner group
-    added_count = 0
-    for user in users_with_restaurants:
-        if not restaurant_owner_group.user_set.filter(id=user.id).exists():
-            restaurant_owner_group.user_set.add(user)
-            added_count += 1
+    # Add them to the Restaurant Owner group with a single INSERT
+    Membership = User.groups.through
+    Membership.objects.bulk_create(
+        [
+            Membership(user_id=user_id, group_id=restaurant_owner_group.id)
+            for user_id in missing_ids
+        ],
+        ignore_conflicts=True
+    )
+    added_count = len(missing_ids)
     
     if added_count > 0:
         print(f"✅ Synced {added_count} users to Restaurant Owner group")
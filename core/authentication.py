@@ -4,9 +4,225 @@ Custom authentication backend for the food ordering system.
 This backend allows users to login using either their username or email address,
 providing a more flexible authentication experience.
 """
+from functools import lru_cache
+
+from django.conf import settings
 from django.contrib.auth.backends import BaseBackend
 from django.contrib.auth import get_user_model
-from django.db.models import Q
+from django.contrib.auth.hashers import UNUSABLE_PASSWORD_PREFIX, check_password, make_password
+from django.core.cache import cache
+from django.db.models.functions import Lower
+from django.utils.crypto import get_random_string
+
+# Cache of users resolved by get_user(), which runs on every authenticated request.
+# Entries are keyed by a per-user version token; invalidating a user replaces
+# the token, so every worker stops reading the old entry at once.
+USER_CACHE_KEY = 'auth:user:v2:{user_id}:{version}'
+USER_CACHE_VERSION_KEY = 'auth:user:version:{user_id}'
+USER_CACHE_TIMEOUT = 300  # 5 minutes
+
+# Cache backends shared between processes. With a per-process cache
+# (LocMemCache, the default when CACHES is not set) an invalidation only
+# reaches the worker that handled the save, so the user cache stays off.
+SHARED_CACHE_BACKENDS = ('redis', 'memcached')
+
+
+@lru_cache(maxsize=None)
+def _user_model():
+    """
+    Resolve the user model once instead of walking the app registry per call.
+    
+    Returns:
+        type: The active User model class
+    """
+    return get_user_model()
+
+
+def _authenticatable_users():
+    """
+    Queryset of users allowed to log in.
+    
+    Applies user_can_authenticate() in SQL (active, usable password) so
+    disabled accounts are never fetched during login. The customer profile
+    is joined in, since the login form checks it right after authenticating.
+    
+    Returns:
+        QuerySet: Active users with a usable password
+    """
+    return _user_model().objects.select_related('profile').filter(is_active=True).exclude(
+        password__startswith=UNUSABLE_PASSWORD_PREFIX
+    )
+
+
+@lru_cache(maxsize=None)
+def _dummy_password_hash():
+    """
+    Build the hash verified against when no user matches the login.
+    
+    Created on first use rather than at import so the hasher settings are
+    loaded; the random password can never match.
+    
+    Returns:
+        str: Encoded password hash using the default hasher
+    """
+    return make_password(get_random_string(32))
+
+
+def _check_password_or_dummy(user, password):
+    """
+    Verify a password, paying the same hashing cost whether or not the user exists.
+    
+    Skipping the hash for unknown users would make those logins return
+    noticeably faster, revealing which usernames/emails are registered.
+    
+    Args:
+        user: User object, or None if the lookup found nothing
+        password: Password provided by user
+        
+    Returns:
+        bool: True if user exists and the password matches, False otherwise
+    """
+    if user is None:
+        check_password(password, _dummy_password_hash())
+        return False
+    return user.check_password(password)
+
+
+@lru_cache(maxsize=None)
+def user_cache_enabled():
+    """
+    Check whether get_user() lookups may be cached.
+    
+    The cached user carries is_active and the password hash that session
+    verification reads, so a stale copy in one worker would keep a
+    deactivated user or an old session logged in. Caching is therefore only
+    enabled when the default cache is shared by all workers.
+    
+    Returns:
+        bool: True if the default cache backend is Redis or Memcached
+    """
+    backend = settings.CACHES.get('default', {}).get('BACKEND', '').lower()
+    return any(name in backend for name in SHARED_CACHE_BACKENDS)
+
+
+def _load_user(user_id):
+    """
+    Load a user and their customer profile in one query.
+    
+    Args:
+        user_id: Primary key of the user
+        
+    Returns:
+        User: User object, or None if no such user exists
+    """
+    User = _user_model()
+    try:
+        return User.objects.select_related('profile').get(pk=user_id)
+    except User.DoesNotExist:
+        return None
+
+
+def _user_cache_version(user_id):
+    """
+    Return the current cache version token of a user, creating it if missing.
+    
+    Tokens are random rather than counters, so a version key that was
+    evicted can never bring an older cached entry back into use.
+    
+    Args:
+        user_id: Primary key of the user
+        
+    Returns:
+        str: Version token to build the user cache key with
+    """
+    version_key = USER_CACHE_VERSION_KEY.format(user_id=user_id)
+    version = cache.get(version_key)
+    if version is None:
+        version = get_random_string(12)
+        if not cache.add(version_key, version, None):
+            version = cache.get(version_key, version)
+    return version
+
+
+def get_cached_user(user_id):
+    """
+    Fetch a user by primary key, serving repeat lookups from the cache.
+    
+    The customer profile is joined into the same query, since most pages
+    read user.profile (role checks, loyalty points, avatar). Without a
+    shared cache backend every call goes to the database.
+    
+    Args:
+        user_id: Primary key of the user
+        
+    Returns:
+        User: User object, or None if no such user exists
+    """
+    if not user_cache_enabled():
+        return _load_user(user_id)
+    
+    cache_key = USER_CACHE_KEY.format(user_id=user_id, version=_user_cache_version(user_id))
+    user = cache.get(cache_key)
+    if user is None:
+        user = _load_user(user_id)
+        if user is None:
+            return None
+        cache.set(cache_key, user, USER_CACHE_TIMEOUT)
+    return user
+
+
+def invalidate_cached_users(user_ids):
+    """
+    Retire the cached entries of several users by replacing their versions.
+    
+    Saves go through invalidate_cached_user(); code that changes users with
+    QuerySet.update() or bulk_update() (which send no post_save) must call
+    this for the affected ids.
+    
+    Args:
+        user_ids: Iterable of user primary keys
+    """
+    if not user_cache_enabled():
+        return
+    cache.set_many(
+        {
+            USER_CACHE_VERSION_KEY.format(user_id=user_id): get_random_string(12)
+            for user_id in user_ids
+        },
+        None
+    )
+
+
+def invalidate_cached_user(sender, instance, **kwargs):
+    """
+    Drop a user from the get_user() cache when it is saved or deleted.
+    
+    Covers set_password() and is_active changes, which are persisted with
+    save(). Connected to post_save/post_delete of the user model in
+    CoreConfig.ready().
+    
+    Args:
+        sender: User model class
+        instance: User instance that changed
+        **kwargs: Additional signal arguments
+    """
+    invalidate_cached_users([instance.pk])
+
+
+def invalidate_cached_profile_user(sender, instance, **kwargs):
+    """
+    Drop a user from the get_user() cache when their profile is saved or deleted.
+    
+    The cached user carries its select_related profile, so profile changes
+    must evict it too. Connected to post_save/post_delete of
+    customer.UserProfile in CoreConfig.ready().
+    
+    Args:
+        sender: UserProfile model class
+        instance: UserProfile instance that changed
+        **kwargs: Additional signal arguments
+    """
+    invalidate_cached_users([instance.user_id])
 
 
 class UsernameOrEmailBackend(BaseBackend):
@@ -41,28 +257,23 @@ class UsernameOrEmailBackend(BaseBackend):
         Returns:
             User: Authenticated user object if credentials are valid, None otherwise
         """
-        User = get_user_model()
-        
         if username is None or password is None:
             return None
         
         # Check if username is an email address
         if '@' in username:
-            # Authenticate using email (case-insensitive)
-            try:
-                user = User.objects.filter(email__iexact=username).first()
-                if user and user.check_password(password) and self.user_can_authenticate(user):
-                    return user
-            except Exception:
-                return None
+            # Authenticate using email (case-insensitive, served by the
+            # LOWER(email) index from core migration 0001)
+            user = _authenticatable_users().alias(
+                email_lower=Lower('email')
+            ).filter(email_lower=username.lower()).first()
         else:
             # Authenticate using username (case-sensitive, Django default)
-            try:
-                user = User.objects.get(username=username)
-                if user.check_password(password) and self.user_can_authenticate(user):
-                    return user
-            except User.DoesNotExist:
-                return None
+            user = _authenticatable_users().filter(username=username).first()
+        
+        # Inactive users and unusable passwords were filtered out in SQL
+        if _check_password_or_dummy(user, password):
+            return user
         
         return None
     
@@ -76,11 +287,8 @@ class UsernameOrEmailBackend(BaseBackend):
         Returns:
             User: User object if found and can authenticate, None otherwise
         """
-        User = get_user_model()
-        
-        try:
-            user = User.objects.get(pk=user_id)
-        except User.DoesNotExist:
+        user = get_cached_user(user_id)
+        if user is None:
             return None
         
         return user if self.user_can_authenticate(user) else None
@@ -116,6 +324,9 @@ class CaseInsensitiveUsernameBackend(BaseBackend):
         """
         Authenticate user using case-insensitive username or email.
         
+        Input containing '@' is treated as an email address, anything else
+        as a username.
+        
         Args:
             request: Django HTTP request object (optional)
             username: Username or email address provided by user
@@ -125,20 +336,23 @@ class CaseInsensitiveUsernameBackend(BaseBackend):
         Returns:
             User: Authenticated user object if credentials are valid, None otherwise
         """
-        User = get_user_model()
-        
         if username is None or password is None:
             return None
         
-        # Try to find user by username (case-insensitive) or email (case-insensitive)
-        try:
-            user = User.objects.get(
-                Q(username__iexact=username) | Q(email__iexact=username)
-            )
-            if user.check_password(password) and self.user_can_authenticate(user):
-                return user
-        except User.DoesNotExist:
-            return None
+        # Probe only the column the input can match instead of OR-ing both,
+        # so the lookup stays a single index seek
+        if '@' in username:
+            # Email (case-insensitive, served by the LOWER(email) index)
+            user = _authenticatable_users().alias(
+                email_lower=Lower('email')
+            ).filter(email_lower=username.lower()).first()
+        else:
+            # Username (case-insensitive)
+            user = _authenticatable_users().filter(username__iexact=username).first()
+        
+        # Inactive users and unusable passwords were filtered out in SQL
+        if _check_password_or_dummy(user, password):
+            return user
         
         return None
     
@@ -152,11 +366,8 @@ class CaseInsensitiveUsernameBackend(BaseBackend):
         Returns:
             User: User object if found and can authenticate, None otherwise
         """
-        User = get_user_model()
-        
-        try:
-            user = User.objects.get(pk=user_id)
-        except User.DoesNotExist:
+        user = get_cached_user(user_id)
+        if user is None:
             return None
         
         return user if self.user_can_authenticate(user) else None
@@ -2,8 +2,42 @@
 Context processors for the core app.
 Provides additional context data to templates across the entire application.
 """
+import logging
+from functools import lru_cache
+
 from django.conf import settings
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _session_timeout_settings():
+    """
+    Read the session timeout settings once; they do not change at runtime.
+    
+    Returns:
+        tuple: (inactivity timeout, warning time) in seconds
+    """
+    return (
+        getattr(settings, 'SESSION_INACTIVITY_TIMEOUT', 1200),
+        getattr(settings, 'SESSION_WARNING_TIME', 120),
+    )
+
+
+@lru_cache(maxsize=None)
+def _site_info():
+    """
+    Build the site information context once; it does not change at runtime.
+    
+    Returns:
+        dict: Site name, domain and URL
+    """
+    return {
+        'site_name': getattr(settings, 'SITE_NAME', 'Food Ordering System'),
+        'site_domain': getattr(settings, 'SITE_DOMAIN', 'localhost'),
+        'site_url': getattr(settings, 'SITE_URL', 'http://localhost:8000'),
+    }
+
 
 def session_timeout_context(request):
     """
@@ -18,25 +52,20 @@ def session_timeout_context(request):
     Returns:
         dict: Context data with session timeout settings
     """
-    context = {}
-    
-    # Debug: Print authentication status
-    print(f"DEBUG: User authenticated: {request.user.is_authenticated}")
-    print(f"DEBUG: Username: {request.user.username if request.user.is_authenticated else 'Anonymous'}")
-    
     # Only add session info for authenticated users
     if request.user.is_authenticated:
-        context.update({
-            'session_timeout': getattr(settings, 'SESSION_INACTIVITY_TIMEOUT', 1200),
-            'warning_time': getattr(settings, 'SESSION_WARNING_TIME', 120),
+        session_timeout, warning_time = _session_timeout_settings()
+        context = {
+            'session_timeout': session_timeout,
+            'warning_time': warning_time,
             'user_authenticated': True,
-        })
-        print(f"DEBUG: Context set with user_authenticated=True")
+        }
     else:
-        context['user_authenticated'] = False
-        print(f"DEBUG: Context set with user_authenticated=False")
+        context = {'user_authenticated': False}
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Session timeout context for %s: %s", request.user.get_username() or 'Anonymous', context)
     
-    print(f"DEBUG: Final context: {context}")
     return context
 
 
@@ -59,23 +88,16 @@ def user_role_context(request):
         <a href="{% url 'restaurant:dashboard' %}">Dashboard</a>
     {% endif %}
     """
-    # Lazy imports to avoid AppRegistryNotReady error
-    from .utils.user_roles import (
-        get_user_role, 
-        is_restaurant_owner, 
-        is_active_restaurant_owner, 
-        can_access_restaurant_dashboard
-    )
+    # Lazy import to avoid AppRegistryNotReady error
+    from .utils.user_roles import get_user_role_flags
     
     user = request.user
     
     if user.is_authenticated:
-        return {
-            'user_role': get_user_role(user),
-            'is_restaurant_owner': is_restaurant_owner(user),
-            'is_active_restaurant_owner': is_active_restaurant_owner(user),
-            'can_access_restaurant_dashboard': can_access_restaurant_dashboard(user),
-        }
+        # Computed once per request, even if several templates are rendered
+        if not hasattr(request, '_user_role_ctx'):
+            request._user_role_ctx = get_user_role_flags(user)
+        return request._user_role_ctx
     
     return {
         'user_role': 'Anonymous',
@@ -98,8 +120,4 @@ def site_info_context(request):
     Returns:
         dict: Context data with site information
     """
-    return {
-        'site_name': getattr(settings, 'SITE_NAME', 'Food Ordering System'),
-        'site_domain': getattr(settings, 'SITE_DOMAIN', 'localhost'),
-        'site_url': getattr(settings, 'SITE_URL', 'http://localhost:8000'),
-    }
+    return _site_info()
@@ -7,28 +7,54 @@ This module provides field-level encryption for sensitive user information inclu
 - Physical addresses
 - Restaurant contact information
 
-Uses Fernet symmetric encryption (AES-128 in CBC mode) from the cryptography library.
-All sensitive data is encrypted at rest in the database and decrypted only when needed.
+Uses AES-256-GCM authenticated encryption from the cryptography library. Values
+written before the switch are Fernet tokens (AES-128-CBC + HMAC) and are still
+decrypted transparently. All sensitive data is encrypted at rest in the database
+and decrypted only when needed.
 """
 
 import base64
 import os
+import threading
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
+from django.db import models
 from django.utils import timezone
 import logging
 
 logger = logging.getLogger('food_ordering.security')
 
+# AES-256-GCM ciphertexts are stored as AESGCM_PREFIX + base64(nonce + ciphertext + tag)
+AESGCM_PREFIX = 'v2:'
+AESGCM_NONCE_SIZE = 12
+
+# HKDF context label separating the AES-256-GCM key from the Fernet key
+AESGCM_KEY_INFO = b'food-ordering:aes-256-gcm:v2'
+
+# Legacy Fernet tokens always start with the base64 of their 0x80 version byte
+FERNET_PREFIX = 'gAAAAA'
+
+# Instance attribute holding {encrypted_field_name: (ciphertext, plaintext)}
+DECRYPTED_VALUES_ATTR = '_decrypted_values'
+
+# Dictionary keys treated as sensitive by the *_user_data/*_restaurant_data helpers
+_USER_SENSITIVE_FIELDS = ('email', 'phone_number', 'address', 'full_name')
+_RESTAURANT_SENSITIVE_FIELDS = ('email', 'phone', 'address')
+
+# Serializes the one-time PBKDF2 key derivation across threads
+_key_derivation_lock = threading.Lock()
+
 
 class EncryptionManager:
     """
     Manages encryption and decryption of sensitive data fields.
     
-    This class provides a centralized encryption service using Fernet symmetric encryption.
+    This class provides a centralized encryption service using AES-256-GCM.
     It automatically generates encryption keys from Django's SECRET_KEY and a custom salt.
     
     Features:
@@ -39,12 +65,16 @@ class EncryptionManager:
     - Support for null/empty values
     
     Security Notes:
-    - Uses PBKDF2 key derivation with 100,000 iterations
-    - Employs AES-128 encryption in CBC mode via Fernet
+    - Uses PBKDF2 key derivation with 100,000 iterations; the AES-256-GCM
+      key is expanded from it with HKDF so it never equals the Fernet key
+    - Employs AES-256-GCM (single-pass AEAD, AES-NI accelerated) with a
+      random 96-bit nonce per value
+    - Legacy Fernet (AES-128-CBC + HMAC) values remain decryptable
     - All encrypted data is base64 encoded for database storage
     """
     
     _fernet = None
+    _aesgcm = None
     _encryption_key = None
     
     @classmethod
@@ -53,10 +83,11 @@ class EncryptionManager:
         Generate or retrieve the encryption key.
         
         Derives a secure encryption key from Django's SECRET_KEY using PBKDF2.
-        The key is cached for performance after first generation.
+        The key is cached for performance after first generation; derivation
+        is guarded by a lock so threads racing on first use share one result.
         
         Returns:
-            bytes: 32-byte encryption key suitable for Fernet
+            bytes: Base64-encoded 32-byte key (Fernet format; HKDF input for AES-256-GCM)
             
         Raises:
             ImproperlyConfigured: If SECRET_KEY is not set or invalid
@@ -64,6 +95,25 @@ class EncryptionManager:
         if cls._encryption_key is not None:
             return cls._encryption_key
         
+        # Double-checked so concurrent first calls derive the key only once
+        with _key_derivation_lock:
+            if cls._encryption_key is None:
+                cls._encryption_key = cls._derive_encryption_key()
+        return cls._encryption_key
+    
+    @classmethod
+    def _derive_encryption_key(cls):
+        """
+        Run the PBKDF2 derivation of the encryption key.
+        
+        Called once per process by _get_encryption_key().
+        
+        Returns:
+            bytes: Base64-encoded 32-byte key
+            
+        Raises:
+            ImproperlyConfigured: If SECRET_KEY is not set or invalid
+        """
         # Get Django's SECRET_KEY
         secret_key = getattr(settings, 'SECRET_KEY', None)
         if not secret_key:
@@ -91,7 +141,6 @@ class EncryptionManager:
             kdf.derive(secret_key.encode('utf-8'))
         )
         
-        cls._encryption_key = key
         logger.info("Encryption key derived successfully")
         return key
     
@@ -108,24 +157,59 @@ class EncryptionManager:
             cls._fernet = Fernet(key)
         return cls._fernet
     
+    @classmethod
+    def _get_aesgcm(cls):
+        """
+        Get or create the AES-256-GCM cipher instance.
+        
+        The key is expanded from the PBKDF2 output with HKDF under its own
+        info label, so the GCM and legacy Fernet ciphers never share a key.
+        
+        Returns:
+            AESGCM: Configured AES-GCM cipher for encryption/decryption
+        """
+        if cls._aesgcm is None:
+            hkdf = HKDF(
+                algorithm=hashes.SHA256(),
+                length=32,  # 32 bytes = 256 bits for AES-256
+                salt=None,
+                info=AESGCM_KEY_INFO,
+            )
+            key = hkdf.derive(base64.urlsafe_b64decode(cls._get_encryption_key()))
+            cls._aesgcm = AESGCM(key)
+        return cls._aesgcm
+    
+    @classmethod
+    def is_encrypted(cls, value):
+        """
+        Check whether a stored value looks like ciphertext from this manager.
+        
+        Args:
+            value (str): Stored field value
+            
+        Returns:
+            bool: True for AES-GCM or legacy Fernet ciphertext
+        """
+        return bool(value) and value.startswith((AESGCM_PREFIX, FERNET_PREFIX))
+    
     @classmethod
     def encrypt(cls, plaintext):
         """
         Encrypt plaintext data.
         
-        Encrypts the provided plaintext using Fernet symmetric encryption.
+        Encrypts the provided plaintext using AES-256-GCM with a fresh nonce.
         Handles None and empty string values gracefully.
         
         Args:
             plaintext (str): The data to encrypt
             
         Returns:
-            str: Base64-encoded encrypted data, or None if input is None/empty
+            str: Prefixed base64-encoded encrypted data, or None if input is None/empty
             
         Example:
             >>> encrypted = EncryptionManager.encrypt("user@example.com")
             >>> print(encrypted)
-            'gAAAAABhX...'  # Base64 encoded ciphertext
+            'v2:q3Jx...'  # Prefixed base64 nonce + ciphertext + tag
         """
         if not plaintext:
             return None
@@ -134,18 +218,19 @@ class EncryptionManager:
             # Convert string to bytes
             plaintext_bytes = str(plaintext).encode('utf-8')
             
-            # Encrypt using Fernet
-            fernet = cls._get_fernet()
-            encrypted_bytes = fernet.encrypt(plaintext_bytes)
+            # Encrypt using AES-256-GCM with a random nonce stored alongside
+            aesgcm = cls._aesgcm or cls._get_aesgcm()
+            nonce = os.urandom(AESGCM_NONCE_SIZE)
+            encrypted_bytes = nonce + aesgcm.encrypt(nonce, plaintext_bytes, None)
             
             # Convert to string for database storage
-            encrypted_str = encrypted_bytes.decode('utf-8')
+            encrypted_str = AESGCM_PREFIX + base64.urlsafe_b64encode(encrypted_bytes).decode('ascii')
             
-            logger.debug(f"Successfully encrypted data (length: {len(plaintext)})")
+            logger.debug("Successfully encrypted data (length: %d)", len(plaintext))
             return encrypted_str
             
         except Exception as e:
-            logger.error(f"Encryption failed: {str(e)}")
+            logger.error("Encryption failed: %s", e)
             raise
     
     @classmethod
@@ -153,7 +238,7 @@ class EncryptionManager:
         """
         Decrypt encrypted data with audit logging.
 
-        Decrypts the provided ciphertext using Fernet symmetric encryption.
+        Decrypts AES-256-GCM ciphertext, or a legacy Fernet token.
         Handles None and empty string values gracefully.
         Logs all decryption operations for GDPR compliance.
 
@@ -167,11 +252,8 @@ class EncryptionManager:
         Returns:
             str: Decrypted plaintext, or None if input is None/empty
 
-        Raises:
-            cryptography.fernet.InvalidToken: If decryption fails (wrong key or corrupted data)
-
         Example:
-            >>> decrypted = EncryptionManager.decrypt("gAAAAABhX...", {
+            >>> decrypted = EncryptionManager.decrypt("v2:q3Jx...", {
             ...     'user_id': 123,
             ...     'field_name': 'email',
             ...     'model_name': 'UserProfile'
@@ -183,29 +265,35 @@ class EncryptionManager:
             return None
 
         try:
-            # Convert string to bytes
-            ciphertext_bytes = ciphertext.encode('utf-8')
-
-            # Decrypt using Fernet
-            fernet = cls._get_fernet()
-            decrypted_bytes = fernet.decrypt(ciphertext_bytes)
+            if ciphertext.startswith(AESGCM_PREFIX):
+                # Decrypt using AES-256-GCM (nonce is stored in front)
+                payload = base64.urlsafe_b64decode(ciphertext[len(AESGCM_PREFIX):])
+                aesgcm = cls._aesgcm or cls._get_aesgcm()
+                decrypted_bytes = aesgcm.decrypt(
+                    payload[:AESGCM_NONCE_SIZE], payload[AESGCM_NONCE_SIZE:], None
+                )
+            else:
+                # Legacy value written with Fernet
+                fernet = cls._fernet or cls._get_fernet()
+                decrypted_bytes = fernet.decrypt(ciphertext.encode('utf-8'))
 
             # Convert back to string
             decrypted_str = decrypted_bytes.decode('utf-8')
 
-            # Log successful decryption with audit context (GDPR Article 30 compliance)
-            audit_info = {
-                'action': 'decrypt_success',
-                'data_length': len(ciphertext),
-                'timestamp': timezone.now().isoformat()
-            }
-            
+            # Log successful decryption with audit context (GDPR Article 30 compliance);
+            # the audit record is only built when there is a context to audit
             if audit_context:
+                audit_info = {
+                    'action': 'decrypt_success',
+                    'data_length': len(ciphertext),
+                    'timestamp': timezone.now().isoformat()
+                }
                 audit_info.update(audit_context)
                 logger.info(
-                    f"Data decrypted successfully - User: {audit_context.get('user_id', 'unknown')}, "
-                    f"Field: {audit_context.get('field_name', 'unknown')}, "
-                    f"Model: {audit_context.get('model_name', 'unknown')}"
+                    "Data decrypted successfully - User: %s, Field: %s, Model: %s",
+                    audit_context.get('user_id', 'unknown'),
+                    audit_context.get('field_name', 'unknown'),
+                    audit_context.get('model_name', 'unknown'),
                 )
             else:
                 logger.debug("Successfully decrypted data")
@@ -214,25 +302,74 @@ class EncryptionManager:
 
         except Exception as e:
             # Log failed decryption attempts for security monitoring
-            audit_info = {
-                'action': 'decrypt_failed',
-                'error': str(e),
-                'timestamp': timezone.now().isoformat()
-            }
-            
             if audit_context:
+                audit_info = {
+                    'action': 'decrypt_failed',
+                    'error': str(e),
+                    'timestamp': timezone.now().isoformat()
+                }
                 audit_info.update(audit_context)
                 logger.warning(
-                    f"Decryption failed - User: {audit_context.get('user_id', 'unknown')}, "
-                    f"Field: {audit_context.get('field_name', 'unknown')}, "
-                    f"Error: {str(e)}"
+                    "Decryption failed - User: %s, Field: %s, Error: %s",
+                    audit_context.get('user_id', 'unknown'),
+                    audit_context.get('field_name', 'unknown'),
+                    e,
                 )
             else:
-                logger.error(f"Decryption failed: {str(e)}")
+                logger.error("Decryption failed: %s", e)
             
             # Return None instead of raising to handle corrupted data gracefully
             return None
     
+    @classmethod
+    def decrypt_many(cls, ciphertexts):
+        """
+        Decrypt a batch of values in one pass.
+        
+        Fast path for bulk decryption: the cipher handles are resolved once
+        and bound locally, and no per-value audit record is built. Values
+        that fail to decrypt become None, with one aggregated error logged
+        for the batch.
+        
+        Args:
+            ciphertexts (iterable): Encrypted values (None/empty allowed)
+            
+        Returns:
+            list: Decrypted plaintexts (or None) in the same order
+            
+        Example:
+            >>> EncryptionManager.decrypt_many(['v2:q3Jx...', None])
+            ['user@example.com', None]
+        """
+        aes_decrypt = (cls._aesgcm or cls._get_aesgcm()).decrypt
+        fernet_decrypt = (cls._fernet or cls._get_fernet()).decrypt
+        b64decode = base64.urlsafe_b64decode
+        prefix_length = len(AESGCM_PREFIX)
+        
+        results = []
+        failures = 0
+        for ciphertext in ciphertexts:
+            if not ciphertext:
+                results.append(None)
+                continue
+            try:
+                if ciphertext.startswith(AESGCM_PREFIX):
+                    payload = b64decode(ciphertext[prefix_length:])
+                    decrypted_bytes = aes_decrypt(
+                        payload[:AESGCM_NONCE_SIZE], payload[AESGCM_NONCE_SIZE:], None
+                    )
+                else:
+                    decrypted_bytes = fernet_decrypt(ciphertext.encode('utf-8'))
+                results.append(decrypted_bytes.decode('utf-8'))
+            except Exception:
+                failures += 1
+                results.append(None)
+        
+        if failures:
+            logger.error("Batch decryption failed for %d of %d values", failures, len(results))
+        
+        return results
+    
     @classmethod
     def encrypt_dict(cls, data_dict, fields_to_encrypt):
         """
@@ -283,13 +420,117 @@ class EncryptionManager:
         """
         decrypted_dict = data_dict.copy()
         
-        for field in fields_to_decrypt:
-            if field in decrypted_dict and decrypted_dict[field]:
-                decrypted_dict[field] = cls.decrypt(decrypted_dict[field])
+        fields = [
+            field for field in fields_to_decrypt
+            if field in decrypted_dict and decrypted_dict[field]
+        ]
+        plaintexts = cls.decrypt_many(decrypted_dict[field] for field in fields)
+        decrypted_dict.update(zip(fields, plaintexts))
         
         return decrypted_dict
 
 
+def _reset_after_fork():
+    """
+    Give a forked worker its own cipher objects and lock.
+    
+    The derived key is inherited (so the PBKDF2 cost is not paid again),
+    but the cipher instances are rebuilt lazily in each child, and the lock
+    is replaced in case another thread held it at fork time.
+    """
+    global _key_derivation_lock
+    _key_derivation_lock = threading.Lock()
+    EncryptionManager._fernet = None
+    EncryptionManager._aesgcm = None
+
+
+# os.register_at_fork is POSIX-only
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def decrypt_field(instance, encrypted_field_name):
+    """
+    Decrypt one encrypted column of a model instance.
+    
+    The plaintext is remembered on the instance next to the ciphertext it
+    came from, so repeated reads (e.g. the same field used several times in
+    a template) decrypt only once. Assigning a new value changes the
+    ciphertext, which invalidates the remembered plaintext.
+    
+    Args:
+        instance: Model instance
+        encrypted_field_name (str): Name of the field storing encrypted data
+        
+    Returns:
+        str: Decrypted value, or None if empty or undecryptable
+    """
+    ciphertext = getattr(instance, encrypted_field_name, None)
+    decrypted_values = instance.__dict__.setdefault(DECRYPTED_VALUES_ATTR, {})
+    cached = decrypted_values.get(encrypted_field_name)
+    if cached is not None and cached[0] == ciphertext:
+        return cached[1]
+    
+    plaintext = EncryptionManager.decrypt(ciphertext)
+    decrypted_values[encrypted_field_name] = (ciphertext, plaintext)
+    return plaintext
+
+
+def preload_decrypted(instances, *fields):
+    """
+    Batch-decrypt encrypted fields for many model instances at once.
+    
+    Each field is decrypted column-wise with a single
+    EncryptionManager.decrypt_many() call, and the plaintext is attached to
+    the instances so later property/descriptor reads skip decryption.
+    
+    Args:
+        instances (iterable): Model instances (e.g. a queryset)
+        *fields (str): Plaintext field names, e.g. 'phone' for '_phone_encrypted'
+        
+    Returns:
+        list: The instances, in order
+        
+    Example:
+        >>> restaurants = preload_decrypted(Restaurant.objects.all(), 'address', 'phone')
+    """
+    instances = list(instances)
+    
+    for field in fields:
+        encrypted_field_name = f'_{field}_encrypted'
+        ciphertexts = [getattr(instance, encrypted_field_name) for instance in instances]
+        plaintexts = EncryptionManager.decrypt_many(ciphertexts)
+        for instance, ciphertext, plaintext in zip(instances, ciphertexts, plaintexts):
+            instance.__dict__.setdefault(DECRYPTED_VALUES_ATTR, {})[encrypted_field_name] = (
+                ciphertext, plaintext
+            )
+    
+    return instances
+
+
+class EncryptedQuerySet(models.QuerySet):
+    """
+    QuerySet for models with encrypted fields.
+    
+    Usage in Django models:
+        objects = EncryptedQuerySet.as_manager()
+    """
+    
+    def with_decrypted(self, *fields):
+        """
+        Evaluate the queryset with the given encrypted fields batch-decrypted.
+        
+        Args:
+            *fields (str): Plaintext field names to decrypt
+            
+        Returns:
+            list: Model instances with plaintext preloaded
+            
+        Example:
+            >>> profiles = UserProfile.objects.filter(city='Pune').with_decrypted('full_name')
+        """
+        return preload_decrypted(self, *fields)
+
 class EncryptedField:
     """
     Descriptor for transparent field-level encryption in Django models.
@@ -309,6 +550,8 @@ class EncryptedField:
     - Minimal code changes required
     """
     
+    __slots__ = ('encrypted_field_name',)
+    
     def __init__(self, encrypted_field_name):
         """
         Initialize the encrypted field descriptor.
@@ -332,11 +575,8 @@ class EncryptedField:
         if instance is None:
             return self
         
-        # Get encrypted value from database field
-        encrypted_value = getattr(instance, self.encrypted_field_name, None)
-        
-        # Decrypt and return
-        return EncryptionManager.decrypt(encrypted_value)
+        # Decrypt the database field (or reuse bulk-decrypted plaintext)
+        return decrypt_field(instance, self.encrypted_field_name)
     
     def __set__(self, instance, value):
         """
@@ -374,8 +614,7 @@ def encrypt_user_data(user_data):
         ... }
         >>> encrypted = encrypt_user_data(data)
     """
-    sensitive_fields = ['email', 'phone_number', 'address', 'full_name']
-    return EncryptionManager.encrypt_dict(user_data, sensitive_fields)
+    return EncryptionManager.encrypt_dict(user_data, _USER_SENSITIVE_FIELDS)
 
 
 def decrypt_user_data(user_data):
@@ -396,8 +635,7 @@ def decrypt_user_data(user_data):
         >>> print(decrypted['email'])
         'john@example.com'
     """
-    sensitive_fields = ['email', 'phone_number', 'address', 'full_name']
-    return EncryptionManager.decrypt_dict(user_data, sensitive_fields)
+    return EncryptionManager.decrypt_dict(user_data, _USER_SENSITIVE_FIELDS)
 
 
 def encrypt_restaurant_data(restaurant_data):
@@ -412,8 +650,7 @@ def encrypt_restaurant_data(restaurant_data):
     Returns:
         dict: Dictionary with sensitive fields encrypted
     """
-    sensitive_fields = ['email', 'phone', 'address']
-    return EncryptionManager.encrypt_dict(restaurant_data, sensitive_fields)
+    return EncryptionManager.encrypt_dict(restaurant_data, _RESTAURANT_SENSITIVE_FIELDS)
 
 
 def decrypt_restaurant_data(restaurant_data):
@@ -428,5 +665,4 @@ def decrypt_restaurant_data(restaurant_data):
     Returns:
         dict: Dictionary with sensitive fields decrypted
     """
-    sensitive_fields = ['email', 'phone', 'address']
-    return EncryptionManager.decrypt_dict(restaurant_data, sensitive_fields)
+    return EncryptionManager.decrypt_dict(restaurant_data, _RESTAURANT_SENSITIVE_FIELDS)
@@ -2,12 +2,91 @@
 Core forms for the food ordering system.
 Contains unified login and registration forms for role-based authentication.
 """
+import logging
+import re
+
 from django import forms
 from django.contrib.auth.forms import AuthenticationForm
-from django.contrib.auth.models import User, Group
+from django.contrib.auth.models import User
 from django.core.validators import RegexValidator
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
 from restaurant.models import Restaurant
 from customer.models import UserProfile
+from .utils.user_roles import get_group_id
+
+logger = logging.getLogger(__name__)
+
+# Validation patterns, compiled once at import
+_PASSWORD_RE = re.compile(r'^(?=.*[A-Za-z])(?=.*\d)[A-Za-z\d@$!%*#?&]{8,}$')
+_PHONE_RE = re.compile(r'^\+?1?\d{9,15}$')
+_RESTAURANT_NAME_RE = re.compile(r"^[a-zA-Z0-9\s\-'&.]+$")
+_NONDIGIT_RE = re.compile(r'\D')
+
+# Tailwind classes shared by every text-style input on these forms
+_INPUT_CLASS = (
+    'w-full px-4 py-3 rounded-lg border border-gray-300 focus:border-gray-900 '
+    'focus:ring-2 focus:ring-gray-200 transition duration-200'
+)
+_LOGIN_INPUT_CLASS = _INPUT_CLASS + ' focus:outline-none focus:ring-2'
+
+
+def _input_attrs(placeholder=None, css_class=_INPUT_CLASS, **extra):
+    """
+    Build widget attrs with the shared input styling.
+    
+    Args:
+        placeholder (str): Optional placeholder text
+        css_class (str): CSS classes for the input
+        **extra: Additional HTML attributes (e.g. rows=3, type='time')
+        
+    Returns:
+        dict: Widget attrs
+    """
+    attrs = {'class': css_class}
+    if placeholder is not None:
+        attrs['placeholder'] = placeholder
+    attrs.update(extra)
+    return attrs
+
+
+def _add_account_conflict_errors(form, cleaned_data):
+    """
+    Flag an already-registered username or email on a registration form.
+    
+    Both checks run as a single query; matching rows are then attributed to
+    the username and/or email field. The email is compared via LOWER(email)
+    so the lookup can use the auth_user_email_lower_idx index.
+    
+    Args:
+        form: Registration form being cleaned
+        cleaned_data (dict): Data returned by the form's super().clean()
+    """
+    username = cleaned_data.get('username')
+    email = cleaned_data.get('email')
+    
+    query = Q()
+    if username:
+        query |= Q(username=username)
+    if email:
+        query |= Q(email_lower=email.lower())
+    if not query:
+        return
+    
+    rows = User.objects.alias(email_lower=Lower('email')).filter(query).values_list('username', 'email')
+    
+    username_taken = email_taken = False
+    for row_username, row_email in rows:
+        if row_username == username:
+            username_taken = True
+        if email and row_email.lower() == email.lower():
+            email_taken = True
+    
+    if username_taken:
+        form.add_error('username', 'This username is already taken. Please choose another.')
+    if email_taken:
+        form.add_error('email', 'This email is already registered. Please use another email.')
 
 
 class UnifiedLoginForm(AuthenticationForm):
@@ -29,20 +108,20 @@ class UnifiedLoginForm(AuthenticationForm):
         remember_me: Optional checkbox for extended session
     """
     username = forms.CharField(
-        widget=forms.TextInput(attrs={
-            'class': 'w-full px-4 py-3 rounded-lg border border-gray-300 focus:border-gray-900 focus:ring-2 focus:ring-gray-200 transition duration-200',
-            'placeholder': 'Enter your username or email',
-            'autofocus': True,
-            'autocomplete': 'username'
-        })
+        widget=forms.TextInput(attrs=_input_attrs(
+            'Enter your username or email',
+            css_class=_LOGIN_INPUT_CLASS,
+            autofocus=True,
+            autocomplete='username'
+        ))
     )
     
     password = forms.CharField(
-        widget=forms.PasswordInput(attrs={
-            'class': 'w-full px-4 py-3 rounded-lg border border-gray-300 focus:border-gray-900 focus:ring-2 focus:ring-gray-200 transition duration-200',
-            'placeholder': 'Enter your password',
-            'autocomplete': 'current-password'
-        })
+        widget=forms.PasswordInput(attrs=_input_attrs(
+            'Enter your password',
+            css_class=_LOGIN_INPUT_CLASS,
+            autocomplete='current-password'
+        ))
     )
     
     remember_me = forms.BooleanField(
@@ -67,13 +146,6 @@ class UnifiedLoginForm(AuthenticationForm):
             'inactive': 'Your account has been deactivated. Please contact support for assistance.',
             'locked_out': 'Too many failed login attempts. Please try again later.',
         })
-        
-        # Apply consistent styling to all form fields
-        for field_name, field in self.fields.items():
-            if field_name != 'remember_me':
-                field.widget.attrs.update({
-                    'class': field.widget.attrs.get('class', '') + ' focus:outline-none focus:ring-2',
-                })
     
     def confirm_login_allowed(self, user):
         """
@@ -94,14 +166,10 @@ class UnifiedLoginForm(AuthenticationForm):
                 code='inactive'
             )
         
-        # Check if user has required profile information (non-blocking)
-        try:
-            from customer.models import UserProfile
-            profile = UserProfile.objects.get(user=user)
-            if not profile.phone_number:
-                # Warning but allow login - they'll be prompted to complete profile
-                pass
-        except UserProfile.DoesNotExist:
+        # Make sure the user has a profile (non-blocking). The authentication
+        # backend joins the profile into its lookup, so this needs no query;
+        # users with incomplete profiles are prompted to complete them later.
+        if getattr(user, 'profile', None) is None:
             # Create missing profile automatically (non-blocking)
             try:
                 UserProfile.objects.create(user=user, full_name=user.username)
@@ -119,25 +187,26 @@ class UnifiedLoginForm(AuthenticationForm):
         Returns:
             str: URL to redirect user based on their role and status
         """
-        # Debug logging
-        print(f"DEBUG get_redirect_url: User={user.username}")
-        print(f"DEBUG get_redirect_url: Has restaurants={user.restaurants.exists()}")
-        if user.restaurants.exists():
-            print(f"DEBUG get_redirect_url: Restaurant count={user.restaurants.count()}")
-        
-        # Check if user is a restaurant owner (matching dropdown logic)
-        if user.restaurants.exists():
-            print(f"DEBUG get_redirect_url: Returning restaurant:dashboard")
-            return 'restaurant:dashboard'
-        
-        # Check if user is staff/admin
-        if user.is_staff or user.is_superuser:
-            print(f"DEBUG get_redirect_url: Returning admin:index")
-            return 'admin:index'
-        
-        # Default to customer home
-        print(f"DEBUG get_redirect_url: Returning customer:home")
-        return 'customer:home'
+        # Check if user is a restaurant owner (matching dropdown logic);
+        # one EXISTS query, reused for logging and the decision below
+        has_restaurants = user.restaurants.exists()
+        
+        if has_restaurants:
+            redirect_url = 'restaurant:dashboard'
+        elif user.is_staff or user.is_superuser:
+            # Staff/admin users go to the admin site
+            redirect_url = 'admin:index'
+        else:
+            # Default to customer home
+            redirect_url = 'customer:home'
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "get_redirect_url: user=%s has_restaurants=%s redirect=%s",
+                user.username, has_restaurants, redirect_url
+            )
+        
+        return redirect_url
 
 
 class UnifiedRegistrationForm(forms.ModelForm):
@@ -162,32 +231,23 @@ class UnifiedRegistrationForm(forms.ModelForm):
     """
     # User Account Fields
     password = forms.CharField(
-        widget=forms.PasswordInput(attrs={
-            'class': 'w-full px-4 py-3 rounded-lg border border-gray-300 focus:border-gray-900 focus:ring-2 focus:ring-gray-200 transition duration-200',
-            'placeholder': 'Create a strong password'
-        }),
+        widget=forms.PasswordInput(attrs=_input_attrs('Create a strong password')),
         validators=[
             RegexValidator(
-                regex=r'^(?=.*[A-Za-z])(?=.*\d)[A-Za-z\d@$!%*#?&]{8,}$',
+                regex=_PASSWORD_RE,
                 message='Password must be at least 8 characters long and contain both letters and numbers.'
             )
         ]
     )
     
     password_confirm = forms.CharField(
-        widget=forms.PasswordInput(attrs={
-            'class': 'w-full px-4 py-3 rounded-lg border border-gray-300 focus:border-gray-900 focus:ring-2 focus:ring-gray-200 transition duration-200',
-            'placeholder': 'Confirm your password'
-        })
+        widget=forms.PasswordInput(attrs=_input_attrs('Confirm your password'))
     )
     
     # Profile Information Fields
     full_name = forms.CharField(
         max_length=100,
-        widget=forms.TextInput(attrs={
-            'class': 'w-full px-4 py-3 rounded-lg border border-gray-300 focus:border-gray-900 focus:ring-2 focus:ring-gray-200 transition duration-200',
-            'placeholder': 'Enter your full name'
-        }),
+        widget=forms.TextInput(attrs=_input_attrs('Enter your full name')),
         help_text='This will be used for delivery and order personalization'
     )
     
@@ -195,93 +255,46 @@ class UnifiedRegistrationForm(forms.ModelForm):
         max_length=20,
         validators=[
             RegexValidator(
-                regex=r'^\+?1?\d{9,15}$',
+                regex=_PHONE_RE,
                 message='Phone number must be entered in the format: +999999999. Up to 15 digits allowed.'
             )
         ],
-        widget=forms.TextInput(attrs={
-            'class': 'w-full px-4 py-3 rounded-lg border border-gray-300 focus:border-gray-900 focus:ring-2 focus:ring-gray-200 transition duration-200',
-            'placeholder': '+1234567890'
-        }),
+        widget=forms.TextInput(attrs=_input_attrs('+1234567890')),
         help_text='Required for order notifications and delivery contact'
     )
     
     # Optional Address Fields
     address = forms.CharField(
         required=False,
-        widget=forms.Textarea(attrs={
-            'class': 'w-full px-4 py-3 rounded-lg border border-gray-300 focus:border-gray-900 focus:ring-2 focus:ring-gray-200 transition duration-200',
-            'placeholder': 'Street address (optional - can be added during checkout)',
-            'rows': 2
-        })
+        widget=forms.Textarea(attrs=_input_attrs('Street address (optional - can be added during checkout)', rows=2))
     )
     
     city = forms.CharField(
         max_length=100,
         required=False,
-        widget=forms.TextInput(attrs={
-            'class': 'w-full px-4 py-3 rounded-lg border border-gray-300 focus:border-gray-900 focus:ring-2 focus:ring-gray-200 transition duration-200',
-            'placeholder': 'City (optional)'
-        })
+        widget=forms.TextInput(attrs=_input_attrs('City (optional)'))
     )
     
     postal_code = forms.CharField(
         max_length=20,
         required=False,
-        widget=forms.TextInput(attrs={
-            'class': 'w-full px-4 py-3 rounded-lg border border-gray-300 focus:border-gray-900 focus:ring-2 focus:ring-gray-200 transition duration-200',
-            'placeholder': 'Postal/ZIP code (optional)'
-        })
+        widget=forms.TextInput(attrs=_input_attrs('Postal/ZIP code (optional)'))
     )
     
     class Meta:
         model = User
         fields = ['username', 'email']
         widgets = {
-            'username': forms.TextInput(attrs={
-                'class': 'w-full px-4 py-3 rounded-lg border border-gray-300 focus:border-gray-900 focus:ring-2 focus:ring-gray-200 transition duration-200',
-                'placeholder': 'Choose a unique username'
-            }),
-            'email': forms.EmailInput(attrs={
-                'class': 'w-full px-4 py-3 rounded-lg border border-gray-300 focus:border-gray-900 focus:ring-2 focus:ring-gray-200 transition duration-200',
-                'placeholder': 'Enter your email address'
-            })
+            'username': forms.TextInput(attrs=_input_attrs('Choose a unique username')),
+            'email': forms.EmailInput(attrs=_input_attrs('Enter your email address'))
         }
     
-    def clean_username(self):
-        """
-        Validate username uniqueness and format.
-        
-        Returns:
-            str: Validated username
-            
-        Raises:
-            forms.ValidationError: If username is taken or invalid
-        """
-        username = self.cleaned_data.get('username')
-        if User.objects.filter(username=username).exists():
-            raise forms.ValidationError('This username is already taken. Please choose another.')
-        return username
-    
-    def clean_email(self):
-        """
-        Validate email uniqueness.
-        
-        Returns:
-            str: Validated email
-            
-        Raises:
-            forms.ValidationError: If email is already registered
-        """
-        email = self.cleaned_data.get('email')
-        if User.objects.filter(email__iexact=email).exists():
-            raise forms.ValidationError('This email is already registered. Please use another email.')
-        return email
-    
     def clean(self):
         """
         Validate form-wide dependencies.
         
+        Checks username and email uniqueness together in one query.
+        
         Returns:
             dict: Cleaned form data
             
@@ -289,6 +302,7 @@ class UnifiedRegistrationForm(forms.ModelForm):
             forms.ValidationError: If passwords don't match
         """
         cleaned_data = super().clean()
+        _add_account_conflict_errors(self, cleaned_data)
         password = cleaned_data.get('password')
         password_confirm = cleaned_data.get('password_confirm')
         
@@ -304,6 +318,9 @@ class UnifiedRegistrationForm(forms.ModelForm):
         Creates both the User account and UserProfile with the provided
         information. Assigns the user to the Customer group.
         
+        The password is hashed exactly once, by set_password(), and the user
+        is written with a single save().
+        
         Args:
             commit (bool): Whether to save to database immediately
             
@@ -315,20 +332,24 @@ class UnifiedRegistrationForm(forms.ModelForm):
         user.set_password(self.cleaned_data['password'])
         
         if commit:
-            user.save()
-            
-            # Create or update UserProfile
-            profile, created = UserProfile.objects.get_or_create(user=user)
-            profile.full_name = self.cleaned_data['full_name']
-            profile.phone_number = self.cleaned_data['phone_number']
-            profile.address = self.cleaned_data.get('address', '')
-            profile.city = self.cleaned_data.get('city', '')
-            profile.postal_code = self.cleaned_data.get('postal_code', '')
-            profile.save()
-            
-            # Assign to Customer group
-            customer_group, _ = Group.objects.get_or_create(name='Customer')
-            user.groups.add(customer_group)
+            # User, profile and group membership are created all-or-nothing
+            with transaction.atomic():
+                user.save()
+                
+                # Create or update UserProfile
+                UserProfile.objects.update_or_create(
+                    user=user,
+                    defaults={
+                        'full_name': self.cleaned_data['full_name'],
+                        'phone_number': self.cleaned_data['phone_number'],
+                        'address': self.cleaned_data.get('address', ''),
+                        'city': self.cleaned_data.get('city', ''),
+                        'postal_code': self.cleaned_data.get('postal_code', ''),
+                    }
+                )
+                
+                # Assign to Customer group (cached group ID, no lookup query)
+                user.groups.add(get_group_id('Customer'))
         
         return user
 
@@ -348,73 +369,47 @@ class RestaurantRegistrationForm(forms.ModelForm):
     """
     # User Account Fields
     username = forms.CharField(
-        widget=forms.TextInput(attrs={
-            'class': 'w-full px-4 py-3 rounded-lg border border-gray-300 focus:border-gray-900 focus:ring-2 focus:ring-gray-200 transition duration-200',
-            'placeholder': 'Choose a username for your account'
-        })
+        widget=forms.TextInput(attrs=_input_attrs('Choose a username for your account'))
     )
     
     email = forms.EmailField(
-        widget=forms.EmailInput(attrs={
-            'class': 'w-full px-4 py-3 rounded-lg border border-gray-300 focus:border-gray-900 focus:ring-2 focus:ring-gray-200 transition duration-200',
-            'placeholder': 'Enter your email address'
-        })
+        widget=forms.EmailInput(attrs=_input_attrs('Enter your email address'))
     )
     
     password = forms.CharField(
-        widget=forms.PasswordInput(attrs={
-            'class': 'w-full px-4 py-3 rounded-lg border border-gray-300 focus:border-gray-900 focus:ring-2 focus:ring-gray-200 transition duration-200',
-            'placeholder': 'Create a strong password'
-        }),
+        widget=forms.PasswordInput(attrs=_input_attrs('Create a strong password')),
         validators=[
             RegexValidator(
-                regex=r'^(?=.*[A-Za-z])(?=.*\d)[A-Za-z\d@$!%*#?&]{8,}$',
+                regex=_PASSWORD_RE,
                 message='Password must be at least 8 characters long and contain both letters and numbers.'
             )
         ]
     )
     
     password_confirm = forms.CharField(
-        widget=forms.PasswordInput(attrs={
-            'class': 'w-full px-4 py-3 rounded-lg border border-gray-300 focus:border-gray-900 focus:ring-2 focus:ring-gray-200 transition duration-200',
-            'placeholder': 'Confirm your password'
-        })
+        widget=forms.PasswordInput(attrs=_input_attrs('Confirm your password'))
     )
     
     # Restaurant Information Fields
     restaurant_name = forms.CharField(
         max_length=200,
-        widget=forms.TextInput(attrs={
-            'class': 'w-full px-4 py-3 rounded-lg border border-gray-300 focus:border-gray-900 focus:ring-2 focus:ring-gray-200 transition duration-200',
-            'placeholder': 'Enter your restaurant name'
-        })
+        widget=forms.TextInput(attrs=_input_attrs('Enter your restaurant name'))
     )
     
     description = forms.CharField(
-        widget=forms.Textarea(attrs={
-            'class': 'w-full px-4 py-3 rounded-lg border border-gray-300 focus:border-gray-900 focus:ring-2 focus:ring-gray-200 transition duration-200',
-            'placeholder': 'Describe your restaurant, specialties, and what makes you unique...',
-            'rows': 4
-        })
+        widget=forms.Textarea(attrs=_input_attrs('Describe your restaurant, specialties, and what makes you unique...', rows=4))
     )
     
     address = forms.CharField(
-        widget=forms.Textarea(attrs={
-            'class': 'w-full px-4 py-3 rounded-lg border border-gray-300 focus:border-gray-900 focus:ring-2 focus:ring-gray-200 transition duration-200',
-            'placeholder': 'Enter your restaurant address',
-            'rows': 3
-        })
+        widget=forms.Textarea(attrs=_input_attrs('Enter your restaurant address', rows=3))
     )
     
     phone = forms.CharField(
         max_length=20,
-        widget=forms.TextInput(attrs={
-            'class': 'w-full px-4 py-3 rounded-lg border border-gray-300 focus:border-gray-900 focus:ring-2 focus:ring-gray-200 transition duration-200',
-            'placeholder': 'Enter your contact phone number'
-        }),
+        widget=forms.TextInput(attrs=_input_attrs('Enter your contact phone number')),
         validators=[
             RegexValidator(
-                regex=r'^\+?1?\d{9,15}$',
+                regex=_PHONE_RE,
                 message='Please enter a valid phone number.'
             )
         ]
@@ -422,44 +417,29 @@ class RestaurantRegistrationForm(forms.ModelForm):
     
     restaurant_email = forms.EmailField(
         required=False,
-        widget=forms.EmailInput(attrs={
-            'class': 'w-full px-4 py-3 rounded-lg border border-gray-300 focus:border-gray-900 focus:ring-2 focus:ring-gray-200 transition duration-200',
-            'placeholder': 'Restaurant contact email (optional)'
-        })
+        widget=forms.EmailInput(attrs=_input_attrs('Restaurant contact email (optional)'))
     )
     
     cuisine_type = forms.ChoiceField(
         choices=Restaurant.CUISINE_CHOICES,
-        widget=forms.Select(attrs={
-            'class': 'w-full px-4 py-3 rounded-lg border border-gray-300 focus:border-gray-900 focus:ring-2 focus:ring-gray-200 transition duration-200'
-        }),
+        widget=forms.Select(attrs=_input_attrs()),
         initial='other'
     )
     
     opening_time = forms.TimeField(
-        widget=forms.TimeInput(attrs={
-            'class': 'w-full px-4 py-3 rounded-lg border border-gray-300 focus:border-gray-900 focus:ring-2 focus:ring-gray-200 transition duration-200',
-            'type': 'time'
-        }),
+        widget=forms.TimeInput(attrs=_input_attrs(type='time')),
         initial='09:00'
     )
     
     closing_time = forms.TimeField(
-        widget=forms.TimeInput(attrs={
-            'class': 'w-full px-4 py-3 rounded-lg border border-gray-300 focus:border-gray-900 focus:ring-2 focus:ring-gray-200 transition duration-200',
-            'type': 'time'
-        }),
+        widget=forms.TimeInput(attrs=_input_attrs(type='time')),
         initial='22:00'
     )
     
     minimum_order = forms.DecimalField(
         max_digits=10,
         decimal_places=2,
-        widget=forms.NumberInput(attrs={
-            'class': 'w-full px-4 py-3 rounded-lg border border-gray-300 focus:border-gray-900 focus:ring-2 focus:ring-gray-200 transition duration-200',
-            'placeholder': '0.00',
-            'step': '0.01'
-        }),
+        widget=forms.NumberInput(attrs=_input_attrs('0.00', step='0.01')),
         initial=0.00,
         help_text='Minimum order amount in rupees'
     )
@@ -467,20 +447,14 @@ class RestaurantRegistrationForm(forms.ModelForm):
     delivery_fee = forms.DecimalField(
         max_digits=10,
         decimal_places=2,
-        widget=forms.NumberInput(attrs={
-            'class': 'w-full px-4 py-3 rounded-lg border border-gray-300 focus:border-gray-900 focus:ring-2 focus:ring-gray-200 transition duration-200',
-            'placeholder': '0.00',
-            'step': '0.01'
-        }),
+        widget=forms.NumberInput(attrs=_input_attrs('0.00', step='0.01')),
         initial=0.00,
         help_text='Delivery charge in rupees'
     )
     
     image = forms.ImageField(
         required=False,
-        widget=forms.FileInput(attrs={
-            'class': 'w-full px-4 py-3 rounded-lg border border-gray-300 focus:border-gray-900 focus:ring-2 focus:ring-gray-200 transition duration-200'
-        }),
+        widget=forms.FileInput(attrs=_input_attrs()),
         help_text='Upload your restaurant logo or cover photo'
     )
     
@@ -488,36 +462,6 @@ class RestaurantRegistrationForm(forms.ModelForm):
         model = Restaurant
         fields = []  # All fields are defined above for custom naming and validation
     
-    def clean_username(self):
-        """
-        Validate username uniqueness.
-        
-        Returns:
-            str: Validated username
-            
-        Raises:
-            forms.ValidationError: If username is taken
-        """
-        username = self.cleaned_data.get('username')
-        if User.objects.filter(username=username).exists():
-            raise forms.ValidationError('This username is already taken. Please choose another.')
-        return username
-    
-    def clean_email(self):
-        """
-        Validate email uniqueness.
-        
-        Returns:
-            str: Validated email
-            
-        Raises:
-            forms.ValidationError: If email is already registered
-        """
-        email = self.cleaned_data.get('email')
-        if User.objects.filter(email__iexact=email).exists():
-            raise forms.ValidationError('This email is already registered. Please use another email.')
-        return email
-    
     def clean_password_confirm(self):
         """
         Validate that password and password confirmation match.
@@ -538,14 +482,15 @@ class RestaurantRegistrationForm(forms.ModelForm):
     
     def clean(self):
         """
-        Perform comprehensive form-wide validation.
+        Perform cross-field validation.
         
-        Validates:
+        Single-field checks (phone, fees, image) live in their clean_<field>
+        methods, so this only runs checks that need several fields or the
+        database:
+        - Username and email uniqueness (one query for both)
         - Business hours (closing time after opening time)
         - Duplicate restaurant names
-        - Phone number format
-        - Minimum order and delivery fee values
-        - Image file size and format
+        - Delivery fee not exceeding the minimum order
         
         Returns:
             dict: Cleaned data
@@ -554,6 +499,7 @@ class RestaurantRegistrationForm(forms.ModelForm):
             forms.ValidationError: If validation fails
         """
         cleaned_data = super().clean()
+        _add_account_conflict_errors(self, cleaned_data)
         
         # Validate business hours
         opening_time = cleaned_data.get('opening_time')
@@ -566,79 +512,41 @@ class RestaurantRegistrationForm(forms.ModelForm):
                     'If your restaurant is open past midnight, please contact support.'
                 )
             
-            # Check if business hours are reasonable (at least 1 hour)
-            from datetime import datetime, timedelta
-            opening_dt = datetime.combine(datetime.today(), opening_time)
-            closing_dt = datetime.combine(datetime.today(), closing_time)
-            hours_diff = (closing_dt - opening_dt).seconds / 3600
+            # Check if business hours are reasonable (at least 1 hour),
+            # comparing seconds since midnight directly
+            open_seconds = opening_time.hour * 3600 + opening_time.minute * 60 + opening_time.second
+            close_seconds = closing_time.hour * 3600 + closing_time.minute * 60 + closing_time.second
             
-            if hours_diff < 1:
+            if close_seconds - open_seconds < 3600:
                 raise forms.ValidationError(
                     'Restaurant must be open for at least 1 hour per day.'
                 )
         
-        # Check for duplicate restaurant names (case-insensitive)
+        # Check for duplicate restaurant names (case-insensitive, served by
+        # the LOWER(name) index)
         restaurant_name = cleaned_data.get('restaurant_name')
         if restaurant_name:
-            from restaurant.models import Restaurant
-            existing_restaurant = Restaurant.objects.filter(
-                name__iexact=restaurant_name.strip()
-            ).first()
+            name_taken = Restaurant.objects.alias(
+                name_lower=Lower('name')
+            ).filter(name_lower=restaurant_name.strip().lower()).exists()
             
-            if existing_restaurant:
+            if name_taken:
                 raise forms.ValidationError(
                     f'A restaurant with the name "{restaurant_name}" already exists. '
                     'Please choose a unique name for your restaurant.'
                 )
         
-        # Validate phone number format (basic validation)
-        phone = cleaned_data.get('phone')
-        if phone:
-            # Remove common separators
-            phone_digits = ''.join(filter(str.isdigit, phone))
-            
-            if len(phone_digits) < 10:
-                raise forms.ValidationError(
-                    'Phone number must contain at least 10 digits.'
-                )
-            
-            if len(phone_digits) > 15:
-                raise forms.ValidationError(
-                    'Phone number is too long. Please enter a valid phone number.'
-                )
-        
-        # Validate minimum order and delivery fee
+        # Minimum order vs delivery fee (negative values are rejected by the
+        # field-level cleaners before this runs)
         minimum_order = cleaned_data.get('minimum_order')
         delivery_fee = cleaned_data.get('delivery_fee')
         
-        if minimum_order is not None and minimum_order < 0:
-            raise forms.ValidationError('Minimum order amount cannot be negative.')
-        
-        if delivery_fee is not None and delivery_fee < 0:
-            raise forms.ValidationError('Delivery fee cannot be negative.')
-        
         if minimum_order and delivery_fee:
             if delivery_fee > minimum_order:
                 raise forms.ValidationError(
                     'Delivery fee should not exceed the minimum order amount.'
                 )
         
-        # Validate image file if provided
-        image = cleaned_data.get('image')
-        if image:
-            # Check file size (max 5MB)
-            if image.size > 5 * 1024 * 1024:  # 5MB in bytes
-                raise forms.ValidationError(
-                    'Image file size must not exceed 5MB. Please upload a smaller image.'
-                )
-            
-            # Check file format
-            allowed_formats = ['image/jpeg', 'image/png', 'image/jpg', 'image/webp']
-            if hasattr(image, 'content_type') and image.content_type not in allowed_formats:
-                raise forms.ValidationError(
-                    'Invalid image format. Please upload a JPEG, PNG, or WebP image.'
-                )
-        
         return cleaned_data
     
     def clean_restaurant_name(self):
@@ -667,8 +575,7 @@ class RestaurantRegistrationForm(forms.ModelForm):
             )
         
         # Check for inappropriate characters
-        import re
-        if not re.match(r'^[a-zA-Z0-9\s\-\'&.]+$', name):
+        if not _RESTAURANT_NAME_RE.match(name):
             raise forms.ValidationError(
                 'Restaurant name can only contain letters, numbers, spaces, hyphens, '
                 'apostrophes, ampersands, and periods.'
@@ -730,6 +637,96 @@ class RestaurantRegistrationForm(forms.ModelForm):
         
         return address
     
+    def clean_phone(self):
+        """
+        Validate the number of digits in the restaurant phone number.
+        
+        Returns:
+            str: Cleaned phone number
+            
+        Raises:
+            forms.ValidationError: If the phone number has too few or too many digits
+        """
+        phone = self.cleaned_data.get('phone')
+        
+        if phone:
+            # Count digits only, ignoring common separators
+            digit_count = len(_NONDIGIT_RE.sub('', phone))
+            
+            if digit_count < 10:
+                raise forms.ValidationError(
+                    'Phone number must contain at least 10 digits.'
+                )
+            
+            if digit_count > 15:
+                raise forms.ValidationError(
+                    'Phone number is too long. Please enter a valid phone number.'
+                )
+        
+        return phone
+    
+    def clean_minimum_order(self):
+        """
+        Validate that the minimum order amount is not negative.
+        
+        Returns:
+            Decimal: Cleaned minimum order amount
+            
+        Raises:
+            forms.ValidationError: If the amount is negative
+        """
+        minimum_order = self.cleaned_data.get('minimum_order')
+        
+        if minimum_order is not None and minimum_order < 0:
+            raise forms.ValidationError('Minimum order amount cannot be negative.')
+        
+        return minimum_order
+    
+    def clean_delivery_fee(self):
+        """
+        Validate that the delivery fee is not negative.
+        
+        Returns:
+            Decimal: Cleaned delivery fee
+            
+        Raises:
+            forms.ValidationError: If the fee is negative
+        """
+        delivery_fee = self.cleaned_data.get('delivery_fee')
+        
+        if delivery_fee is not None and delivery_fee < 0:
+            raise forms.ValidationError('Delivery fee cannot be negative.')
+        
+        return delivery_fee
+    
+    def clean_image(self):
+        """
+        Validate the uploaded restaurant image size and format.
+        
+        Returns:
+            UploadedFile: Cleaned image, or None if no image was uploaded
+            
+        Raises:
+            forms.ValidationError: If the image is larger than 5MB or not a supported format
+        """
+        image = self.cleaned_data.get('image')
+        
+        if image:
+            # Check file size (max 5MB)
+            if image.size > 5 * 1024 * 1024:  # 5MB in bytes
+                raise forms.ValidationError(
+                    'Image file size must not exceed 5MB. Please upload a smaller image.'
+                )
+            
+            # Check file format
+            allowed_formats = ['image/jpeg', 'image/png', 'image/jpg', 'image/webp']
+            if hasattr(image, 'content_type') and image.content_type not in allowed_formats:
+                raise forms.ValidationError(
+                    'Invalid image format. Please upload a JPEG, PNG, or WebP image.'
+                )
+        
+        return image
+    
     def save(self, commit=True):
         """
         Save both the user account and restaurant profile.
@@ -737,40 +734,43 @@ class RestaurantRegistrationForm(forms.ModelForm):
         Creates a User account, assigns them to the Restaurant Owner group,
         and creates a Restaurant profile linked to the user.
         
+        create_user() hashes the password and saves the user in one step;
+        the user must not be saved again here.
+        
         Args:
             commit: Whether to save to database
             
         Returns:
             tuple: (User object, Restaurant object)
         """
-        # Create user account
-        user = User.objects.create_user(
-            username=self.cleaned_data['username'],
-            email=self.cleaned_data['email'],
-            password=self.cleaned_data['password']
-        )
-        
-        # Assign user to Restaurant Owner group
-        restaurant_group = Group.objects.filter(name='Restaurant Owner').first()
-        if restaurant_group:
-            user.groups.add(restaurant_group)
-        
-        # Create restaurant profile
-        restaurant = Restaurant.objects.create(
-            owner=user,
-            name=self.cleaned_data['restaurant_name'],
-            description=self.cleaned_data['description'],
-            address=self.cleaned_data['address'],
-            phone=self.cleaned_data['phone'],
-            email=self.cleaned_data.get('restaurant_email'),
-            cuisine_type=self.cleaned_data['cuisine_type'],
-            opening_time=self.cleaned_data['opening_time'],
-            closing_time=self.cleaned_data['closing_time'],
-            minimum_order=self.cleaned_data['minimum_order'],
-            delivery_fee=self.cleaned_data['delivery_fee'],
-            image=self.cleaned_data.get('image'),
-            is_active=False,  # Set to False until manager approval
-            is_approved=False  # Set to False for pending approval
-        )
+        # User, group membership and restaurant are created all-or-nothing
+        with transaction.atomic():
+            # Create user account
+            user = User.objects.create_user(
+                username=self.cleaned_data['username'],
+                email=self.cleaned_data['email'],
+                password=self.cleaned_data['password']
+            )
+            
+            # Assign user to Restaurant Owner group (cached group ID, no lookup query)
+            user.groups.add(get_group_id('Restaurant Owner'))
+            
+            # Create restaurant profile
+            restaurant = Restaurant.objects.create(
+                owner=user,
+                name=self.cleaned_data['restaurant_name'],
+                description=self.cleaned_data['description'],
+                address=self.cleaned_data['address'],
+                phone=self.cleaned_data['phone'],
+                email=self.cleaned_data.get('restaurant_email'),
+                cuisine_type=self.cleaned_data['cuisine_type'],
+                opening_time=self.cleaned_data['opening_time'],
+                closing_time=self.cleaned_data['closing_time'],
+                minimum_order=self.cleaned_data['minimum_order'],
+                delivery_fee=self.cleaned_data['delivery_fee'],
+                image=self.cleaned_data.get('image'),
+                is_active=False,  # Set to False until manager approval
+                is_approved=False  # Set to False for pending approval
+            )
         
         return user, restaurant
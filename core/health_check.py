@@ -1,38 +1,71 @@
 """
 Health Check View for Food Ordering System
 Provides endpoint for monitoring application health and readiness
+
+The views are deliberately synchronous: the project is served by gunicorn
+through food_ordering.wsgi and every middleware is sync, so an async view
+would be wrapped in async_to_sync on each probe and cost more than it frees.
+Probe cost is kept low instead by remembering a successful database ping
+in-process and serving pre-encoded bodies. Revisit if the deployment moves
+to an ASGI server.
 """
 
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.db import connection
 from django.core.cache import cache
+import json
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+# A successful database ping is reused for a couple of seconds so frequent
+# probes (load balancers, Kubernetes) do not each run a query. The result is
+# kept in a per-process deadline rather than the cache backend (the default
+# cache is per-process LocMem anyway), so a hit costs one clock read.
+HEALTH_DB_CACHE_TIMEOUT = 2  # seconds
+_db_ok_until = 0.0
+
+# Readiness and liveness bodies never change, so they are encoded once at import
+_READY_BODY = json.dumps({
+    'status': 'ready',
+    'message': 'Application is ready to accept requests'
+}).encode()
+_ALIVE_BODY = json.dumps({
+    'status': 'alive',
+    'message': 'Application is running'
+}).encode()
+
 
 def health_check(request):
     """
     Health check endpoint for monitoring and load balancers
     
     Checks:
-    - Database connectivity
+    - Database connectivity (a healthy result is reused for
+      HEALTH_DB_CACHE_TIMEOUT seconds)
     - Application responsiveness
     
     Returns:
         JsonResponse: Health status with HTTP 200 (healthy) or 503 (unhealthy)
     """
+    global _db_ok_until
+    
     health_status = {
         'status': 'healthy',
         'checks': {}
     }
     
-    # Check database connection
+    # Check database connection, skipping the query if it recently succeeded
     try:
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT 1")
+        now = time.monotonic()
+        if now >= _db_ok_until:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            _db_ok_until = now + HEALTH_DB_CACHE_TIMEOUT
         health_status['checks']['database'] = 'ok'
     except Exception as e:
+        _db_ok_until = 0.0
         health_status['status'] = 'unhealthy'
         health_status['checks']['database'] = f'error: {str(e)}'
         logger.error(f"Health check database error: {str(e)}")
@@ -50,12 +83,9 @@ def readiness_check(request):
     Indicates if the application is ready to accept traffic
     
     Returns:
-        JsonResponse: Readiness status
+        HttpResponse: Pre-encoded JSON readiness status
     """
-    return JsonResponse({
-        'status': 'ready',
-        'message': 'Application is ready to accept requests'
-    })
+    return HttpResponse(_READY_BODY, content_type='application/json')
 
 
 def liveness_check(request):
@@ -65,9 +95,6 @@ def liveness_check(request):
     Indicates if the application is alive and running
     
     Returns:
-        JsonResponse: Liveness status
+        HttpResponse: Pre-encoded JSON liveness status
     """
-    return JsonResponse({
-        'status': 'alive',
-        'message': 'Application is running'
-    })
+    return HttpResponse(_ALIVE_BODY, content_type='application/json')
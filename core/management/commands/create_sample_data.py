@@ -3,11 +3,15 @@ Management command to create comprehensive sample data for the food ordering sys
 Creates restaurants, menu items, categories, and users with proper role assignments.
 """
 from django.core.management.base import BaseCommand
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User, Group
+from django.db import transaction
+from django.utils import timezone
 from django.utils.text import slugify
 from decimal import Decimal
 from restaurant.models import Restaurant
 from menu.models import Category, MenuItem
+from customer.models import EmailPreference, UserProfile
 import random
 
 
@@ -21,15 +25,28 @@ class Command(BaseCommand):
     - Menu categories
     - Menu items for each restaurant
     
+    The rows are kept as Python literals rather than a loaddata fixture:
+    restaurant contact fields are encrypted with the deployment's key when
+    the model is built, and a dumped fixture would address rows by primary
+    key, overwriting existing data instead of skipping it.
+    
     Usage:
         python manage.py create_sample_data
     """
     
     help = 'Create comprehensive sample data for the food ordering system'
     
+    # Menu item fields refreshed from the sample data when an item already exists
+    MENU_ITEM_UPDATE_FIELDS = ('description', 'price', 'category_id', 'dietary_type')
+    
+    @transaction.atomic
     def handle(self, *args, **options):
         """
         Execute the command to create sample data.
+        
+        Runs in a single transaction so all rows commit together (one
+        commit instead of one per insert) and a failure leaves no partial
+        sample data behind.
         """
         self.stdout.write('Creating sample data for Food Ordering System...')
         
@@ -84,21 +101,6 @@ class Command(BaseCommand):
             }
         ]
         
-        for owner_data in restaurant_owners:
-            user, created = User.objects.get_or_create(
-                username=owner_data['username'],
-                defaults={
-                    'email': owner_data['email'],
-                    'first_name': owner_data['first_name'],
-                    'last_name': owner_data['last_name']
-                }
-            )
-            if created:
-                user.set_password(owner_data['password'])
-                user.save()
-                user.groups.add(restaurant_owner_group)
-                self.stdout.write(f'  Created restaurant owner: {user.username}')
-        
         # Create customers
         customers = [
             {
@@ -117,20 +119,61 @@ class Command(BaseCommand):
             }
         ]
         
-        for customer_data in customers:
-            user, created = User.objects.get_or_create(
-                username=customer_data['username'],
-                defaults={
-                    'email': customer_data['email'],
-                    'first_name': customer_data['first_name'],
-                    'last_name': customer_data['last_name']
-                }
-            )
-            if created:
-                user.set_password(customer_data['password'])
-                user.save()
-                user.groups.add(customer_group)
-                self.stdout.write(f'  Created customer: {user.username}')
+        # One query for the usernames that already exist, then one insert
+        # for the missing users
+        usernames = [data['username'] for data in restaurant_owners + customers]
+        existing_usernames = set(
+            User.objects.filter(username__in=usernames).values_list('username', flat=True)
+        )
+        
+        # Sample users share a password; hash each distinct password once
+        # (salt included) instead of once per user
+        password_hashes = {}
+        
+        new_users = []
+        for group, label, users_data in (
+            (restaurant_owner_group, 'restaurant owner', restaurant_owners),
+            (customer_group, 'customer', customers),
+        ):
+            for user_data in users_data:
+                if user_data['username'] in existing_usernames:
+                    continue
+                password = user_data['password']
+                if password not in password_hashes:
+                    password_hashes[password] = make_password(password)
+                user = User(
+                    username=user_data['username'],
+                    email=user_data['email'],
+                    first_name=user_data['first_name'],
+                    last_name=user_data['last_name'],
+                    password=password_hashes[password]
+                )
+                new_users.append((user, group, label))
+        
+        User.objects.bulk_create([user for user, _, _ in new_users], batch_size=500)
+        
+        # bulk_create() skips post_save, so create the profile and email
+        # preference rows the User signals would otherwise add
+        UserProfile.objects.bulk_create(
+            [UserProfile(user=user, full_name=user.username) for user, _, _ in new_users],
+            batch_size=500
+        )
+        EmailPreference.objects.bulk_create(
+            [EmailPreference(user=user) for user, _, _ in new_users],
+            batch_size=500
+        )
+        User.groups.through.objects.bulk_create(
+            [
+                User.groups.through(user_id=user.id, group_id=group.id)
+                for user, group, _ in new_users
+            ],
+            ignore_conflicts=True
+        )
+        
+        if new_users:
+            self.stdout.write('\n'.join(
+                f'  Created {label}: {user.username}' for user, _, label in new_users
+            ))
     
     def create_restaurants(self):
         """
@@ -138,9 +181,17 @@ class Command(BaseCommand):
         """
         self.stdout.write('Creating restaurants...')
         
+        # Fetch all owners in one query instead of one get() per restaurant
+        owners = {
+            user.username: user
+            for user in User.objects.filter(
+                username__in=['italian_bistro', 'spice_garden', 'burger_palace']
+            )
+        }
+        
         restaurants_data = [
             {
-                'owner': User.objects.get(username='italian_bistro'),
+                'owner': owners['italian_bistro'],
                 'name': 'Italian Bistro',
                 'description': 'Authentic Italian cuisine with a modern twist. Experience the flavors of Italy with our handmade pasta and wood-fired pizzas.',
                 'address': '123 Main Street, Downtown',
@@ -153,7 +204,7 @@ class Command(BaseCommand):
                 'closing_time': '22:00'
             },
             {
-                'owner': User.objects.get(username='spice_garden'),
+                'owner': owners['spice_garden'],
                 'name': 'Spice Garden',
                 'description': 'Traditional Indian cuisine with aromatic spices and fresh ingredients. Discover the rich flavors of Indian cooking.',
                 'address': '456 Curry Lane, Food District',
@@ -166,7 +217,7 @@ class Command(BaseCommand):
                 'closing_time': '23:00'
             },
             {
-                'owner': User.objects.get(username='burger_palace'),
+                'owner': owners['burger_palace'],
                 'name': 'Burger Palace',
                 'description': 'Gourmet burgers and American classics. Premium quality beef, fresh vegetables, and homemade sauces.',
                 'address': '789 Grill Avenue, Fast Food Zone',
@@ -180,13 +231,24 @@ class Command(BaseCommand):
             }
         ]
         
-        for restaurant_data in restaurants_data:
-            restaurant, created = Restaurant.objects.get_or_create(
-                name=restaurant_data['name'],
-                defaults=restaurant_data
-            )
-            if created:
-                self.stdout.write(f'  Created restaurant: {restaurant.name}')
+        # Restaurant.name is not unique, so look up existing names first
+        # instead of relying on ignore_conflicts
+        existing_names = set(
+            Restaurant.objects.filter(
+                name__in=[data['name'] for data in restaurants_data]
+            ).values_list('name', flat=True)
+        )
+        new_restaurants = [
+            Restaurant(**restaurant_data)
+            for restaurant_data in restaurants_data
+            if restaurant_data['name'] not in existing_names
+        ]
+        Restaurant.objects.bulk_create(new_restaurants, batch_size=1000)
+        
+        if new_restaurants:
+            self.stdout.write('\n'.join(
+                f'  Created restaurant: {restaurant.name}' for restaurant in new_restaurants
+            ))
     
     def create_categories(self):
         """
@@ -207,13 +269,24 @@ class Command(BaseCommand):
             'Indian Specialties'
         ]
         
-        for category_name in categories:
-            category, created = Category.objects.get_or_create(
-                name=category_name,
-                defaults={'is_active': True}
-            )
-            if created:
-                self.stdout.write(f'  Created category: {category.name}')
+        existing_names = set(
+            Category.objects.filter(name__in=categories).values_list('name', flat=True)
+        )
+        # Category.name is unique, so every sample category is upserted in one
+        # INSERT ... ON CONFLICT (name) DO UPDATE; reruns re-apply is_active
+        Category.objects.bulk_create(
+            [Category(name=category_name, is_active=True) for category_name in categories],
+            update_conflicts=True,
+            unique_fields=['name'],
+            update_fields=['is_active'],
+            batch_size=1000
+        )
+        
+        new_names = [name for name in categories if name not in existing_names]
+        if new_names:
+            self.stdout.write('\n'.join(
+                f'  Created category: {name}' for name in new_names
+            ))
     
     def create_menu_items(self):
         """
@@ -221,155 +294,184 @@ class Command(BaseCommand):
         """
         self.stdout.write('Creating menu items...')
         
-        # Get all restaurants and categories
-        restaurants = Restaurant.objects.all()
-        categories = {cat.name: cat for cat in Category.objects.all()}
+        # Get the sample restaurants and all category ids, one query each
+        restaurants = {
+            restaurant.name: restaurant
+            for restaurant in Restaurant.objects.filter(
+                name__in=['Italian Bistro', 'Spice Garden', 'Burger Palace']
+            )
+        }
+        # Only the ids are needed for the FK, so skip building Category instances
+        category_ids = dict(Category.objects.values_list('name', 'id'))
         
         # Menu items for Italian Bistro
-        italian_bistro = restaurants.get(name='Italian Bistro')
+        italian_bistro = restaurants['Italian Bistro']
         italian_items = [
             {
                 'name': 'Bruschetta',
                 'description': 'Toasted bread with tomatoes, garlic, and fresh basil',
                 'price': Decimal('8.99'),
-                'category': categories['Appetizers'],
+                'category_id': category_ids['Appetizers'],
                 'dietary_type': 'veg'
             },
             {
                 'name': 'Caesar Salad',
                 'description': 'Romaine lettuce, parmesan cheese, croutons, and Caesar dressing',
                 'price': Decimal('9.99'),
-                'category': categories['Salads'],
+                'category_id': category_ids['Salads'],
                 'dietary_type': 'veg'
             },
             {
                 'name': 'Spaghetti Carbonara',
                 'description': 'Classic pasta with eggs, bacon, parmesan, and black pepper',
                 'price': Decimal('14.99'),
-                'category': categories['Pasta'],
+                'category_id': category_ids['Pasta'],
                 'dietary_type': 'non_veg'
             },
             {
                 'name': 'Margherita Pizza',
                 'description': 'Fresh mozzarella, tomatoes, and basil on wood-fired dough',
                 'price': Decimal('12.99'),
-                'category': categories['Pizza'],
+                'category_id': category_ids['Pizza'],
                 'dietary_type': 'veg'
             },
             {
                 'name': 'Tiramisu',
                 'description': 'Classic Italian dessert with coffee-soaked ladyfingers and mascarpone',
                 'price': Decimal('6.99'),
-                'category': categories['Desserts'],
+                'category_id': category_ids['Desserts'],
                 'dietary_type': 'veg'
             }
         ]
         
-        for item_data in italian_items:
-            item, created = MenuItem.objects.get_or_create(
-                name=item_data['name'],
-                restaurant=italian_bistro,
-                defaults=item_data
-            )
-            if created:
-                self.stdout.write(f'  Created menu item: {item.name} ({italian_bistro.name})')
-        
         # Menu items for Spice Garden
-        spice_garden = restaurants.get(name='Spice Garden')
+        spice_garden = restaurants['Spice Garden']
         spice_items = [
             {
                 'name': 'Samosa',
                 'description': 'Crispy pastry filled with spiced potatoes and peas',
                 'price': Decimal('7.99'),
-                'category': categories['Appetizers'],
+                'category_id': category_ids['Appetizers'],
                 'dietary_type': 'veg'
             },
             {
                 'name': 'Chicken Tikka Masala',
                 'description': 'Tender chicken in creamy tomato sauce with aromatic spices',
                 'price': Decimal('16.99'),
-                'category': categories['Indian Specialties'],
+                'category_id': category_ids['Indian Specialties'],
                 'dietary_type': 'non_veg'
             },
             {
                 'name': 'Palak Paneer',
                 'description': 'Cottage cheese cubes in creamy spinach sauce',
                 'price': Decimal('14.99'),
-                'category': categories['Indian Specialties'],
+                'category_id': category_ids['Indian Specialties'],
                 'dietary_type': 'veg'
             },
             {
                 'name': 'Naan Bread',
                 'description': 'Traditional Indian flatbread baked in tandoor',
                 'price': Decimal('3.99'),
-                'category': categories['Main Course'],
+                'category_id': category_ids['Main Course'],
                 'dietary_type': 'veg'
             },
             {
                 'name': 'Mango Lassi',
                 'description': 'Sweet yogurt drink with mango pulp',
                 'price': Decimal('4.99'),
-                'category': categories['Beverages'],
+                'category_id': category_ids['Beverages'],
                 'dietary_type': 'veg'
             }
         ]
         
-        for item_data in spice_items:
-            item, created = MenuItem.objects.get_or_create(
-                name=item_data['name'],
-                restaurant=spice_garden,
-                defaults=item_data
-            )
-            if created:
-                self.stdout.write(f'  Created menu item: {item.name} ({spice_garden.name})')
-        
         # Menu items for Burger Palace
-        burger_palace = restaurants.get(name='Burger Palace')
+        burger_palace = restaurants['Burger Palace']
         burger_items = [
             {
                 'name': 'Classic Cheeseburger',
                 'description': 'Beef patty with cheese, lettuce, tomato, and special sauce',
                 'price': Decimal('10.99'),
-                'category': categories['Burgers'],
+                'category_id': category_ids['Burgers'],
                 'dietary_type': 'non_veg'
             },
             {
                 'name': 'BBQ Bacon Burger',
                 'description': 'Beef patty with bacon, BBQ sauce, onion rings, and cheese',
                 'price': Decimal('12.99'),
-                'category': categories['Burgers'],
+                'category_id': category_ids['Burgers'],
                 'dietary_type': 'non_veg'
             },
             {
                 'name': 'Veggie Burger',
                 'description': 'Plant-based patty with fresh vegetables and herbs',
                 'price': Decimal('9.99'),
-                'category': categories['Burgers'],
+                'category_id': category_ids['Burgers'],
                 'dietary_type': 'veg'
             },
             {
                 'name': 'French Fries',
                 'description': 'Crispy golden potato fries with sea salt',
                 'price': Decimal('4.99'),
-                'category': categories['Appetizers'],
+                'category_id': category_ids['Appetizers'],
                 'dietary_type': 'veg'
             },
             {
                 'name': 'Chocolate Milkshake',
                 'description': 'Thick and creamy milkshake with premium chocolate',
                 'price': Decimal('5.99'),
-                'category': categories['Beverages'],
+                'category_id': category_ids['Beverages'],
                 'dietary_type': 'veg'
             }
         ]
         
-        for item_data in burger_items:
-            item, created = MenuItem.objects.get_or_create(
-                name=item_data['name'],
-                restaurant=burger_palace,
-                defaults=item_data
+        # Combine the per-restaurant lists into one keyed by (restaurant_id, name)
+        menu_items = [
+            (restaurant, item_data)
+            for restaurant, items in (
+                (italian_bistro, italian_items),
+                (spice_garden, spice_items),
+                (burger_palace, burger_items),
             )
-            if created:
-                self.stdout.write(f'  Created menu item: {item.name} ({burger_palace.name})')
+            for item_data in items
+        ]
+        existing_items = {
+            (item.restaurant_id, item.name): item
+            for item in MenuItem.objects.filter(
+                restaurant__in=[italian_bistro, spice_garden, burger_palace]
+            ).only('id', 'restaurant_id', 'name', *self.MENU_ITEM_UPDATE_FIELDS)
+        }
+        
+        # (restaurant, name) is not unique, so ON CONFLICT upserts are not
+        # available; insert missing items and bulk_update the ones whose
+        # sample values changed since the last run
+        new_items = []
+        changed_items = []
+        now = timezone.now()
+        for restaurant, item_data in menu_items:
+            item = existing_items.get((restaurant.id, item_data['name']))
+            if item is None:
+                new_items.append(MenuItem(restaurant=restaurant, **item_data))
+            elif any(getattr(item, field) != value for field, value in item_data.items()):
+                for field, value in item_data.items():
+                    setattr(item, field, value)
+                # bulk_update() skips auto_now, so set updated_at explicitly
+                item.updated_at = now
+                changed_items.append(item)
+        
+        MenuItem.objects.bulk_create(new_items, batch_size=1000)
+        MenuItem.objects.bulk_update(
+            changed_items,
+            [*self.MENU_ITEM_UPDATE_FIELDS, 'updated_at'],
+            batch_size=500
+        )
+        
+        if new_items:
+            self.stdout.write('\n'.join(
+                f'  Created menu item: {item.name} ({item.restaurant.name})' for item in new_items
+            ))
+        if changed_items:
+            self.stdout.write('\n'.join(
+                f'  Updated menu item: {item.name}' for item in changed_items
+            ))
         
         self.stdout.write('Menu items creation completed!')
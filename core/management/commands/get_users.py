@@ -1,6 +1,5 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
-from customer.models import UserProfile
 
 
 class Command(BaseCommand):
@@ -29,37 +28,53 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS('ALL USERS IN DATABASE - Login Credentials'))
         self.stdout.write(self.style.SUCCESS('=' * 80))
         
-        users = User.objects.all()
+        # Profiles are joined in and rows are streamed in chunks, so the
+        # command runs one query and never holds every user in memory
+        users = User.objects.select_related('profile').only(
+            'username', 'email', 'is_active', 'is_staff', 'is_superuser', 'date_joined',
+            'profile___full_name_encrypted', 'profile___phone_number_encrypted'
+        ).order_by('id')
+        total_users = users.count()
         
-        if not users.exists():
+        if not total_users:
             self.stdout.write(self.style.WARNING('No users found in database!'))
             self.stdout.write('Create test users with:')
             self.stdout.write('User.objects.create_user("username", "email@example.com", "password")')
             return
         
-        self.stdout.write(f'Total users found: {users.count()}')
+        self.stdout.write(f'Total users found: {total_users}')
         self.stdout.write('-' * 80)
         
-        for i, user in enumerate(users, 1):
-            self.stdout.write(f'USER #{i}')
-            self.stdout.write(f'Username: {user.username}')
-            self.stdout.write(f'Email: {user.email}')
-            self.stdout.write(f'Active: {user.is_active}')
-            self.stdout.write(f'Staff: {user.is_staff}')
-            self.stdout.write(f'Superuser: {user.is_superuser}')
-            self.stdout.write(f'Date Joined: {user.date_joined}')
+        # Per-user lines are buffered and written in batches; each
+        # stdout.write() call flushes on its own
+        lines = []
+        for i, user in enumerate(users.iterator(chunk_size=500), 1):
+            lines.append(f'USER #{i}')
+            lines.append(f'Username: {user.username}')
+            lines.append(f'Email: {user.email}')
+            lines.append(f'Active: {user.is_active}')
+            lines.append(f'Staff: {user.is_staff}')
+            lines.append(f'Superuser: {user.is_superuser}')
+            lines.append(f'Date Joined: {user.date_joined}')
             
-            # Check if user has profile
-            try:
-                profile = UserProfile.objects.get(user=user)
-                self.stdout.write(f'Profile Name: {profile.full_name}')
-                self.stdout.write(f'Phone: {profile.phone_number}')
-            except UserProfile.DoesNotExist:
-                self.stdout.write('Profile: Not found')
+            # Check if user has profile (already loaded by select_related)
+            profile = getattr(user, 'profile', None)
+            if profile is not None:
+                lines.append(f'Profile Name: {profile.full_name}')
+                lines.append(f'Phone: {profile.phone_number}')
+            else:
+                lines.append('Profile: Not found')
             
-            self.stdout.write('Password: [Cannot display - passwords are hashed]')
-            self.stdout.write('To test login, you need the original password or reset it')
-            self.stdout.write('-' * 80)
+            lines.append('Password: [Cannot display - passwords are hashed]')
+            lines.append('To test login, you need the original password or reset it')
+            lines.append('-' * 80)
+            
+            if i % 500 == 0:
+                self.stdout.write('\n'.join(lines))
+                lines.clear()
+        
+        if lines:
+            self.stdout.write('\n'.join(lines))
         
         self.stdout.write(self.style.SUCCESS('\nTEST LOGIN URLS:'))
         self.stdout.write('- Customer Login: http://tetech.in:8000/login/')
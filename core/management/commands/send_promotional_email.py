@@ -2,6 +2,9 @@
 Django management command for sending promotional emails.
 Allows administrators to send marketing emails to users who have opted in.
 """
+from itertools import islice
+
+from django.core.mail import get_connection
 from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth.models import User
 from django.template.loader import render_to_string
@@ -24,6 +27,7 @@ class Command(BaseCommand):
         --test: Send test email only (to admin users)
         --users: Comma-separated list of usernames (optional, sends to specific users)
         --type: Type of promotional email (promotional|newsletter) (default: promotional)
+        --batch-size: Emails sent per SMTP connection (default: 100)
     """
     
     help = 'Send promotional emails to users who have opted in'
@@ -69,6 +73,12 @@ class Command(BaseCommand):
             action='store_true',
             help='Show who would receive emails without sending'
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=100,
+            help='Number of emails sent over one SMTP connection (default: 100)'
+        )
     
     def handle(self, *args, **options):
         """
@@ -82,6 +92,7 @@ class Command(BaseCommand):
         user_list = options['users']
         email_type = options['type']
         dry_run = options['dry_run']
+        batch_size = max(options['batch_size'], 1)
         
         self.stdout.write(self.style.SUCCESS('🍔 Starting Promotional Email Campaign'))
         self.stdout.write(f"Template: {template}")
@@ -102,12 +113,12 @@ class Command(BaseCommand):
             if test_mode:
                 # Send to admin users only
                 target_users = User.objects.filter(is_staff=True)
-                self.stdout.write(f"Target: {target_users.count()} admin users")
+                target_label = 'admin users'
             elif user_list:
                 # Send to specific users
                 usernames = [u.strip() for u in user_list.split(',')]
                 target_users = User.objects.filter(username__in=usernames)
-                self.stdout.write(f"Target: {target_users.count()} specific users")
+                target_label = 'specific users'
             else:
                 # Send to all opted-in users
                 if email_type == 'promotional':
@@ -118,9 +129,16 @@ class Command(BaseCommand):
                     target_users = User.objects.filter(
                         email_preferences__newsletter_emails=True
                     )
-                self.stdout.write(f"Target: {target_users.count()} opted-in users")
+                target_label = 'opted-in users'
             
-            if not target_users.exists():
+            # Join email preferences into the user query (read per user below).
+            # Users are streamed in chunks rather than loaded all at once, so
+            # the total comes from a single COUNT up front
+            target_users = target_users.select_related('email_preferences')
+            total_users = target_users.count()
+            self.stdout.write(f"Target: {total_users} {target_label}")
+            
+            if not total_users:
                 self.stdout.write(self.style.WARNING('⚠️  No target users found'))
                 return
             
@@ -136,23 +154,46 @@ class Command(BaseCommand):
             if dry_run:
                 # Show who would receive emails without sending
                 self.stdout.write(self.style.SUCCESS('\n📋 Dry Run - Users who would receive emails:'))
-                for user in target_users:
+                listed_count = 0
+                for user in target_users.iterator(chunk_size=500):
                     email_pref = user.email_preferences
                     preferences = email_pref.get_active_preferences()
                     self.stdout.write(f"  - {user.username} ({user.email}) - {', '.join(preferences)}")
-                self.stdout.write(self.style.SUCCESS(f'\nTotal emails that would be sent: {target_users.count()}'))
+                    listed_count += 1
+                self.stdout.write(self.style.SUCCESS(f'\nTotal emails that would be sent: {listed_count}'))
                 return
             
             # Send emails
             self.stdout.write(self.style.SUCCESS('\n📧 Sending promotional emails...'))
             
-            results = EmailUtils.send_promotional_email(
-                subject=subject,
-                template_name=template,
-                context=context,
-                user_list=target_users,
-                fail_silently=False,
-            )
+            results = {'success': 0, 'failed': []}
+            users = target_users.iterator(chunk_size=500)
+            while True:
+                batch = list(islice(users, batch_size))
+                if not batch:
+                    break
+                
+                # One SMTP connection (and login) per batch instead of per email;
+                # reopening between batches keeps sessions short
+                with get_connection() as connection:
+                    batch_results = EmailUtils.send_promotional_email(
+                        subject=subject,
+                        template_name=template,
+                        context=context,
+                        user_list=batch,
+                        fail_silently=False,
+                        connection=connection,
+                    )
+                results['success'] += batch_results['success']
+                results['failed'].extend(batch_results['failed'])
+                
+                # Stop the campaign if the mail server is rejecting a large share
+                if len(batch_results['failed']) * 3 > len(batch):
+                    self.stdout.write(self.style.ERROR(
+                        f"❌ Stopping campaign: {len(batch_results['failed'])} of "
+                        f"{len(batch)} emails in the last batch failed"
+                    ))
+                    break
             
             # Display results
             self.stdout.write(self.style.SUCCESS('\n📊 Campaign Results:'))
@@ -164,7 +205,7 @@ class Command(BaseCommand):
                 for email in results['failed']:
                     self.stdout.write(f"  - {email}")
             
-            self.stdout.write(self.style.SUCCESS(f'\n🎉 Campaign completed! {results["success"]}/{target_users.count()} emails sent successfully'))
+            self.stdout.write(self.style.SUCCESS(f'\n🎉 Campaign completed! {results["success"]}/{total_users} emails sent successfully'))
             
         except Exception as e:
             self.stdout.write(self.style.ERROR(f'❌ Campaign failed: {str(e)}'))
@@ -53,13 +53,14 @@ class Command(BaseCommand):
         # Add permissions for Restaurant Owner group
         # Get permissions for Restaurant model
         restaurant_content_type = ContentType.objects.get_for_model(Restaurant)
-        restaurant_permissions = Permission.objects.filter(
+        restaurant_permissions = list(Permission.objects.filter(
             content_type=restaurant_content_type
-        )
+        ))
         
-        # Add all restaurant permissions to Restaurant Owner group
-        for permission in restaurant_permissions:
-            restaurant_owner_group.permissions.add(permission)
+        # Add all restaurant permissions to Restaurant Owner group in one call
+        # (one existence check and one multi-row insert); add() rather than
+        # set() so permissions granted elsewhere are kept
+        restaurant_owner_group.permissions.add(*restaurant_permissions)
         
         self.stdout.write(
             self.style.SUCCESS('Added Restaurant permissions to Restaurant Owner group')
@@ -71,7 +72,7 @@ class Command(BaseCommand):
         self.stdout.write('='*50)
         self.stdout.write(f'Customer group: {customer_group.name}')
         self.stdout.write(f'Restaurant Owner group: {restaurant_owner_group.name}')
-        self.stdout.write(f'Restaurant Owner permissions: {restaurant_permissions.count()}')
+        self.stdout.write(f'Restaurant Owner permissions: {len(restaurant_permissions)}')
         self.stdout.write('='*50)
         self.stdout.write(
             self.style.SUCCESS('User groups setup completed successfully!')
@@ -5,10 +5,14 @@ This command updates the role field in UserProfile based on existing group membe
 ensuring backward compatibility and proper role synchronization.
 """
 
+from collections import defaultdict
+
 from django.core.management.base import BaseCommand
 from django.contrib.auth.models import User, Group
+from django.db import transaction
 from customer.models import UserProfile
-from core.utils.user_roles import set_user_role
+from core.authentication import invalidate_cached_users
+from core.utils.user_roles import get_group_id
 
 
 class Command(BaseCommand):
@@ -53,10 +57,12 @@ class Command(BaseCommand):
         
         self.stdout.write(self.style.SUCCESS('🔄 Starting user role synchronization...'))
         
-        # Get users to process
+        # Get users to process, with profiles joined and groups prefetched so
+        # the loop below runs no per-user queries
+        users_qs = User.objects.select_related('profile').prefetch_related('groups')
         if target_username:
             try:
-                users = [User.objects.get(username=target_username)]
+                users = [users_qs.get(username=target_username)]
                 self.stdout.write(f"Processing single user: {target_username}")
             except User.DoesNotExist:
                 self.stdout.write(
@@ -64,12 +70,12 @@ class Command(BaseCommand):
                 )
                 return
         else:
-            users = User.objects.all()
-            self.stdout.write(f"Processing all {users.count()} users...")
+            users = list(users_qs)
+            self.stdout.write(f"Processing all {len(users)} users...")
         
         # Statistics
         stats = {
-            'total': users.count(),
+            'total': len(users),
             'updated': 0,
             'restaurant_owners': 0,
             'managers': 0,
@@ -81,25 +87,25 @@ class Command(BaseCommand):
         restaurant_group = Group.objects.filter(name='Restaurant Owner').first()
         manager_group = Group.objects.filter(name='Manager').first()
         
+        # Create all missing profiles in one insert
+        self.create_missing_profiles(users)
+        
+        # Changed profiles are collected and written in batches after the loop
+        updates = []
+        
         for user in users:
             try:
-                # Get or create user profile
-                profile, created = UserProfile.objects.get_or_create(
-                    user=user,
-                    defaults={'full_name': user.username, 'role': 'customer'}
-                )
+                profile = user.profile
                 
-                if created:
-                    self.stdout.write(f"Created profile for user: {user.username}")
-                
-                # Determine role based on group membership
+                # Determine role based on (prefetched) group membership
+                group_ids = {group.id for group in user.groups.all()}
                 new_role = 'customer'  # Default role
                 
                 if user.is_superuser:
                     new_role = 'admin'
-                elif manager_group and user.groups.filter(id=manager_group.id).exists():
+                elif manager_group and manager_group.id in group_ids:
                     new_role = 'manager'
-                elif restaurant_group and user.groups.filter(id=restaurant_group.id).exists():
+                elif restaurant_group and restaurant_group.id in group_ids:
                     new_role = 'restaurant_owner'
                 
                 # Update role if needed
@@ -109,19 +115,8 @@ class Command(BaseCommand):
                             f"Would update {user.username}: {profile.role} -> {new_role}"
                         )
                     else:
-                        old_role = profile.role
+                        updates.append((user, profile, profile.role))
                         profile.role = new_role
-                        profile.save(update_fields=['role'])
-                        
-                        # Also ensure proper group membership via utility function
-                        set_user_role(user, new_role)
-                        
-                        self.stdout.write(
-                            self.style.SUCCESS(
-                                f"Updated {user.username}: {old_role} -> {new_role}"
-                            )
-                        )
-                        stats['updated'] += 1
                 
                 # Update statistics
                 if new_role == 'restaurant_owner':
@@ -137,6 +132,17 @@ class Command(BaseCommand):
                 )
                 stats['errors'] += 1
         
+        if updates:
+            self.apply_role_updates([profile for _, profile, _ in updates])
+            
+            for user, profile, old_role in updates:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"Updated {user.username}: {old_role} -> {profile.role}"
+                    )
+                )
+            stats['updated'] = len(updates)
+        
         # Display results
         self.stdout.write("\n" + "="*50)
         self.stdout.write(self.style.SUCCESS("✅ Role synchronization completed!"))
@@ -157,3 +163,82 @@ class Command(BaseCommand):
             self.stdout.write(
                 self.style.SUCCESS("\n🎉 All user roles have been synchronized successfully!")
             )
+    
+    def create_missing_profiles(self, users):
+        """
+        Create customer profiles for users that have none, in one bulk insert.
+        
+        The new profiles are attached to their users so callers can read
+        user.profile without another query.
+        
+        Args:
+            users (list): User objects loaded with select_related('profile')
+        """
+        missing = [
+            UserProfile(user=user, full_name=user.username, role='customer')
+            for user in users
+            if getattr(user, 'profile', None) is None
+        ]
+        if not missing:
+            return
+        
+        UserProfile.objects.bulk_create(missing, batch_size=500)
+        
+        for profile in missing:
+            profile.user.profile = profile
+            self.stdout.write(f"Created profile for user: {profile.user.username}")
+        
+        # bulk_create() skips post_save, so evict the cached users here
+        invalidate_cached_users(profile.user_id for profile in missing)
+    
+    def apply_role_updates(self, profiles):
+        """
+        Save changed roles and sync group membership in batched queries.
+        
+        Applies what set_user_role() does for each user, but with one query
+        per step for all users instead of several queries per user: profile
+        roles are bulk updated, Restaurant Owner/Manager memberships are
+        removed and re-added per role, and staff flags are set per role.
+        
+        Args:
+            profiles (list): UserProfile objects whose role holds the new value
+        """
+        restaurant_group_id = get_group_id('Restaurant Owner')
+        manager_group_id = get_group_id('Manager')
+        Membership = User.groups.through
+        
+        user_ids = [profile.user_id for profile in profiles]
+        user_ids_by_role = defaultdict(list)
+        for profile in profiles:
+            user_ids_by_role[profile.role].append(profile.user_id)
+        
+        with transaction.atomic():
+            UserProfile.objects.bulk_update(profiles, ['role'], batch_size=500)
+            
+            # Remove from all role-specific groups first, then add per role
+            Membership.objects.filter(
+                user_id__in=user_ids,
+                group_id__in=[restaurant_group_id, manager_group_id]
+            ).delete()
+            Membership.objects.bulk_create(
+                [
+                    Membership(user_id=user_id, group_id=restaurant_group_id)
+                    for user_id in user_ids_by_role['restaurant_owner'] + user_ids_by_role['manager']
+                ] + [
+                    Membership(user_id=user_id, group_id=manager_group_id)
+                    for user_id in user_ids_by_role['manager']
+                ],
+                ignore_conflicts=True
+            )
+            
+            if user_ids_by_role['admin']:
+                User.objects.filter(pk__in=user_ids_by_role['admin']).update(
+                    is_staff=True, is_superuser=True
+                )
+            if user_ids_by_role['customer']:
+                User.objects.filter(pk__in=user_ids_by_role['customer']).update(
+                    is_staff=False, is_superuser=False
+                )
+        
+        # Bulk writes skip post_save, so evict the cached users here
+        invalidate_cached_users(user_ids)
@@ -3,6 +3,7 @@ Management command to update restaurant cuisine types.
 Updates existing restaurants with appropriate cuisine classifications.
 """
 from django.core.management.base import BaseCommand
+from django.utils import timezone
 from restaurant.models import Restaurant
 
 
@@ -33,23 +34,35 @@ class Command(BaseCommand):
             'Tasty Bites': 'other'
         }
         
-        updated_count = 0
+        # Load every listed restaurant in one query and write them back with
+        # one bulk_update instead of a get() and save() per restaurant
+        restaurants = list(
+            Restaurant.objects.filter(name__in=restaurant_cuisines).only('id', 'name', 'cuisine_type')
+        )
+        now = timezone.now()
+        for restaurant in restaurants:
+            restaurant.cuisine_type = restaurant_cuisines[restaurant.name]
+            # bulk_update() skips auto_now, so set updated_at explicitly
+            restaurant.updated_at = now
+        Restaurant.objects.bulk_update(restaurants, ['cuisine_type', 'updated_at'], batch_size=500)
+        updated_count = len(restaurants)
+        
+        restaurants_by_name = {}
+        for restaurant in restaurants:
+            restaurants_by_name.setdefault(restaurant.name, []).append(restaurant)
         
-        for restaurant_name, cuisine_type in restaurant_cuisines.items():
-            try:
-                restaurant = Restaurant.objects.get(name=restaurant_name)
-                restaurant.cuisine_type = cuisine_type
-                restaurant.save()
-                updated_count += 1
+        for restaurant_name in restaurant_cuisines:
+            if restaurant_name not in restaurants_by_name:
+                self.stdout.write(
+                    self.style.WARNING(f'❌ Restaurant not found: {restaurant_name}')
+                )
+                continue
+            for restaurant in restaurants_by_name[restaurant_name]:
                 self.stdout.write(
                     self.style.SUCCESS(
                         f'✅ Updated {restaurant.name} -> {restaurant.get_cuisine_type_display()}'
                     )
                 )
-            except Restaurant.DoesNotExist:
-                self.stdout.write(
-                    self.style.WARNING(f'❌ Restaurant not found: {restaurant_name}')
-                )
         
         self.stdout.write('\n=== SUMMARY ===')
         self.stdout.write(f'Restaurants updated: {updated_count}')
@@ -59,7 +72,7 @@ class Command(BaseCommand):
         
         # Display final state
         self.stdout.write('\n=== CURRENT RESTAURANTS ===')
-        for restaurant in Restaurant.objects.all():
+        for restaurant in Restaurant.objects.only('name', 'cuisine_type'):
             self.stdout.write(
                 f'{restaurant.name}: {restaurant.get_cuisine_type_display()}'
             )
@@ -332,8 +332,8 @@ class Command(BaseCommand):
         
         try:
             # Check if it looks like encrypted data (base64 encoded)
-            # Fernet encrypted data should start with 'gAAAAAB' and be base64
-            if not encrypted_value.startswith('gAAAAAB'):
+            # AES-GCM ('v2:') or legacy Fernet ('gAAAAA') tokens, base64 encoded
+            if not EncryptionManager.is_encrypted(encrypted_value):
                 if self.verbose:
                     self.stdout.write(
                         self.style.WARNING(
@@ -0,0 +1,23 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Add a functional index on LOWER(auth_user.email).
+    
+    Email logins match on Lower('email'); this index lets that lookup use an
+    index seek instead of scanning the user table. auth.User cannot declare
+    the index in its own Meta, so it is created here with raw SQL (expression
+    indexes are supported by both PostgreSQL and SQLite).
+    """
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql='CREATE INDEX IF NOT EXISTS auth_user_email_lower_idx ON auth_user (LOWER(email));',
+            reverse_sql='DROP INDEX IF EXISTS auth_user_email_lower_idx;',
+        ),
+    ]
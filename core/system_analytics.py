@@ -3,15 +3,19 @@ System-wide Analytics Engine for Food Ordering Platform
 Provides comprehensive analytics, KPIs, and reporting capabilities
 """
 
-from django.db.models import Count, Sum, Avg, Q, F, Case, When, Value, CharField
-from django.db.models.functions import TruncDate, TruncMonth, TruncWeek, TruncHour
+from django.db.models import Count, Sum, Avg, Q, F, Exists, FloatField, OuterRef
+from django.db.models.functions import Cast, Coalesce, NullIf, Round, TruncDate, TruncMonth, TruncWeek, TruncHour
+from django.db import connection
 from django.utils import timezone
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache, wraps
 import json
+import time
 from decimal import Decimal
 
 # Import models for analytics
-from django.contrib.auth.models import User
+from django.contrib.auth.models import Group, User
 from restaurant.models import Restaurant
 from menu.models import MenuItem, Category
 from orders.models import Order, OrderItem
@@ -25,6 +29,111 @@ except ImportError:
     AXES_AVAILABLE = False
 
 
+def _percentage(part, whole):
+    """
+    Build a SQL expression for part as a percentage of whole.
+    
+    The database does the division and rounds to one decimal place; an
+    empty whole yields 0 instead of a division by zero.
+    
+    Args:
+        part: Aggregate expression for the numerator (e.g. a filtered Count)
+        whole: Aggregate expression for the denominator
+    
+    Returns:
+        Expression: Float percentage rounded to one decimal place
+    """
+    return Cast(
+        Round(Coalesce(100.0 * part / NullIf(whole, 0), 0.0), 1),
+        FloatField(),
+    )
+
+
+def get_user_role_distribution():
+    """
+    Count users per display role in a single aggregate query.
+    
+    Superusers count as 'Super Admin', other staff as 'Staff', members of the
+    Restaurant Owner group as 'Restaurant Owner' and everyone else as
+    'Customer'. Group membership is checked with an EXISTS subquery so users
+    are never duplicated by a join against auth_user_groups.
+    
+    Returns:
+        list: Dicts with 'role_name' and 'count', largest first, omitting
+            roles with no users
+    """
+    in_owner_group = Exists(
+        Group.user_set.through.objects.filter(
+            user_id=OuterRef('pk'),
+            group__name='Restaurant Owner'
+        )
+    )
+    not_staff = Q(is_staff=False, is_superuser=False)
+    counts = User.objects.aggregate(
+        total=Count('id'),
+        superusers=Count('id', filter=Q(is_superuser=True)),
+        staff=Count('id', filter=Q(is_staff=True, is_superuser=False)),
+        owners=Count('id', filter=not_staff & Q(in_owner_group)),
+    )
+    customers = counts['total'] - counts['superusers'] - counts['staff'] - counts['owners']
+    
+    roles = [
+        {'role_name': 'Super Admin', 'count': counts['superusers']},
+        {'role_name': 'Staff', 'count': counts['staff']},
+        {'role_name': 'Restaurant Owner', 'count': counts['owners']},
+        {'role_name': 'Customer', 'count': customers},
+    ]
+    return sorted(
+        (role for role in roles if role['count']),
+        key=lambda role: role['count'],
+        reverse=True
+    )
+
+
+def get_popular_wishlist_restaurants(limit=10):
+    """
+    Get the restaurants saved to the most wishlists.
+    
+    Groups on the indexed restaurant_id foreign key (so restaurants sharing
+    a name are counted separately) and only joins Restaurant for the name.
+    
+    Args:
+        limit (int): Maximum number of restaurants to return
+    
+    Returns:
+        list: Dicts with 'restaurant_id', 'restaurant__name' and 'count',
+            most saved first
+    """
+    return list(
+        Wishlist.objects.values(
+            'restaurant_id', 'restaurant__name'
+        ).annotate(
+            count=Count('id')
+        ).order_by('-count')[:limit]
+    )
+
+
+# Seconds a shared SystemAnalytics snapshot is reused across requests
+ANALYTICS_SNAPSHOT_SECONDS = 60
+
+
+def _memoized_section(getter):
+    """
+    Cache an analytics section on its SystemAnalytics instance.
+    
+    The first call runs the queries; later calls on the same instance return
+    a shallow copy of the stored result so views can add derived keys
+    without altering the shared data.
+    """
+    @wraps(getter)
+    def wrapper(self):
+        result = self._sections.get(getter.__name__)
+        if result is None:
+            result = self._sections[getter.__name__] = getter(self)
+        return dict(result)
+    return wrapper
+
+
 class SystemAnalytics:
     """
     Comprehensive system analytics engine for real-time reporting.
@@ -38,7 +147,9 @@ class SystemAnalytics:
         self.last_month = self.today - timedelta(days=30)
         self.last_quarter = self.today - timedelta(days=90)
         self.last_year = self.today - timedelta(days=365)
+        self._sections = {}
     
+    @_memoized_section
     def get_authentication_analytics(self):
         """
         Comprehensive authentication and security analytics.
@@ -55,15 +166,7 @@ class SystemAnalytics:
         new_users_month = User.objects.filter(date_joined__gte=self.last_month).count()
         
         # User role distribution
-        user_roles = User.objects.annotate(
-            role_name=Case(
-                When(is_superuser=True, then=Value('Super Admin')),
-                When(is_staff=True, then=Value('Staff')),
-                When(groups__name='Restaurant Owner', then=Value('Restaurant Owner')),
-                default=Value('Customer'),
-                output_field=CharField(),
-            )
-        ).values('role_name').annotate(count=Count('id')).order_by('-count')
+        user_roles = get_user_role_distribution()
         
         # Login activity trends (hourly for last 24 hours)
         login_trends_24h = User.objects.filter(
@@ -105,7 +208,7 @@ class SystemAnalytics:
             'new_users_today': new_users_today,
             'new_users_week': new_users_week,
             'new_users_month': new_users_month,
-            'user_roles': list(user_roles),
+            'user_roles': user_roles,
             'login_trends_24h': [
                 {
                     'hour': item['hour'].strftime('%H:00'),
@@ -115,6 +218,7 @@ class SystemAnalytics:
             'security': security_data
         }
     
+    @_memoized_section
     def get_business_analytics(self):
         """
         Comprehensive business and revenue analytics.
@@ -127,25 +231,25 @@ class SystemAnalytics:
         
         # Revenue metrics
         total_revenue = Order.objects.aggregate(
-            total=Sum('total_amount')
-        )['total'] or Decimal('0')
+            total=Coalesce(Sum('total_amount'), Decimal('0'))
+        )['total']
         
         revenue_today = Order.objects.filter(
             created_at__date=self.today
-        ).aggregate(total=Sum('total_amount'))['total'] or Decimal('0')
+        ).aggregate(total=Coalesce(Sum('total_amount'), Decimal('0')))['total']
         
         revenue_week = Order.objects.filter(
             created_at__gte=self.last_week
-        ).aggregate(total=Sum('total_amount'))['total'] or Decimal('0')
+        ).aggregate(total=Coalesce(Sum('total_amount'), Decimal('0')))['total']
         
         revenue_month = Order.objects.filter(
             created_at__gte=self.last_month
-        ).aggregate(total=Sum('total_amount'))['total'] or Decimal('0')
+        ).aggregate(total=Coalesce(Sum('total_amount'), Decimal('0')))['total']
         
         # Average order value
         avg_order_value = Order.objects.aggregate(
-            avg=Avg('total_amount')
-        )['avg'] or Decimal('0')
+            avg=Coalesce(Avg('total_amount'), Decimal('0'))
+        )['avg']
         
         # Order status distribution
         order_status = Order.objects.values('status').annotate(
@@ -208,14 +312,21 @@ class SystemAnalytics:
             ]
         }
     
+    @_memoized_section
     def get_restaurant_analytics(self):
         """
         Restaurant performance and inventory analytics.
         """
-        # Restaurant metrics
-        total_restaurants = Restaurant.objects.count()
-        active_restaurants = Restaurant.objects.filter(is_active=True).count()
-        pending_restaurants = Restaurant.objects.filter(is_approved=False, is_active=False).count()
+        # Restaurant metrics (counts and activation rate in one aggregate)
+        restaurant_stats = Restaurant.objects.aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(is_active=True)),
+            pending=Count('id', filter=Q(is_approved=False, is_active=False)),
+            activation_rate=_percentage(Count('id', filter=Q(is_active=True)), Count('id')),
+        )
+        total_restaurants = restaurant_stats['total']
+        active_restaurants = restaurant_stats['active']
+        pending_restaurants = restaurant_stats['pending']
         
         # Cuisine distribution
         cuisine_types = Restaurant.objects.values('cuisine_type').annotate(
@@ -223,10 +334,17 @@ class SystemAnalytics:
             active_count=Count('id', filter=Q(is_active=True))
         ).order_by('-count')
         
-        # Menu analytics
-        total_menu_items = MenuItem.objects.count()
-        available_items = MenuItem.objects.filter(is_available=True).count()
-        out_of_stock = MenuItem.objects.filter(is_available=False).count()
+        # Menu analytics (counts and stock percentages in one aggregate)
+        menu_stats = MenuItem.objects.aggregate(
+            total=Count('id'),
+            available=Count('id', filter=Q(is_available=True)),
+            out_of_stock=Count('id', filter=Q(is_available=False)),
+            available_percentage=_percentage(Count('id', filter=Q(is_available=True)), Count('id')),
+            out_of_stock_percentage=_percentage(Count('id', filter=Q(is_available=False)), Count('id')),
+        )
+        total_menu_items = menu_stats['total']
+        available_items = menu_stats['available']
+        out_of_stock = menu_stats['out_of_stock']
         
         # Category distribution
         categories = MenuItem.objects.values('category__name').annotate(
@@ -237,8 +355,8 @@ class SystemAnalytics:
         # Restaurant performance
         restaurant_performance = Restaurant.objects.annotate(
             total_orders=Count('reviews__order_id', distinct=True),
-            total_revenue=Sum('reviews__order__total_amount'),
-            avg_rating=Avg('reviews__rating'),
+            total_revenue=Coalesce(Sum('reviews__order__total_amount'), Decimal('0')),
+            avg_rating=Coalesce(Avg('reviews__rating'), 0.0),
             menu_items_count=Count('menu_items')
         ).order_by('-total_revenue')[:10]
         
@@ -246,22 +364,26 @@ class SystemAnalytics:
             'total_restaurants': total_restaurants,
             'active_restaurants': active_restaurants,
             'pending_restaurants': pending_restaurants,
+            'activation_rate': restaurant_stats['activation_rate'],
             'cuisine_types': list(cuisine_types),
             'total_menu_items': total_menu_items,
             'available_items': available_items,
             'out_of_stock': out_of_stock,
+            'available_percentage': menu_stats['available_percentage'],
+            'out_of_stock_percentage': menu_stats['out_of_stock_percentage'],
             'categories': list(categories),
             'restaurant_performance': [
                 {
                     'name': r.name,
-                    'total_orders': r.total_orders or 0,
-                    'total_revenue': float(r.total_revenue or 0),
-                    'avg_rating': float(r.avg_rating or 0),
+                    'total_orders': r.total_orders,
+                    'total_revenue': float(r.total_revenue),
+                    'avg_rating': r.avg_rating,
                     'menu_items_count': r.menu_items_count
                 } for r in restaurant_performance
             ]
         }
     
+    @_memoized_section
     def get_customer_analytics(self):
         """
         Customer behavior and engagement analytics.
@@ -284,11 +406,7 @@ class SystemAnalytics:
         
         # Wishlist analytics
         total_wishlists = Wishlist.objects.count()
-        popular_restaurants = Wishlist.objects.values(
-            'restaurant__name'
-        ).annotate(
-            count=Count('id')
-        ).order_by('-count')[:10]
+        popular_restaurants = get_popular_wishlist_restaurants()
         
         # Customer engagement trends
         review_trends = RestaurantReview.objects.filter(
@@ -306,7 +424,7 @@ class SystemAnalytics:
             'restaurant_ratings': list(restaurant_ratings),
             'menu_ratings': list(menu_ratings),
             'total_wishlists': total_wishlists,
-            'popular_restaurants': list(popular_restaurants),
+            'popular_restaurants': popular_restaurants,
             'review_trends': [
                 {
                     'date': item['date'].strftime('%Y-%m-%d'),
@@ -315,6 +433,7 @@ class SystemAnalytics:
             ]
         }
     
+    @_memoized_section
     def get_system_health_analytics(self):
         """
         System health and performance analytics.
@@ -352,15 +471,71 @@ class SystemAnalytics:
             'response_time': '120ms',  # Would need proper monitoring
         }
     
+    @_memoized_section
     def get_comprehensive_dashboard(self):
         """
         Get all analytics data for comprehensive dashboard.
+        
+        The sections query independent tables, so they run concurrently on
+        separate database connections to overlap query latency.
         """
+        sections = {
+            'authentication': self.get_authentication_analytics,
+            'business': self.get_business_analytics,
+            'restaurant': self.get_restaurant_analytics,
+            'customer': self.get_customer_analytics,
+            'system_health': self.get_system_health_analytics,
+        }
+        
+        with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+            futures = {
+                name: executor.submit(self._run_section, getter)
+                for name, getter in sections.items()
+            }
+            results = {name: future.result() for name, future in futures.items()}
+        
         return {
             'generated_at': self.now.isoformat(),
-            'authentication': self.get_authentication_analytics(),
-            'business': self.get_business_analytics(),
-            'restaurant': self.get_restaurant_analytics(),
-            'customer': self.get_customer_analytics(),
-            'system_health': self.get_system_health_analytics(),
+            **results,
         }
+    
+    @staticmethod
+    def _run_section(getter):
+        """
+        Run one analytics section in a worker thread.
+        
+        Each worker thread gets its own database connection; close it when
+        the section is done so pooled threads do not leak connections.
+        """
+        try:
+            return getter()
+        finally:
+            connection.close()
+
+
+@lru_cache(maxsize=1)
+def _analytics_snapshot(bucket):
+    """
+    Build the SystemAnalytics instance shared by one time bucket.
+    
+    Args:
+        bucket (int): Index of the current ANALYTICS_SNAPSHOT_SECONDS window
+    
+    Returns:
+        SystemAnalytics: Instance whose sections are computed on first use
+    """
+    return SystemAnalytics()
+
+
+def get_system_analytics():
+    """
+    Get the process-wide SystemAnalytics instance for the current minute.
+    
+    Views share one instance per ANALYTICS_SNAPSHOT_SECONDS window, so each
+    analytics section is queried at most once per window in this process
+    instead of on every request.
+    
+    Returns:
+        SystemAnalytics: Shared analytics instance
+    """
+    return _analytics_snapshot(int(time.time() // ANALYTICS_SNAPSHOT_SECONDS))
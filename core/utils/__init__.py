@@ -34,7 +34,8 @@ class EmailUtils:
     
     @staticmethod
     def send_templated_email(subject, template_name, context, recipient_list, 
-                           from_email=None, html_template=None, fail_silently=False):
+                           from_email=None, html_template=None, fail_silently=False,
+                           connection=None):
         """
         Send a templated email using Django templates.
         
@@ -49,6 +50,8 @@ class EmailUtils:
             from_email (str, optional): Sender email address. Uses default if None
             html_template (str, optional): Path to HTML email template
             fail_silently (bool): Whether to suppress exceptions
+            connection (optional): Open email backend connection to send
+                through; a new one is opened per email if None
             
         Returns:
             bool: True if email was sent successfully, False otherwise
@@ -68,6 +71,7 @@ class EmailUtils:
                     body=plain_message,
                     from_email=from_email,
                     to=recipient_list,
+                    connection=connection,
                 )
                 
                 # Render and attach HTML content
@@ -83,6 +87,7 @@ class EmailUtils:
                     from_email=from_email,
                     recipient_list=recipient_list,
                     fail_silently=fail_silently,
+                    connection=connection,
                 )
             
             logger.info(f"Email sent successfully to {recipient_list}: {subject}")
@@ -269,7 +274,7 @@ class EmailUtils:
     
     @staticmethod
     def send_promotional_email(subject, template_name, context, user_list, 
-                             from_email=None, fail_silently=False):
+                             from_email=None, fail_silently=False, connection=None):
         """
         Send promotional email to multiple users.
         
@@ -280,9 +285,12 @@ class EmailUtils:
             subject (str): Email subject line
             template_name (str): Path to HTML email template
             context (dict): Context variables for template rendering
-            user_list (list): List of User objects to send email to
+            user_list (iterable): User objects to send email to (a list or
+                a streaming queryset iterator)
             from_email (str, optional): Sender email address
             fail_silently (bool): Whether to suppress exceptions
+            connection (optional): Open email backend connection reused for
+                every recipient, avoiding an SMTP login per email
             
         Returns:
             dict: Dictionary with success count and failed users
@@ -315,6 +323,7 @@ class EmailUtils:
                         recipient_list=[user.email],
                         from_email=from_email,
                         fail_silently=True,
+                        connection=connection,
                     )
                     
                     if success:
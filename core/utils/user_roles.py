@@ -5,9 +5,34 @@ This module provides helper functions to identify user roles throughout the syst
 making it easy to check if a user is a restaurant owner, customer, or staff member.
 """
 
+from functools import lru_cache
+
 from django.apps import apps
 
 
+@lru_cache(maxsize=8)
+def get_group_id(name):
+    """
+    Get the primary key of a role group, creating the group if needed.
+    
+    Role groups are created once (see create_default_groups) and never
+    renamed, so the ID is cached for the life of the process. Pass it
+    straight to user.groups.add(), which accepts primary keys.
+    
+    Args:
+        name (str): Group name, e.g. 'Customer' or 'Restaurant Owner'
+        
+    Returns:
+        int: Primary key of the group
+        
+    Example:
+        >>> user.groups.add(get_group_id('Customer'))
+    """
+    # Lazy import to avoid AppRegistryNotReady error
+    Group = apps.get_model('auth', 'Group')
+    return Group.objects.get_or_create(name=name)[0].pk
+
+
 def is_restaurant_owner(user):
     """
     Check if a user is a restaurant owner.
@@ -105,6 +130,10 @@ def get_user_role(user):
     if user.is_staff:
         return 'Staff'
     
+    # Querysets from annotate_user_roles() already carry everything needed
+    if hasattr(user, '_has_active_restaurant'):
+        return _get_annotated_user_role(user)
+    
     # Check role field first (more efficient)
     try:
         if hasattr(user, 'profile'):
@@ -130,6 +159,112 @@ def get_user_role(user):
     return 'Customer'
 
 
+def _get_annotated_user_role(user):
+    """
+    Resolve the non-staff part of get_user_role() from annotate_user_roles() values.
+    
+    Mirrors the role-field-first, group-fallback order of get_user_role()
+    without touching the database.
+    
+    Args:
+        user (User): User instance loaded through annotate_user_roles()
+        
+    Returns:
+        str: Primary role of the user
+    """
+    role = user._profile_role
+    
+    if role == 'restaurant_owner':
+        return 'Restaurant Owner' if user._has_active_restaurant else 'Pending Restaurant Owner'
+    elif role == 'manager':
+        return 'Manager'
+    elif role == 'admin':
+        return 'Administrator'
+    
+    if user._in_restaurant_owner_group:
+        return 'Restaurant Owner' if user._has_active_restaurant else 'Pending Restaurant Owner'
+    
+    return 'Customer'
+
+
+def annotate_user_roles(queryset):
+    """
+    Annotate a User queryset with the data get_user_role() needs.
+    
+    Adds the profile role, Restaurant Owner group membership and whether the
+    user has an approved active restaurant, so get_user_role() can be called
+    per row (e.g. in admin list pages) without issuing extra queries.
+    
+    Args:
+        queryset (QuerySet): User queryset
+        
+    Returns:
+        QuerySet: Annotated queryset
+        
+    Example:
+        >>> users = annotate_user_roles(User.objects.all())
+        >>> roles = [get_user_role(user) for user in users]
+    """
+    from django.db.models import Exists, F, OuterRef
+    
+    # Lazy imports to avoid AppRegistryNotReady error
+    Group = apps.get_model('auth', 'Group')
+    Restaurant = apps.get_model('restaurant', 'Restaurant')
+    
+    return queryset.annotate(
+        _profile_role=F('profile__role'),
+        _in_restaurant_owner_group=Exists(
+            Group.objects.filter(user=OuterRef('pk'), name='Restaurant Owner')
+        ),
+        _has_active_restaurant=Exists(
+            Restaurant.objects.filter(
+                owner=OuterRef('pk'),
+                approval_status='approved',
+                is_active=True
+            )
+        ),
+    )
+
+
+def get_user_role_flags(user):
+    """
+    Compute the role, owner and dashboard-access flags for a user together.
+    
+    Equivalent to calling get_user_role(), is_restaurant_owner(),
+    is_active_restaurant_owner() and can_access_restaurant_dashboard(), but
+    loads everything they need with a single annotate_user_roles() query.
+    
+    Args:
+        user (User): Authenticated Django User instance
+        
+    Returns:
+        dict: 'user_role', 'is_restaurant_owner', 'is_active_restaurant_owner'
+            and 'can_access_restaurant_dashboard'
+    """
+    annotated = annotate_user_roles(
+        user.__class__.objects.filter(pk=user.pk)
+    ).first() or user
+    
+    if hasattr(annotated, '_has_active_restaurant'):
+        is_owner = (
+            annotated._profile_role == 'restaurant_owner'
+            or annotated._in_restaurant_owner_group
+        )
+        is_active_owner = is_owner and annotated._has_active_restaurant
+    else:
+        is_owner = is_restaurant_owner(user)
+        is_active_owner = is_active_restaurant_owner(user)
+    
+    return {
+        'user_role': get_user_role(annotated),
+        'is_restaurant_owner': is_owner,
+        'is_active_restaurant_owner': is_active_owner,
+        'can_access_restaurant_dashboard': (
+            is_active_owner or user.is_staff or user.is_superuser
+        ),
+    }
+
+
 def set_user_role(user, role):
     """
     Set a user's role and synchronize with group membership.
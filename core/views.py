@@ -12,6 +12,7 @@ from django.views.generic import TemplateView
 from django.core.mail import send_mail
 from django.template.loader import render_to_string
 from django.conf import settings
+from django.db.models import prefetch_related_objects
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
@@ -73,23 +74,13 @@ class UnifiedLoginView(TemplateView):
         Returns:
             HttpResponse: Rendered template or redirect to appropriate dashboard
         """
-        # DEBUG: Log incoming request data
-        print(f"DEBUG: Login POST request received")
-        print(f"DEBUG: Request data: {dict(request.POST)}")
-        print(f"DEBUG: Request user: {request.user}")
-        print(f"DEBUG: Request method: {request.method}")
-        
         form = UnifiedLoginForm(request, data=request.POST)
         
-        # DEBUG: Log form validation
-        print(f"DEBUG: Form is valid: {form.is_valid()}")
-        if not form.is_valid():
-            print(f"DEBUG: Form errors: {form.errors}")
-            print(f"DEBUG: Non-field errors: {form.non_field_errors()}")
-        
         if form.is_valid():
             user = form.get_user()
-            print(f"DEBUG: Authenticated user: {user.username if user else 'None'}")
+            
+            # Load group membership once for the role/greeting checks below
+            prefetch_related_objects([user], 'groups')
             
             # Log authentication attempt for security audit
             logger.info(f'Login attempt successful for user: {user.username} from IP: {self.get_client_ip(request)}')
@@ -115,17 +106,14 @@ class UnifiedLoginView(TemplateView):
             request.session['user_role'] = self.get_user_role(user)
             request.session.modified = True
             
-            # Update user's last login timestamp
-            from django.utils import timezone
-            user.last_login = timezone.now()
-            user.save(update_fields=['last_login'])
+            # last_login is already updated by login() (Django's update_last_login
+            # receiver); saving it again here re-ran the user post_save handlers
             
             # Log successful login for session timeout tracking
             logger.info(f'User {user.username} logged in successfully - Session timeout tracking initialized')
             
             # Get the redirect URL based on user role
             redirect_url = form.get_redirect_url(user)
-            print(f"DEBUG: Redirecting to: {redirect_url}")
             
             # Add success message with personalized greeting
             greeting = self.get_personalized_greeting(user)
@@ -136,6 +124,9 @@ class UnifiedLoginView(TemplateView):
             
             return redirect(redirect_url)
         else:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Login form errors: %s", form.errors.as_json())
+            
             # Log failed authentication attempt for security
             username = request.POST.get('username', 'unknown')
             logger.warning(f'Login attempt failed for username: {username} from IP: {self.get_client_ip(request)}')
@@ -167,6 +158,21 @@ class UnifiedLoginView(TemplateView):
             ip = request.META.get('REMOTE_ADDR')
         return ip
     
+    def is_in_restaurant_owner_group(self, user):
+        """
+        Check Restaurant Owner group membership.
+        
+        Reads user.groups.all(), so it is served from the groups prefetched
+        in post() rather than querying on every call.
+        
+        Args:
+            user: Authenticated User object
+            
+        Returns:
+            bool: True if the user is in the Restaurant Owner group
+        """
+        return any(group.name == 'Restaurant Owner' for group in user.groups.all())
+    
     def get_user_role(self, user):
         """
         Determine the user's role for session tracking.
@@ -181,7 +187,7 @@ class UnifiedLoginView(TemplateView):
             return 'superuser'
         elif user.is_staff:
             return 'staff'
-        elif user.groups.filter(name='Restaurant Owner').exists():
+        elif self.is_in_restaurant_owner_group(user):
             return 'restaurant_owner'
         else:
             return 'customer'
@@ -209,7 +215,7 @@ class UnifiedLoginView(TemplateView):
         # Add role-specific greeting
         if user.is_superuser or user.is_staff:
             return f'{time_greeting}, Administrator'
-        elif user.groups.filter(name='Restaurant Owner').exists():
+        elif self.is_in_restaurant_owner_group(user):
             return f'{time_greeting}, Restaurant Owner'
         else:
             return f'{time_greeting}, Welcome back'
@@ -742,20 +748,16 @@ def dashboard_redirect(request):
     """
     user = request.user
     
-    # Debug logging to identify the issue
-    print(f"DEBUG dashboard_redirect: User={user.username}")
-    print(f"DEBUG dashboard_redirect: Has restaurants={user.restaurants.exists()}")
-    if user.restaurants.exists():
-        print(f"DEBUG dashboard_redirect: Restaurant count={user.restaurants.count()}")
-        print(f"DEBUG dashboard_redirect: Restaurants={list(user.restaurants.values_list('name', flat=True))}")
-    
     # Check if user is a restaurant owner (matching dropdown and login logic)
-    if user.restaurants.exists():
-        print(f"DEBUG dashboard_redirect: Redirecting to restaurant:dashboard")
+    has_restaurants = user.restaurants.exists()
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("dashboard_redirect: user=%s has_restaurants=%s", user.username, has_restaurants)
+    
+    if has_restaurants:
         return redirect('restaurant:dashboard')
     
     # Default to customer home
-    print(f"DEBUG dashboard_redirect: Redirecting to customer:home")
     return redirect('customer:home')
 
 
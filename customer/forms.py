@@ -324,9 +324,12 @@ class RestaurantUpgradeForm(forms.ModelForm):
         """
         restaurant_name = self.cleaned_data.get('restaurant_name')
         from restaurant.models import Restaurant
+        from django.db.models.functions import Lower
         
-        # Check existing restaurants
-        if Restaurant.objects.filter(name__iexact=restaurant_name).exists():
+        # Check existing restaurants (case-insensitive, served by the LOWER(name) index)
+        if Restaurant.objects.alias(
+            name_lower=Lower('name')
+        ).filter(name_lower=restaurant_name.lower()).exists():
             raise forms.ValidationError(
                 'A restaurant with this name already exists. Please choose a different name.'
             )
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-17 06:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customer', '0010_encrypt_existing_data'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='menuitemreview',
+            index=models.Index(fields=['is_flagged', 'created_at'], name='customer_me_is_flag_e07bf3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='restaurantreview',
+            index=models.Index(fields=['is_flagged', 'created_at'], name='customer_re_is_flag_3f4dc1_idx'),
+        ),
+    ]
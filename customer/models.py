@@ -9,7 +9,7 @@ from django.urls import reverse
 from orders.models import Order
 from menu.models import MenuItem
 from restaurant.models import Restaurant
-from core.encryption import EncryptionManager
+from core.encryption import EncryptionManager, EncryptedQuerySet, decrypt_field
 import uuid
 
 
@@ -103,6 +103,9 @@ class UserProfile(models.Model):
         help_text='Current loyalty points balance for the user'
     )
     
+    # Manager with bulk decryption support (with_decrypted)
+    objects = EncryptedQuerySet.as_manager()
+    
     # Property methods for transparent encryption/decryption
     @property
     def full_name(self):
@@ -114,7 +117,7 @@ class UserProfile(models.Model):
         Returns:
             str: Decrypted full name or empty string
         """
-        return EncryptionManager.decrypt(self._full_name_encrypted) or ''
+        return decrypt_field(self, '_full_name_encrypted') or ''
     
     @full_name.setter
     def full_name(self, value):
@@ -138,7 +141,7 @@ class UserProfile(models.Model):
         Returns:
             str: Decrypted phone number or empty string
         """
-        return EncryptionManager.decrypt(self._phone_number_encrypted) or ''
+        return decrypt_field(self, '_phone_number_encrypted') or ''
     
     @phone_number.setter
     def phone_number(self, value):
@@ -162,7 +165,7 @@ class UserProfile(models.Model):
         Returns:
             str: Decrypted address or empty string
         """
-        return EncryptionManager.decrypt(self._address_encrypted) or ''
+        return decrypt_field(self, '_address_encrypted') or ''
     
     @address.setter
     def address(self, value):
@@ -320,7 +323,7 @@ def sync_user_role_with_groups(sender, instance, created, **kwargs):
         instance: The UserProfile instance being saved
         created: Boolean indicating if this is a new creation
     """
-    from django.contrib.auth.models import Group
+    from core.utils.user_roles import get_group_id
     
     # Prevent infinite recursion by checking if we're already syncing
     if hasattr(instance, '_syncing_groups'):
@@ -335,15 +338,12 @@ def sync_user_role_with_groups(sender, instance, created, **kwargs):
             instance.role = 'customer'
             instance.save(update_fields=['role'])
         
-        # Sync role with groups
+        # Sync role with groups (cached group IDs, no lookup queries)
         if instance.role == 'restaurant_owner':
-            group, _ = Group.objects.get_or_create(name='Restaurant Owner')
-            instance.user.groups.add(group)
+            instance.user.groups.add(get_group_id('Restaurant Owner'))
         elif instance.role == 'manager':
             # Add to both Restaurant Owner and Manager groups for managers
-            restaurant_group, _ = Group.objects.get_or_create(name='Restaurant Owner')
-            manager_group, _ = Group.objects.get_or_create(name='Manager')
-            instance.user.groups.add(restaurant_group, manager_group)
+            instance.user.groups.add(get_group_id('Restaurant Owner'), get_group_id('Manager'))
         elif instance.role == 'admin':
             instance.user.is_staff = True
             instance.user.is_superuser = True
@@ -473,6 +473,7 @@ class RestaurantReview(models.Model):
             models.Index(fields=['restaurant', '-created_at']),
             models.Index(fields=['user', '-created_at']),
             models.Index(fields=['is_approved']),
+            models.Index(fields=['is_flagged', 'created_at']),
         ]
     
     def __str__(self):
@@ -660,6 +661,7 @@ class MenuItemReview(models.Model):
             models.Index(fields=['menu_item', 'created_at']),
             models.Index(fields=['rating']),
             models.Index(fields=['is_flagged']),
+            models.Index(fields=['is_flagged', 'created_at']),
         ]
     
     def __str__(self):
@@ -31,6 +31,7 @@ from .forms import (
 )
 from customer.models import RestaurantReview, MenuItemReview, ReviewResponse, ReviewFlag, Wishlist, UserProfile, LoyaltyTransaction
 from core.payment_utils import create_razorpay_order
+from core.encryption import preload_decrypted
 
 
 def send_order_confirmation_email(user, order):
@@ -1964,6 +1965,10 @@ def my_wishlist(request):
         user=request.user
     ).select_related('restaurant').order_by('-created_at')
     
+    # Decrypt the displayed restaurant fields in one batch instead of per row;
+    # this evaluates the queryset, so the template reuses the same instances
+    preload_decrypted((item.restaurant for item in wishlist_items), 'address', 'phone')
+    
     context = {
         'wishlist_items': wishlist_items,
     }
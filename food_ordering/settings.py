@@ -20,7 +20,7 @@ SECRET_KEY = os.getenv('SECRET_KEY', 'django-insecure-development-key-change-in-
 # ENCRYPTION CONFIGURATION
 # ============================================
 # Field-level encryption for sensitive user data
-# Uses Fernet symmetric encryption (AES-128 in CBC mode)
+# Uses AES-256-GCM authenticated encryption (legacy Fernet values still decrypt)
 # Encryption key is derived from SECRET_KEY using PBKDF2
 
 # Get encryption salt from environment or use default
@@ -147,6 +147,17 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing
+# New passwords use Argon2id (argon2-cffi); existing PBKDF2 hashes still verify
+# and are upgraded to Argon2 on the user's next successful login
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
 
 # Internationalization
 # Sets timezone and language settings
@@ -173,6 +173,10 @@ class MenuItem(TimeStampedModel):
         verbose_name = 'Menu Item'
         verbose_name_plural = 'Menu Items'
         ordering = ['category', 'name']
+        indexes = [
+            # Item lookups by name within a restaurant
+            models.Index(fields=['restaurant', 'name']),
+        ]
     
     def __str__(self):
         """
@@ -206,6 +206,11 @@ class Order(TimeStampedModel):
         verbose_name = 'Order'
         verbose_name_plural = 'Orders'
         ordering = ['-created_at']
+        indexes = [
+            # Covers date-bounded revenue aggregates without heap lookups
+            models.Index(fields=['created_at', 'total_amount']),
+            models.Index(fields=['status', 'created_at']),
+        ]
     
     def __str__(self):
         """
@@ -5,9 +5,10 @@ Defines Restaurant and PendingRestaurant models for managing restaurant informat
 from django.db import models
 from django.contrib.auth.models import User
 from core.models import TimeStampedModel
-from core.encryption import EncryptionManager
+from core.encryption import EncryptionManager, EncryptedQuerySet, decrypt_field
 from django.utils.functional import cached_property
 from django.db.models import Avg, Count
+from django.db.models.functions import Lower
 
 
 class Restaurant(TimeStampedModel):
@@ -180,6 +181,9 @@ class Restaurant(TimeStampedModel):
         help_text='Average rating (0-5)'
     )
     
+    # Manager with bulk decryption support (with_decrypted)
+    objects = EncryptedQuerySet.as_manager()
+    
     # Property methods for transparent encryption/decryption
     @property
     def address(self):
@@ -191,7 +195,7 @@ class Restaurant(TimeStampedModel):
         Returns:
             str: Decrypted address or empty string
         """
-        return EncryptionManager.decrypt(self._address_encrypted) or ''
+        return decrypt_field(self, '_address_encrypted') or ''
     
     @address.setter
     def address(self, value):
@@ -215,7 +219,7 @@ class Restaurant(TimeStampedModel):
         Returns:
             str: Decrypted phone number or empty string
         """
-        return EncryptionManager.decrypt(self._phone_encrypted) or ''
+        return decrypt_field(self, '_phone_encrypted') or ''
     
     @phone.setter
     def phone(self, value):
@@ -239,7 +243,7 @@ class Restaurant(TimeStampedModel):
         Returns:
             str: Decrypted email or empty string
         """
-        return EncryptionManager.decrypt(self._email_encrypted) or ''
+        return decrypt_field(self, '_email_encrypted') or ''
     
     @email.setter
     def email(self, value):
@@ -257,6 +261,12 @@ class Restaurant(TimeStampedModel):
         verbose_name = 'Restaurant'
         verbose_name_plural = 'Restaurants'
         ordering = ['-rating', 'name']
+        indexes = [
+            # Case-insensitive name lookups (duplicate-name checks at registration)
+            models.Index(Lower('name'), name='restaurant_name_lower_idx'),
+            # Exact name lookups (sample data, cuisine updates, admin scripts)
+            models.Index(fields=['name']),
+        ]
     
     def __str__(self):
         """
@@ -572,6 +582,9 @@ class PendingRestaurant(TimeStampedModel):
         help_text='When this application was processed'
     )
     
+    # Manager with bulk decryption support (with_decrypted)
+    objects = EncryptedQuerySet.as_manager()
+    
     # Property methods for transparent encryption/decryption
     @property
     def address(self):
@@ -581,7 +594,7 @@ class PendingRestaurant(TimeStampedModel):
         Returns:
             str: Decrypted address or empty string
         """
-        return EncryptionManager.decrypt(self._address_encrypted) or ''
+        return decrypt_field(self, '_address_encrypted') or ''
     
     @address.setter
     def address(self, value):
@@ -601,7 +614,7 @@ class PendingRestaurant(TimeStampedModel):
         Returns:
             str: Decrypted phone number or empty string
         """
-        return EncryptionManager.decrypt(self._phone_encrypted) or ''
+        return decrypt_field(self, '_phone_encrypted') or ''
     
     @phone.setter
     def phone(self, value):
@@ -621,7 +634,7 @@ class PendingRestaurant(TimeStampedModel):
         Returns:
             str: Decrypted email or empty string
         """
-        return EncryptionManager.decrypt(self._email_encrypted) or ''
+        return decrypt_field(self, '_email_encrypted') or ''
     
     @email.setter
     def email(self, value):
@@ -657,8 +670,8 @@ class PendingRestaurant(TimeStampedModel):
         Returns:
             Restaurant: The created restaurant object
         """
-        from django.contrib.auth.models import Group
         from django.utils import timezone
+        from core.utils.user_roles import get_group_id
         
         # Create the actual restaurant
         restaurant = Restaurant.objects.create(
@@ -679,10 +692,8 @@ class PendingRestaurant(TimeStampedModel):
             approval_status='approved'
         )
         
-        # Assign user to Restaurant Owner group
-        restaurant_group = Group.objects.filter(name='Restaurant Owner').first()
-        if restaurant_group:
-            self.user.groups.add(restaurant_group)
+        # Assign user to Restaurant Owner group (cached group ID, no lookup query)
+        self.user.groups.add(get_group_id('Restaurant Owner'))
         
         # Update pending application status
         self.status = 'approved'
@@ -12,6 +12,7 @@ from django.contrib.auth.decorators import login_required
 from django.utils.decorators import method_decorator
 from django.contrib.auth import authenticate, login
 from django.contrib.auth.models import User
+from django.db.models.functions import Lower
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
 from django.http import JsonResponse
@@ -185,7 +186,7 @@ class RegistrationWizardMixin:
             errors['email'] = 'Email is required'
         elif not re.match(r'^[^\s@]+@[^\s@]+\.[^\s@]+$', email):
             errors['email'] = 'Please enter a valid email address'
-        elif User.objects.filter(email__iexact=email).exists():
+        elif User.objects.alias(email_lower=Lower('email')).filter(email_lower=email.lower()).exists():
             errors['email'] = 'This email is already registered'
         
         # Password validation
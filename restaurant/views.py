@@ -301,11 +301,10 @@ def export_csv_report(report_data, report_type):
     Returns:
         HttpResponse: CSV file response
     """
-    response = HttpResponse(content_type='text/csv')
-    filename = f"{report_type}_report_{timezone.now().strftime('%Y%m%d')}.csv"
-    response['Content-Disposition'] = f'attachment; filename="{filename}"'
-    
-    writer = csv.writer(response)
+    # Rows are written to an in-memory buffer and handed to the response
+    # once, instead of going through HttpResponse.write() per row
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
     
     if report_type == 'revenue':
         writer.writerow(['Date', 'Revenue', 'Order Count'])
@@ -348,6 +347,10 @@ def export_csv_report(report_data, report_type):
         writer.writerow(['New Users', report_data['user_stats']['new_users']])
         writer.writerow(['Restaurant Owners', report_data['user_stats']['restaurant_owners']])
     
+    response = HttpResponse(buffer.getvalue(), content_type='text/csv')
+    filename = f"{report_type}_report_{timezone.now().strftime('%Y%m%d')}.csv"
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    
     return response
 
 
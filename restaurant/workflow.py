@@ -239,11 +239,8 @@ Best regards,
                 self.restaurant.save()
                 
                 # Add owner to Restaurant Owner group if not already
-                from django.contrib.auth.models import Group
-                restaurant_owner_group, _ = Group.objects.get_or_create(
-                    name='Restaurant Owner'
-                )
-                self.user.groups.add(restaurant_owner_group)
+                from core.utils.user_roles import get_group_id
+                self.user.groups.add(get_group_id('Restaurant Owner'))
                 
                 # Send approval notification
                 if request and self.user:
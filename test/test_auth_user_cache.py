@@ -0,0 +1,108 @@
+"""
+Tests for the user cache behind UsernameOrEmailBackend.get_user().
+
+Verifies that a deactivated user stops being returned by get_user() right
+away, both with the default per-process cache (where user caching is off)
+and with a shared cache backend (where cached entries are versioned per user).
+"""
+
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from core import authentication
+from core.authentication import (
+    UsernameOrEmailBackend,
+    invalidate_cached_users,
+    user_cache_enabled,
+)
+
+User = get_user_model()
+
+
+class UserCacheTest(TestCase):
+    """
+    Test case for get_user() caching and invalidation.
+    """
+    
+    def setUp(self):
+        """
+        Set up a fresh cache, an active user and the backend under test.
+        """
+        cache.clear()
+        user_cache_enabled.cache_clear()
+        self.addCleanup(user_cache_enabled.cache_clear)
+        self.backend = UsernameOrEmailBackend()
+        self.user = User.objects.create_user(
+            username='cacheduser',
+            email='cached@example.com',
+            password='testpass123'
+        )
+    
+    def test_cache_disabled_for_local_memory_backend(self):
+        """
+        Test that user caching is off for a per-process cache backend.
+        """
+        with override_settings(CACHES={
+            'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+        }):
+            user_cache_enabled.cache_clear()
+            self.assertFalse(user_cache_enabled())
+    
+    def test_cache_enabled_for_shared_backend(self):
+        """
+        Test that user caching is on for a Redis cache backend.
+        """
+        with override_settings(CACHES={
+            'default': {'BACKEND': 'django_redis.cache.RedisCache'}
+        }):
+            user_cache_enabled.cache_clear()
+            self.assertTrue(user_cache_enabled())
+    
+    def test_deactivated_user_rejected_without_shared_cache(self):
+        """
+        Test that get_user() returns None as soon as the user is deactivated.
+        """
+        self.assertEqual(self.backend.get_user(self.user.pk), self.user)
+        
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        
+        self.assertIsNone(self.backend.get_user(self.user.pk))
+    
+    @mock.patch.object(authentication, 'user_cache_enabled', return_value=True)
+    def test_deactivated_user_rejected_with_shared_cache(self, _enabled):
+        """
+        Test that saving a deactivated user retires its cached entry.
+        """
+        self.assertEqual(self.backend.get_user(self.user.pk), self.user)
+        
+        self.user.is_active = False
+        self.user.save()
+        
+        self.assertIsNone(self.backend.get_user(self.user.pk))
+    
+    @mock.patch.object(authentication, 'user_cache_enabled', return_value=True)
+    def test_password_change_retires_cached_user(self, _enabled):
+        """
+        Test that set_password() followed by save() refreshes the cached hash.
+        """
+        self.backend.get_user(self.user.pk)
+        
+        self.user.set_password('newpass456')
+        self.user.save()
+        
+        cached = self.backend.get_user(self.user.pk)
+        self.assertTrue(cached.check_password('newpass456'))
+    
+    @mock.patch.object(authentication, 'user_cache_enabled', return_value=True)
+    def test_queryset_update_needs_explicit_invalidation(self, _enabled):
+        """
+        Test that invalidate_cached_users() covers writes that skip post_save.
+        """
+        self.backend.get_user(self.user.pk)
+        
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        invalidate_cached_users([self.user.pk])
+        
+        self.assertIsNone(self.backend.get_user(self.user.pk))
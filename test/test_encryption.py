@@ -0,0 +1,121 @@
+"""
+Tests for the field encryption helpers in core.encryption.
+
+Covers the AES-256-GCM (v2:) round trip, the transparent fallback for
+legacy Fernet tokens, is_encrypted() and batch decryption with decrypt_many().
+"""
+
+import base64
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from django.test import SimpleTestCase
+from core.encryption import (
+    AESGCM_NONCE_SIZE,
+    AESGCM_PREFIX,
+    EncryptionManager,
+)
+
+
+class EncryptionManagerTest(SimpleTestCase):
+    """
+    Test case for EncryptionManager encryption and decryption.
+    """
+    
+    def setUp(self):
+        """
+        Set up a legacy Fernet token for the fallback tests.
+        """
+        self.legacy_token = EncryptionManager._get_fernet().encrypt(
+            b'legacy@example.com'
+        ).decode('utf-8')
+    
+    def test_aesgcm_round_trip(self):
+        """
+        Test that encrypt() writes v2: values that decrypt() reads back.
+        """
+        encrypted = EncryptionManager.encrypt('user@example.com')
+        
+        self.assertTrue(encrypted.startswith(AESGCM_PREFIX))
+        self.assertEqual(EncryptionManager.decrypt(encrypted), 'user@example.com')
+    
+    def test_aesgcm_uses_fresh_nonce(self):
+        """
+        Test that encrypting the same value twice gives different ciphertexts.
+        """
+        first = EncryptionManager.encrypt('9876543210')
+        second = EncryptionManager.encrypt('9876543210')
+        
+        self.assertNotEqual(first, second)
+    
+    def test_aesgcm_key_differs_from_fernet_key(self):
+        """
+        Test that v2: values cannot be opened with the raw Fernet key.
+        """
+        encrypted = EncryptionManager.encrypt('user@example.com')
+        payload = base64.urlsafe_b64decode(encrypted[len(AESGCM_PREFIX):])
+        fernet_key = base64.urlsafe_b64decode(EncryptionManager._get_encryption_key())
+        
+        with self.assertRaises(InvalidTag):
+            AESGCM(fernet_key).decrypt(
+                payload[:AESGCM_NONCE_SIZE], payload[AESGCM_NONCE_SIZE:], None
+            )
+    
+    def test_legacy_fernet_fallback(self):
+        """
+        Test that values written with Fernet still decrypt.
+        """
+        self.assertEqual(EncryptionManager.decrypt(self.legacy_token), 'legacy@example.com')
+    
+    def test_tampered_value_returns_none(self):
+        """
+        Test that a corrupted v2: value decrypts to None instead of raising.
+        """
+        encrypted = EncryptionManager.encrypt('user@example.com')
+        tampered = encrypted[:-4] + ('AAAA' if not encrypted.endswith('AAAA') else 'BBBB')
+        
+        self.assertIsNone(EncryptionManager.decrypt(tampered))
+    
+    def test_empty_values(self):
+        """
+        Test that None and empty strings pass through as None.
+        """
+        self.assertIsNone(EncryptionManager.encrypt(''))
+        self.assertIsNone(EncryptionManager.encrypt(None))
+        self.assertIsNone(EncryptionManager.decrypt(''))
+        self.assertIsNone(EncryptionManager.decrypt(None))
+    
+    def test_is_encrypted(self):
+        """
+        Test that is_encrypted() recognises both ciphertext formats only.
+        """
+        self.assertTrue(EncryptionManager.is_encrypted(EncryptionManager.encrypt('secret')))
+        self.assertTrue(EncryptionManager.is_encrypted(self.legacy_token))
+        self.assertFalse(EncryptionManager.is_encrypted('user@example.com'))
+        self.assertFalse(EncryptionManager.is_encrypted(''))
+        self.assertFalse(EncryptionManager.is_encrypted(None))
+    
+    def test_decrypt_many(self):
+        """
+        Test that decrypt_many() handles mixed formats, blanks and bad values in order.
+        """
+        values = [
+            EncryptionManager.encrypt('first@example.com'),
+            None,
+            self.legacy_token,
+            '',
+            AESGCM_PREFIX + 'not-valid-ciphertext',
+            EncryptionManager.encrypt('last@example.com'),
+        ]
+        
+        with self.assertLogs('food_ordering.security', level='ERROR'):
+            results = EncryptionManager.decrypt_many(values)
+        
+        self.assertEqual(results, [
+            'first@example.com',
+            None,
+            'legacy@example.com',
+            None,
+            None,
+            'last@example.com',
+        ])
@@ -34,7 +34,7 @@ def verify_encryption_complete():
         
         # Check if encrypted data has proper format
         if user_profile._full_name_encrypted:
-            is_properly_encrypted = user_profile._full_name_encrypted.startswith('gAAAAAB')
+            is_properly_encrypted = EncryptionManager.is_encrypted(user_profile._full_name_encrypted)
             print(f'  Encrypted name format: {"✅ CORRECT" if is_properly_encrypted else "❌ INCORRECT"}')
         else:
             print(f'  Encrypted name: No data')
@@ -49,7 +49,7 @@ def verify_encryption_complete():
         print(f'  Email (decrypted): {restaurant.email}')
         
         if restaurant._address_encrypted:
-            is_properly_encrypted = restaurant._address_encrypted.startswith('gAAAAAB')
+            is_properly_encrypted = EncryptionManager.is_encrypted(restaurant._address_encrypted)
             print(f'  Encrypted address format: {"✅ CORRECT" if is_properly_encrypted else "❌ INCORRECT"}')
         else:
             print(f'  Encrypted address: No data')